@@ -1,16 +1,235 @@
-from typing import Annotated
+import hmac
+import json
+import os
+import time
+from contextlib import asynccontextmanager
+from typing import Annotated, AsyncIterator, List, Union
 
-from fastapi import FastAPI, Query, HTTPException
+from fastapi import FastAPI, Header, Query, HTTPException, Request, Response
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel, Field
 
-from LettersGame.CountdownSolver import solve_countdown, check_answer
-from LettersGame.CreateDict import load_dict
+from LettersGame.AnswerTable import AnswerTable
+from LettersGame.CountdownSolver import check_answer
+from LettersGame.DictionaryStore import DictionaryStore, LoadedDictionary
+from LettersGame.Engines import DEFAULT_ENGINE, SCAN_COUNTING_ENGINES
+from LettersGame.GameSessions import GameSessions
+from LettersGame.Metrics import (
+    CONTENT_TYPE,
+    Counter,
+    Gauge,
+    HotKeys,
+    Metric,
+    MetricsRegistry,
+    stats_metrics
+)
+from LettersGame.ResultCache import ResultCache, canonical_rack
+from LettersGame.SolverExecutor import ExecutorBusy, SolverExecutor
 
-app = FastAPI()
+# the start of the import-to-ready time reported by /health/ready/
+import_started = time.perf_counter()
 
-dict_path = "LettersGame/dict.json"
-dict = load_dict(dict_path)
-if dict is None:
-    raise RuntimeError("Failed to load the dictionary")
+# the most racks accepted by one request to /answers/batch/
+MAX_BATCH_RACKS = 1000
+
+# answers are cached by canonical rack, so anagrams of a rack share an entry
+cache_ttl = os.environ.get("LETTERS_CACHE_TTL")
+cache = ResultCache(
+    max_size=int(os.environ.get("LETTERS_CACHE_SIZE", "1024")),
+    ttl=float(cache_ttl) if cache_ttl else None
+)
+
+# the dictionary can be reloaded while serving, see /admin/reload/,
+# each request answers from the version that was current when it started
+# and reports it in the DICTIONARY_VERSION_HEADER of its response,
+# the solver engine is chosen per deployment, see LettersGame.Engines
+DICTIONARY_VERSION_HEADER = "X-Dictionary-Version"
+dict_path = os.environ.get("LETTERS_DICT_PATH", "LettersGame/dict.json")
+
+# the dictionary is loaded on startup rather than on import, so the server
+# binds quickly, with LETTERS_BACKGROUND_LOAD set it is loaded in the
+# background and requests needing it get a 503 until /health/ready/ is 200
+background_load = os.environ.get("LETTERS_BACKGROUND_LOAD", "") not in (
+    "", "0", "false"
+)
+
+# racks known in advance are served from a table of precomputed answers,
+# see LettersGame.AnswerTable, other racks fall back to the solver,
+# the table is only used while the current dictionary has the version
+# recorded in it, so a table built from another dictionary is never served
+answer_table_path = os.environ.get("LETTERS_ANSWER_TABLE")
+answer_table = AnswerTable(answer_table_path) if answer_table_path else None
+
+# the seconds from import to the first dictionary being ready
+ready_seconds = None
+
+# a rack played by many players is registered once as a game session,
+# see /sessions/, and each guess is checked against its answers
+session_ttl = os.environ.get("LETTERS_SESSION_TTL", "3600")
+sessions = GameSessions(
+    max_sessions=int(os.environ.get("LETTERS_MAX_SESSIONS", "10000")),
+    ttl=float(session_ttl) if session_ttl else None
+)
+
+# reloading is only allowed with this token, in the X-Admin-Token header
+admin_token = os.environ.get("LETTERS_ADMIN_TOKEN")
+
+# the metrics served as Prometheus text at /metrics, counted in process,
+# request counts and latencies are by route rather than by path, so each
+# session does not get series of its own
+metrics = MetricsRegistry()
+http_requests = metrics.counter(
+    "letters_http_requests_total",
+    "Requests served, by method, route and status",
+    ("method", "endpoint", "status")
+)
+http_latency = metrics.histogram(
+    "letters_http_request_duration_seconds",
+    "Seconds from a request arriving to the start of its response",
+    ("method", "endpoint")
+)
+stage_latency = metrics.histogram(
+    "letters_stage_duration_seconds",
+    "Seconds spent in each stage of answering, "
+    "including waiting for the executor",
+    ("stage",)
+)
+racks_answered = metrics.counter(
+    "letters_racks_total",
+    "Racks answered, by where the answers came from",
+    ("source",)
+)
+answers_per_rack = metrics.histogram(
+    "letters_solver_answers",
+    "Words found for each rack solved",
+    buckets=(0, 1, 5, 10, 25, 50, 100, 250, 500, 1000)
+)
+# only served by collect_metrics for engines which count their scans,
+# see Engines.SCAN_COUNTING_ENGINES, rather than as zeros for the rest
+records_visited = Counter(
+    "letters_solver_records_visited_total",
+    "Dictionary records scanned by the solver"
+)
+records_matched = Counter(
+    "letters_solver_records_matched_total",
+    "Dictionary records scanned that could be made from the rack"
+)
+dictionary_records = metrics.gauge(
+    "letters_dictionary_records", "Records in the current dictionary"
+)
+dictionary_bytes = metrics.gauge(
+    "letters_dictionary_bytes", "Size on disk of the current dictionary"
+)
+dictionary_info = metrics.gauge(
+    "letters_dictionary_info",
+    "The version and engine of the current dictionary",
+    ("version", "engine")
+)
+
+# the most requested racks are counted in bounded memory, and the
+# HOT_RACKS_SHOWN most requested reported at /metrics
+hot_racks = HotKeys(max_keys=int(os.environ.get("LETTERS_HOT_RACKS", "1000")))
+HOT_RACKS_SHOWN = 20
+
+
+def dictionary_swapped(loaded: LoadedDictionary) -> None:
+    """
+    Called each time a dictionary is swapped in, invalidating the answers
+    cached from the previous one, the first marks the server ready
+
+    Args:
+        loaded (LoadedDictionary): The new dictionary.
+    """
+    global ready_seconds
+    cache.invalidate()
+    executor.use_dictionary(loaded)
+    dictionary_records.set(sum(
+        len(bucket)
+        for row in loaded.dictionary.values()
+        for bucket in row.values()
+    ))
+    dictionary_bytes.set(path_size(loaded.path))
+    dictionary_info.clear()
+    dictionary_info.set(1, version=loaded.version, engine=engine)
+    if ready_seconds is None:
+        ready_seconds = time.perf_counter() - import_started
+
+
+# solver work runs on a dedicated executor rather than on the event loop,
+# full solves on LETTERS_SOLVER_PROCESSES worker processes if set, and past
+# LETTERS_MAX_QUEUE jobs in flight requests are refused with a 503,
+# the health endpoints never wait on it
+engine = os.environ.get("LETTERS_ENGINE", DEFAULT_ENGINE)
+executor = SolverExecutor(
+    threads=int(os.environ.get("LETTERS_SOLVER_THREADS", "4")),
+    processes=int(os.environ.get("LETTERS_SOLVER_PROCESSES", "0")),
+    max_queue=int(os.environ.get("LETTERS_MAX_QUEUE", "64")),
+    engine=engine
+)
+
+store = DictionaryStore(engine=engine, on_swap=dictionary_swapped)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Loads the dictionary when the server starts,
+    in the background if LETTERS_BACKGROUND_LOAD is set
+
+    Raises:
+        RuntimeError: If the dictionary could not be loaded,
+                      when not loading in the background.
+    """
+    if background_load:
+        store.reload(dict_path)
+    else:
+        store.load(dict_path)
+    yield
+    executor.shutdown()
+
+
+app = FastAPI(lifespan=lifespan)
+
+
+@app.exception_handler(ExecutorBusy)
+async def executor_busy_handler(request, exc: ExecutorBusy):
+    """
+    Refuses a request when the solver executor is full
+
+    Returns:
+        JSONResponse: a 503 with the depth of the executor's queue
+    """
+    return JSONResponse(
+        status_code=503,
+        content={
+            "detail": "the server is busy, try again later",
+            "queue_depth": exc.queue_depth,
+        },
+        headers={"Retry-After": "1"}
+    )
+
+
+@app.middleware("http")
+async def record_request_metrics(request: Request, call_next):
+    """
+    Counts each request and times it to the start of its response,
+    so a streamed response is timed to its first byte
+    """
+    start = time.perf_counter()
+    response = await call_next(request)
+    route = request.scope.get("route")
+    endpoint = route.path if route is not None else "unmatched"
+    http_requests.inc(
+        method=request.method,
+        endpoint=endpoint,
+        status=response.status_code
+    )
+    http_latency.observe(
+        time.perf_counter() - start,
+        method=request.method,
+        endpoint=endpoint
+    )
+    return response
 
 
 @app.get("/")
@@ -18,8 +237,49 @@ async def root():
     return {"message": "This is the root of the letters game server"}
 
 
+@app.get("/health/live/")
+async def liveness():
+    """
+    Reports that the server is up, whether or not the dictionary is loaded
+
+    Returns:
+        dict: {"status": "ok"}
+    """
+    return {"status": "ok"}
+
+
+@app.get("/health/ready/")
+async def readiness(response: Response):
+    """
+    Reports whether the dictionary is loaded and requests can be answered,
+    with a 503 status until it is
+
+    Returns:
+        dict: {
+            "ready": True once the dictionary is loaded,
+            "ready_seconds": the seconds from import to the dictionary
+                             being ready, None until it is,
+            "load_seconds": the seconds the current dictionary took to load,
+            "version": the version of the current dictionary,
+            "last_error": why the last load failed, None if it did not
+        }
+    """
+    status = store.status()
+    ready = store.current is not None
+    if not ready:
+        response.status_code = 503
+    return {
+        "ready": ready,
+        "ready_seconds": ready_seconds,
+        "load_seconds": status["load_seconds"],
+        "version": status["version"],
+        "last_error": status["last_error"],
+    }
+
+
 @app.get("/answers/get/")
-def get_answers(
+async def get_answers(
+    response: Response,
     letters: Annotated[
         str,
         Query(
@@ -29,7 +289,19 @@ def get_answers(
             min_length=9,
             max_length=9
         )
-    ]
+    ],
+    definitions: Annotated[
+        bool,
+        Query(description="Include the definitions of the words")
+    ] = True,
+    limit: Annotated[
+        Union[int, None],
+        Query(description="Only return this many of the longest words", ge=1)
+    ] = None,
+    min_length: Annotated[
+        int,
+        Query(description="Only return words at least this long", ge=2, le=9)
+    ] = 2
 ):
     """
     Gets all the words in the dataset that can be formed
@@ -40,23 +312,389 @@ def get_answers(
                         Can be upper or lower case",
                         min_length=9,
                         max_length=9.
+        definitions (bool): Include the definitions of the words,
+                            leaving them out shrinks the response.
+        limit (int | None): Only return this many of the longest words,
+                            the solver stops once it has found them.
+        min_length (int): Only return words at least this long.
 
     Returns:
         dict:
             {
                 "word": "the word",
-                "definition": "the definition",
+                "definition": "the definition", if definitions is True
                 "count": the length of the word,
             }
     """
+    letters = canonical_rack(preprocess_str_inp(letters))
+    loaded = current_dictionary(response)
+    answers = await solve_racks(
+        loaded, [letters], definitions, limit, min_length
+    )
+    return list(answers[letters])
+
+
+@app.get("/answers/stream/")
+async def stream_answers(
+    letters: Annotated[
+        str,
+        Query(
+            description="\
+                The 9 letters you want to make words from. \
+                    Can be upper or lower case",
+            min_length=9,
+            max_length=9
+        )
+    ],
+    definitions: Annotated[
+        bool,
+        Query(description="Include the definitions of the words")
+    ] = True,
+    min_length: Annotated[
+        int,
+        Query(description="Only return words at least this long", ge=2, le=9)
+    ] = 2
+):
+    """
+    Streams the words in the dataset that can be formed
+    from a subset of the letters in "letters", as they are found
+
+    The words are not cached and come in the order the solver engine
+    finds them, longest first for the signature engine. They are found
+    on the solver executor, the stream holding its place in the queue
+    until it ends, so with the executor full the request gets a 503.
+
+    Args:
+        letters (str): "The 9 letters you want to make words from.
+                        Can be upper or lower case",
+                        min_length=9,
+                        max_length=9.
+        definitions (bool): Include the definitions of the words.
+        min_length (int): Only return words at least this long.
+
+    Returns:
+        StreamingResponse: newline delimited JSON, a line per word
+            {
+                "word": "the word",
+                "definition": "the definition", if definitions is True
+                "length": the length of the word,
+            }
+    """
     letters = preprocess_str_inp(letters)
-    results = solve_countdown(letters, dict)
-    results.sort(key=lambda x: x["length"], reverse=True)
-    return results
+    loaded = ready_dictionary()
+    hot_racks.add(canonical_rack(letters))
+    results = executor.iterate(loaded.solver.stream(
+        letters, include_definitions=definitions, min_length=min_length
+    ))
+    # the first word is found before responding, so a full executor
+    # refuses the request with a 503 rather than cutting the stream short
+    try:
+        first = [await results.__anext__()]
+    except StopAsyncIteration:
+        first = []
+    return StreamingResponse(
+        ndjson_lines(first, results),
+        media_type="application/x-ndjson",
+        headers={DICTIONARY_VERSION_HEADER: loaded.version}
+    )
+
+
+async def ndjson_lines(
+    first: List[dict],
+    results: AsyncIterator[dict]
+) -> AsyncIterator[str]:
+    """
+    Yields results as newline delimited JSON, closing results once done
+    or when the client disconnects, so a stream cut short leaves the
+    executor's queue rather than holding its place
+
+    Args:
+        first (List[dict]): The results already taken from results.
+        results (AsyncIterator[dict]): The rest of the results,
+                                       see SolverExecutor.iterate.
+
+    Yields:
+        str: a line of JSON per result
+    """
+    try:
+        for result in first:
+            yield json.dumps(result) + "\n"
+        async for result in results:
+            yield json.dumps(result) + "\n"
+    finally:
+        await results.aclose()
+
+
+class BatchRequest(BaseModel):
+    racks: List[Annotated[str, Field(min_length=9, max_length=9)]] = Field(
+        description="The racks of 9 letters to solve, upper or lower case",
+        min_length=1,
+        max_length=MAX_BATCH_RACKS
+    )
+    definitions: bool = Field(
+        True, description="Include the definitions of the words"
+    )
+    limit: Union[int, None] = Field(
+        None, description="Only return this many of the longest words", ge=1
+    )
+    min_length: int = Field(
+        2, description="Only return words at least this long", ge=2, le=9
+    )
+
+
+@app.post("/answers/batch/")
+async def get_batch_answers(request: BatchRequest, response: Response):
+    """
+    Gets the answers to many racks in one request,
+    each solved as by /answers/get/
+
+    Racks which are anagrams of each other are only solved once,
+    and the racks not cached are solved as one job.
+
+    Args:
+        request (BatchRequest): The racks and the options of the query,
+                                at most MAX_BATCH_RACKS racks.
+
+    Returns:
+        dict: {
+            "rack": the answers to the rack, as returned by /answers/get/
+        }
+    """
+    canonical_racks = {
+        rack: canonical_rack(preprocess_str_inp(rack))
+        for rack in request.racks
+    }
+
+    loaded = current_dictionary(response)
+    answers = await solve_racks(
+        loaded,
+        list(dict.fromkeys(canonical_racks.values())),
+        request.definitions,
+        request.limit,
+        request.min_length
+    )
+
+    return {
+        rack: answers[canonical]
+        for rack, canonical in canonical_racks.items()
+    }
+
+
+async def solve_racks(
+    loaded: LoadedDictionary,
+    racks: List[str],
+    definitions: bool,
+    limit: Union[int, None],
+    min_length: int
+) -> dict:
+    """
+    Gets the answers to canonical racks, longest first, from the cache,
+    the table of precomputed answers or the solver, in that order
+
+    Cache hits are served on the event loop, the table is read on the
+    executor's threads and the racks left are solved as one job.
+
+    Args:
+        loaded (LoadedDictionary): The dictionary to answer from.
+        racks (List[str]): The canonical racks, without repeats,
+                           see ResultCache.canonical_rack.
+        definitions (bool): Include the definitions of the words.
+        limit (int | None): Only return this many of the longest words.
+        min_length (int): Only return words at least this long.
+
+    Raises:
+        ExecutorBusy: If the executor is full.
+
+    Returns:
+        dict: {
+            "rack": the answers to the rack, shared with the cache
+                    so not to be changed
+        }
+    """
+    # keyed by version too, so a request finishing on the old dictionary
+    # after a reload does not cache its answers for the new one
+    def cache_key(letters: str) -> tuple:
+        return (loaded.version, letters, definitions, limit, min_length)
+
+    missing = object()
+    answers = {}
+    with stage_latency.time(stage="cache"):
+        for letters in racks:
+            hot_racks.add(letters)
+            results = cache.get(cache_key(letters), missing)
+            if results is not missing:
+                answers[letters] = results
+    unsolved = [letters for letters in racks if letters not in answers]
+    racks_answered.inc(len(answers), source="cache")
+
+    solved = {}
+    if (
+        unsolved
+        and answer_table is not None
+        and loaded.version == answer_table.version
+    ):
+        with stage_latency.time(stage="table"):
+            tabled = await executor.run(
+                lambda: [
+                    answer_table.get(
+                        letters,
+                        include_definitions=definitions,
+                        limit=limit,
+                        min_length=min_length
+                    )
+                    for letters in unsolved
+                ]
+            )
+        for letters, results in zip(unsolved, tabled):
+            if results is not None:
+                solved[letters] = results
+        racks_answered.inc(len(solved), source="table")
+        unsolved = [letters for letters in unsolved if letters not in solved]
+
+    if unsolved:
+        # filled in by the one job solving the racks,
+        # so only read once it is done
+        scan_counts = {}
+        with stage_latency.time(stage="solve"):
+            results = await executor.solve(
+                loaded, unsolved, definitions, limit, min_length, scan_counts
+            )
+        for letters, rack_results in zip(unsolved, results):
+            rack_results.sort(key=lambda x: x["length"], reverse=True)
+            solved[letters] = rack_results
+            answers_per_rack.observe(len(rack_results))
+        racks_answered.inc(len(unsolved), source="solver")
+        records_visited.inc(scan_counts.get("visited", 0))
+        records_matched.inc(scan_counts.get("matched", 0))
+
+    for letters, results in solved.items():
+        cache.put(cache_key(letters), results)
+    answers.update(solved)
+    return answers
+
+
+def current_dictionary(response: Response) -> LoadedDictionary:
+    """
+    Gets the current dictionary for a request to answer from,
+    reporting its version in the response headers
+
+    Args:
+        response (Response): The response to the request.
+
+    Raises:
+        HTTPException: 503 if the dictionary is not loaded yet.
+
+    Returns:
+        LoadedDictionary: The current dictionary.
+    """
+    loaded = ready_dictionary()
+    response.headers[DICTIONARY_VERSION_HEADER] = loaded.version
+    return loaded
+
+
+def ready_dictionary() -> LoadedDictionary:
+    """
+    Gets the current dictionary,
+    raising a HTTPException if it is not loaded yet
+
+    Raises:
+        HTTPException: terminates the request with a 503
+                       until the dictionary is loaded
+
+    Returns:
+        LoadedDictionary: The current dictionary.
+    """
+    loaded = store.current
+    if loaded is None:
+        raise HTTPException(
+            status_code=503,
+            detail="the dictionary is still loading"
+        )
+    return loaded
+
+
+@app.get("/cache/stats/")
+async def cache_stats():
+    """
+    Gets the counters of the answers cache
+
+    Returns:
+        dict: The size, max_size, hits, misses and evictions of the cache,
+              see LettersGame.ResultCache.
+    """
+    return cache.stats()
+
+
+@app.get("/executor/stats/")
+async def executor_stats():
+    """
+    Gets the counters of the solver executor
+
+    Returns:
+        dict: The queue_depth, max_queue, completed, failed and rejected jobs,
+              threads and processes of the executor,
+              see LettersGame.SolverExecutor.
+    """
+    return executor.stats()
+
+
+class ReloadRequest(BaseModel):
+    path: Union[str, None] = Field(
+        None,
+        description="The path to the new dictionary, \
+            the current path if left out"
+    )
+
+
+@app.post("/admin/reload/", status_code=202)
+def reload_dictionary(
+    x_admin_token: Annotated[Union[str, None], Header()] = None,
+    request: Union[ReloadRequest, None] = None
+):
+    """
+    Loads a new dictionary in the background and swaps it in once loaded,
+    requests in flight finish on the dictionary they started on
+
+    Args:
+        x_admin_token (str | None): Must match LETTERS_ADMIN_TOKEN.
+        request (ReloadRequest | None): The path to the new dictionary.
+
+    Raises:
+        HTTPException: 403 if reloading is not allowed with that token,
+                       409 if a reload is already in progress.
+
+    Returns:
+        dict: The status of the dictionary, see /admin/dictionary/.
+    """
+    validate_admin_token(x_admin_token)
+    if request and request.path:
+        path = request.path
+    else:
+        path = store.current.path if store.current else dict_path
+    if not store.reload(path):
+        raise HTTPException(
+            status_code=409,
+            detail="a reload is already in progress"
+        )
+    return store.status()
+
+
+@app.get("/admin/dictionary/")
+async def dictionary_status():
+    """
+    Gets the status of the dictionary
+
+    Returns:
+        dict: The path and version of the current dictionary,
+              the time it took to load, whether a reload is in progress
+              and why the last reload failed, see DictionaryStore.status.
+    """
+    return store.status()
 
 
 @app.get("/answers/check/")
-def check_answer_endpoint(
+async def check_answer_endpoint(
+    response: Response,
     letters: Annotated[
         str,
         Query(
@@ -74,7 +712,11 @@ def check_answer_endpoint(
             min_length=3,
             max_length=9
         )
-    ]
+    ],
+    definitions: Annotated[
+        bool,
+        Query(description="Include the definitions of the word")
+    ] = True
 ):
     """
     checks if the word if a valid answer to the letters game
@@ -88,22 +730,227 @@ def check_answer_endpoint(
         word (str): The word to check,
                     min_length=3,
                     max_length=9.
+        definitions (bool): Include the definitions of the word.
 
     Returns:
         dict: {
             "correct": (bool) True if the word exists and
                                 contains only letters in "letters",
             "definitions": (List[str]) The definitions of the word,
-                                        empty list if word invalid
+                                        empty list if word invalid,
+                                        left out if definitions is False
         }
     """
     letters = preprocess_str_inp(letters)
     word = preprocess_str_inp(word)
 
-    return check_answer(
-        letters=letters,
-        word=word,
-        search_dict=dict
+    loaded = current_dictionary(response)
+    # most guesses are not words, the Bloom filter of the dictionary
+    # rejects them here without reading it or waiting on the executor
+    if loaded.bloom_filter is not None:
+        with stage_latency.time(stage="bloom"):
+            rejected = word not in loaded.bloom_filter
+        if rejected:
+            return (
+                {"correct": False, "definitions": []}
+                if definitions else {"correct": False}
+            )
+    with stage_latency.time(stage="check"):
+        return await executor.run(
+            lambda: check_answer(
+                letters=letters,
+                word=word,
+                search_dict=loaded.dictionary,
+                include_definitions=definitions,
+                word_index=loaded.word_index
+            )
+        )
+
+
+class SessionRequest(BaseModel):
+    letters: str = Field(
+        description="The 9 letters of the game, upper or lower case",
+        min_length=9,
+        max_length=9
+    )
+
+
+@app.post("/sessions/", status_code=201)
+async def create_session(request: SessionRequest, response: Response):
+    """
+    Registers the letters of a game, solving them once,
+    so guesses can be checked with /sessions/{session_id}/check/
+
+    Sessions unused for LETTERS_SESSION_TTL seconds expire, and past
+    LETTERS_MAX_SESSIONS the least recently used session is dropped.
+
+    Args:
+        request (SessionRequest): The letters of the game.
+
+    Returns:
+        dict: {
+            "session_id": the id of the session,
+            "letters": the letters of the game, lowercase
+        }
+    """
+    letters = preprocess_str_inp(request.letters)
+    loaded = current_dictionary(response)
+    canonical = canonical_rack(letters)
+    answers = await solve_racks(loaded, [canonical], False, None, 2)
+    with stage_latency.time(stage="session"):
+        session_id = await executor.run(
+            sessions.create,
+            letters,
+            [result["word"] for result in answers[canonical]],
+            loaded.word_index,
+            loaded.version
+        )
+    return {"session_id": session_id, "letters": letters}
+
+
+@app.get("/sessions/{session_id}/check/")
+async def check_session_answer(
+    session_id: str,
+    response: Response,
+    word: Annotated[
+        str,
+        Query(
+            description="The word to check",
+            min_length=3,
+            max_length=9
+        )
+    ],
+    definitions: Annotated[
+        bool,
+        Query(description="Include the definitions of the word")
+    ] = True
+):
+    """
+    checks if the word is a valid answer to the letters of a game session,
+    as /answers/check/ does, from the answers found when it was created
+
+    Args:
+        session_id (str): The id returned by /sessions/.
+        word (str): The word to check,
+                    min_length=3,
+                    max_length=9.
+        definitions (bool): Include the definitions of the word.
+
+    Raises:
+        HTTPException: 404 if there is no such session or it has expired.
+
+    Returns:
+        dict: {
+            "correct": (bool) True if the word exists and
+                                contains only letters of the session,
+            "definitions": (List[str]) The definitions of the word,
+                                        empty list if word invalid,
+                                        left out if definitions is False
+        }
+    """
+    word = preprocess_str_inp(word)
+    session = sessions.get(session_id)
+    if session is None:
+        raise HTTPException(
+            status_code=404,
+            detail="session not found or expired"
+        )
+    response.headers[DICTIONARY_VERSION_HEADER] = session.version
+    return session.check(word, include_definitions=definitions)
+
+
+@app.get("/sessions/stats/")
+async def session_stats():
+    """
+    Gets the counters of the game sessions
+
+    Returns:
+        dict: The size, max_size, hits, misses and evictions
+              of the sessions, see LettersGame.GameSessions.
+    """
+    return sessions.stats()
+
+
+# /metrics rather than /metrics/, the path scrapers expect by default
+@app.get("/metrics")
+async def metrics_endpoint():
+    """
+    Gets the metrics of the server in the Prometheus text format:
+    requests and their latency by route, the time spent in each stage of
+    answering, the records scanned by the solver, the most requested racks,
+    the cache, executor and session counters and the size and load time
+    of the dictionary
+
+    Returns:
+        Response: the metrics, as text/plain
+    """
+    return Response(metrics.render(), media_type=CONTENT_TYPE)
+
+
+def collect_metrics() -> List[Metric]:
+    """
+    Reads the counters kept outside the registry each time /metrics is read
+
+    Returns:
+        List[Metric]: the metrics of the cache, executor, sessions,
+                      dictionary, the most requested racks and the
+                      records scanned by the solver
+    """
+    status = store.status()
+    hot = Gauge(
+        "letters_hot_rack_requests",
+        f"Requests for the {HOT_RACKS_SHOWN} most requested racks, "
+        "may be over counted",
+        ("rack",)
+    )
+    for rack, count in hot_racks.top(HOT_RACKS_SHOWN):
+        hot.set(count, rack=rack)
+    scans = (
+        [records_visited, records_matched]
+        if store.engine in SCAN_COUNTING_ENGINES else []
+    )
+    return [
+        *stats_metrics(
+            "letters_cache", "Answers cache", cache.stats(),
+            counters=("hits", "misses", "evictions")
+        ),
+        *stats_metrics(
+            "letters_executor", "Solver executor", executor.stats(),
+            counters=("completed", "failed", "rejected")
+        ),
+        *stats_metrics(
+            "letters_sessions", "Game sessions", sessions.stats(),
+            counters=("hits", "misses", "evictions")
+        ),
+        *stats_metrics("letters_dictionary", "Dictionary", {
+            "load_seconds": status["load_seconds"],
+            "ready_seconds": ready_seconds,
+            "bloom_filter_bytes": status["bloom_filter_bytes"],
+            "reloading": status["reloading"],
+        }),
+        hot,
+        *scans,
+    ]
+
+
+metrics.add_collector(collect_metrics)
+
+
+def path_size(path: str) -> int:
+    """
+    Gets the size of a dictionary file,
+    or of the files of a compiled dictionary directory
+
+    Args:
+        path (str): The path to the dictionary.
+
+    Returns:
+        int: The size in bytes.
+    """
+    if not os.path.isdir(path):
+        return os.path.getsize(path)
+    return sum(
+        entry.stat().st_size for entry in os.scandir(path) if entry.is_file()
     )
 
 
@@ -122,9 +969,30 @@ def preprocess_str_inp(s: str) -> str:
     return s.lower()
 
 
+def validate_admin_token(token: Union[str, None]) -> None:
+    """
+    Asserts an admin token matches LETTERS_ADMIN_TOKEN,
+    raising a HTTPException if not or if no token is set
+
+    Args:
+        token (str | None): The token sent by the client
+
+    Raises:
+        HTTPException: terminates the request and
+                       informs the client of their error
+    """
+    if admin_token is None or token is None or not hmac.compare_digest(
+        token, admin_token
+    ):
+        raise HTTPException(
+            status_code=403,
+            detail="admin token missing or invalid"
+        )
+
+
 def validate_input_is_char_str(s: str) -> None:
     """
-    Asserts a string contains only letters,
+    Asserts a string contains only the letters a to z, in either case,
     raising a HTTPException if not
 
     Args:
@@ -134,8 +1002,8 @@ def validate_input_is_char_str(s: str) -> None:
         HTTPException: terminates the request and
                        informs the client of their error
     """
-    if not s.isalpha():
+    if not s.isalpha() or not s.isascii():
         raise HTTPException(
             status_code=400,
-            detail="letters must contain letters only"
+            detail="letters must contain the letters a to z only"
         )
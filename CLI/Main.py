@@ -1,10 +1,16 @@
-from LettersGame.CreateDict import create_dict, load_dict
+from LettersGame.AnswerTable import build_answer_table, read_racks
+from LettersGame.CreateDict import create_dict, create_word_index, load_dict
+from LettersGame.DictionaryStore import dictionary_version
 from LettersGame.CountdownSolver import (
+    iter_countdown,
     solve_countdown,
     output_words,
+    output_words_stream,
     check_answer
 )
-from typing import Union, List
+from LettersGame.Engines import create_engine
+from typing import Callable, Tuple, Union, List
+import argparse
 import random
 
 VOWLS = "aeiou"
@@ -17,50 +23,117 @@ def main(args: list):
 
     Args:
         args (list): List of command-line arguments.
+                     --limit N only shows the N longest words
+                     --min-length N only shows words at least N letters long
 
     Returns:
         None
     """
-    if len(args) != 1:
-        print("Usage: python main.py")
+    options = parse_args(args[1:])
+    if options is None:
+        print("Usage: python main.py [--limit N] [--min-length N]")
         return
 
+    # the dictionary loaded, the version of the file it was loaded from
+    # and the solver of --limit, built once for each dictionary loaded
+    loaded = {"dictionary": None, "version": None, "limit_solver": None}
     choice = 0
-    search_dictionary = None
 
-    while choice != -1:
+    while choice != "-1":
         print("What would you like to do?")
         print("1. create dict")
         print("2. Load dict")
         print("3. Solve Countdown")
+        print("5. Precompute answers")
         print("-1. Exit")
 
         choice = input("Enter your choice: ")
 
-        if choice == "1":
-            search_dictionary = command_create_dict()
-        elif choice == "2":
-            search_dictionary = command_load_dict()
-        elif choice == "3" and search_dictionary is not None:
-            command_solve_countdown(search_dictionary)
-        elif choice == "4" and search_dictionary is not None:
-            command_play_game(search_dictionary)
-        elif choice == "-1":
-            break
-        elif choice == "3" or choice == "4":
+        if choice in ("1", "2"):
+            load = command_create_dict if choice == "1" else command_load_dict
+            dictionary, version = load()
+            loaded = {
+                "dictionary": dictionary,
+                "version": version,
+                "limit_solver": None
+            }
+        elif choice in ("3", "4", "5") and loaded["dictionary"] is None:
             print("You must load a dictionary first")
-        else:
+        elif choice in ("3", "4", "5"):
+            run_dictionary_command(choice, loaded, options)
+        elif choice != "-1":
             print("Invalid choice")
 
 
-def command_create_dict() -> Union[dict, None]:
+def run_dictionary_command(
+    choice: str,
+    loaded: dict,
+    options: argparse.Namespace
+) -> None:
+    """
+    Run a choice of the menu which needs a dictionary loaded.
+
+    Args:
+        choice (str): "3" to solve, "4" to play or "5" to precompute answers.
+        loaded (dict): The dictionary loaded, the version of its file and
+                       the solver of --limit, which is built if needed.
+        options (argparse.Namespace): The command-line options.
+    """
+    search_dictionary = loaded["dictionary"]
+    if choice == "3":
+        if options.limit is not None and loaded["limit_solver"] is None:
+            loaded["limit_solver"] = create_engine(
+                search_dictionary, "signature"
+            )
+        command_solve_countdown(
+            search_dictionary,
+            limit=options.limit,
+            min_length=options.min_length,
+            solver=loaded["limit_solver"]
+        )
+    elif choice == "4":
+        command_play_game(search_dictionary)
+    else:
+        command_precompute_answers(search_dictionary, loaded["version"])
+
+
+def parse_args(args: List[str]) -> Union[argparse.Namespace, None]:
+    """
+    Parse the command-line options.
+
+    Args:
+        args (List[str]): The command-line arguments after the program name.
+
+    Returns:
+        argparse.Namespace | None: The options, None if they are invalid.
+    """
+    parser = argparse.ArgumentParser(add_help=False, exit_on_error=False)
+    parser.add_argument("--limit", type=int, default=None)
+    parser.add_argument("--min-length", type=int, default=2)
+
+    try:
+        options, unknown = parser.parse_known_args(args)
+    except argparse.ArgumentError:
+        return None
+    if (
+        unknown or
+        (options.limit is not None and options.limit < 1) or
+        options.min_length < 2
+    ):
+        return None
+    return options
+
+
+def command_create_dict() -> Tuple[Union[dict, None], Union[str, None]]:
     """
     Create a dictionary and store it in a file from files given by the user.
 
     Args:
 
     Returns:
-        dict | None: The dictionary if created successfully, None otherwise.
+        Tuple[dict | None, str | None]: The dictionary and the version of
+                                        the file it was stored in if created
+                                        successfully, None otherwise.
     """
     data_csv = input(
         "Enter the path to the csv file containing the words: "
@@ -73,20 +146,22 @@ def command_create_dict() -> Union[dict, None]:
 
     if search_dictionary is None:
         print("Error: Failed to create dictionary")
-    else:
-        print("Dictionary created successfully")
+        return None, None
 
-    return search_dictionary
+    print("Dictionary created successfully")
+    return search_dictionary, dictionary_version(dict_json)
 
 
-def command_load_dict() -> Union[dict, None]:
+def command_load_dict() -> Tuple[Union[dict, None], Union[str, None]]:
     """
     Load a dictionary from a json file.
 
     Args:
         None
     Returns:
-        dict | None: The dictionary if loaded successfully, None otherwise.
+        Tuple[dict | None, str | None]: The dictionary and the version of
+                                        its file if loaded successfully,
+                                        None otherwise.
     """
     dict_json = input(
         "Enter the path to the json file to load the dictionary: "
@@ -96,32 +171,89 @@ def command_load_dict() -> Union[dict, None]:
 
     if search_dictionary is None:
         print("Error: Failed to load dictionary")
-    else:
-        print("Dictionary loaded successfully")
+        return None, None
 
-    return search_dictionary
+    print("Dictionary loaded successfully")
+    return search_dictionary, dictionary_version(dict_json)
 
 
-def command_solve_countdown(search_dictionary: dict) -> None:
+def command_solve_countdown(
+    search_dictionary: dict,
+    limit: Union[int, None] = None,
+    min_length: int = 2,
+    solver: Union[Callable[..., List[dict]], None] = None
+) -> None:
     """
     Solve the countdown problem for a given set of letters.
 
+    Without a limit each word is shown as soon as it is found,
+    with a limit the longest words are found by the signature engine,
+    which looks words up longest first and stops at the limit.
+
     Args:
         search_dictionary (dict): The dictionary to use to find words.
+        limit (int | None): Only show this many of the longest words.
+        min_length (int): Only show words at least this long.
+        solver (Callable[..., List[dict]] | None): The signature engine of
+            the dictionary, see Engines.create_engine, built if None.
     """
     letters = manually_enter_letters()
 
     if letters is None:
         return
 
-    valid_words = solve_countdown(letters.lower(), search_dictionary)
+    if limit is None:
+        output_words_stream(iter_countdown(
+            letters.lower(),
+            search_dictionary,
+            min_length=min_length
+        ))
+    else:
+        if solver is None:
+            solver = create_engine(search_dictionary, "signature")
+        valid_words = solver(
+            letters.lower(),
+            limit=limit,
+            min_length=min_length
+        )
+        output_words(valid_words)
+
+    print("Countdown problem solved successfully")
 
-    output_words(valid_words)
 
-    if valid_words is None:
-        print("Error: Failed to solve countdown problem")
-    else:
-        print("Countdown problem solved successfully")
+def command_precompute_answers(
+    search_dictionary: dict,
+    version: str
+) -> None:
+    """
+    Solve every rack in a file given by the user and store the answers
+    in a table the API can serve, see LettersGame.AnswerTable.
+
+    The table records the version of the dictionary file search_dictionary
+    was loaded from, the API only answers from the table while that
+    version is loaded.
+
+    Args:
+        search_dictionary (dict): The dictionary to use to find words.
+        version (str): The version of its file, see
+                       DictionaryStore.dictionary_version.
+    """
+    racks_file = input(
+        "Enter the path to the file of racks, one per line: "
+        )
+    table_file = input(
+        "Enter the path to the file to store the answers: "
+        )
+
+    racks = read_racks(racks_file)
+    if racks is None:
+        print("Error: Failed to read racks")
+        return
+
+    count = build_answer_table(
+        racks, create_engine(search_dictionary), table_file, version=version
+    )
+    print(f"Answers to {count} racks stored successfully")
 
 
 def command_play_game(search_dictionary: dict) -> None:
@@ -136,6 +268,8 @@ def command_play_game(search_dictionary: dict) -> None:
     if letters is None:
         return
 
+    # every guess is looked up by word rather than scanning its bucket
+    word_index = create_word_index(search_dictionary)
     guess = ""
     while guess != "-1":
         print(f"letters: {letters}")
@@ -146,7 +280,9 @@ def command_play_game(search_dictionary: dict) -> None:
             print("Invalid Guess")
             guess = ""
         else:
-            response = check_answer(guess, letters, search_dictionary)
+            response = check_answer(
+                guess, letters, search_dictionary, word_index=word_index
+            )
             if not response["correct"]:
                 print("incorrect")
             else:
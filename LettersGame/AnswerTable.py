@@ -0,0 +1,206 @@
+import json
+import os
+import sqlite3
+from typing import Callable, Iterable, List, Union
+
+from LettersGame.ResultCache import canonical_rack
+
+"""
+A table of precomputed answers, for when the racks are known in advance.
+
+The answers of each rack are solved once, with definitions and every word
+of at least 2 letters, longest first, and stored in an SQLite file indexed
+by the canonical rack (see ResultCache.canonical_rack):
+
+    answers(rack TEXT PRIMARY KEY, results TEXT)
+    meta(key TEXT PRIMARY KEY, value TEXT)
+
+where results is the JSON list of {"word", "definition", "length"} records.
+Queries without definitions, with a limit or a min_length are answered by
+filtering the stored results, so one entry serves every query of a rack.
+
+The version of the dictionary the answers were solved with (see
+DictionaryStore.dictionary_version) is stored in meta under
+"dictionary_version", so a server can tell when the table is out of date.
+"""
+
+VERSION_KEY = "dictionary_version"
+
+
+def read_racks(file_path: str) -> Union[List[str], None]:
+    """
+    Read a file of racks, one per line, skipping blank lines.
+
+    Args:
+        file_path (str): The path to the file of racks.
+
+    Returns:
+        List[str] | None: The canonical racks without repeats, in the order
+                          first seen, None if the file could not be read
+                          or holds a rack which is not all letters.
+    """
+    racks = {}
+    try:
+        with open(file_path, 'r') as file:
+            for line_number, line in enumerate(file, 1):
+                letters = line.strip()
+                if not letters:
+                    continue
+                if not letters.isalpha() or not letters.isascii():
+                    print(
+                        f"Error: line {line_number} of {file_path} "
+                        "must contain letters only"
+                    )
+                    return None
+                racks.setdefault(canonical_rack(letters), None)
+    except FileNotFoundError:
+        print(f"Error: File {file_path} not found")
+        return None
+    except IOError as e:
+        print(f"Error: Unable to read file {file_path}: {e}")
+        return None
+
+    return list(racks)
+
+
+def build_answer_table(
+    racks: Iterable[str],
+    solver: Callable[[str], List[dict]],
+    file_path: str,
+    version: Union[str, None] = None
+) -> int:
+    """
+    Solve every rack and store the answers in a new table at file_path.
+
+    The table is written next to file_path and moved over it once complete,
+    so a server reading the old table never sees a partial one.
+
+    Args:
+        racks (Iterable[str]): The racks to solve.
+        solver (Callable[[str], List[dict]]): Solves a lowercase rack,
+                                              see Engines.create_engine.
+        file_path (str): The path to store the table at.
+        version (str | None): The version of the dictionary the solver
+                              answers from, see AnswerTable.version.
+
+    Returns:
+        int: The number of racks in the table.
+    """
+    temporary_path = file_path + ".tmp"
+    if os.path.exists(temporary_path):
+        os.remove(temporary_path)
+
+    connection = sqlite3.connect(temporary_path)
+    try:
+        connection.execute(
+            "CREATE TABLE answers (rack TEXT PRIMARY KEY, results TEXT)"
+        )
+        connection.execute(
+            "CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT)"
+        )
+        if version is not None:
+            connection.execute(
+                "INSERT INTO meta VALUES (?, ?)", (VERSION_KEY, version)
+            )
+        rows = (
+            (rack, json.dumps(sorted(
+                solver(rack),
+                key=lambda result: result["length"],
+                reverse=True
+            )))
+            for rack in dict.fromkeys(canonical_rack(r) for r in racks)
+        )
+        connection.executemany("INSERT INTO answers VALUES (?, ?)", rows)
+        connection.commit()
+        count = connection.execute("SELECT COUNT(*) FROM answers").fetchone()
+    finally:
+        connection.close()
+
+    os.replace(temporary_path, file_path)
+    return count[0]
+
+
+class AnswerTable:
+    """
+    A read only table of precomputed answers, looked up by rack.
+    """
+
+    def __init__(self, file_path: str):
+        """
+        Open the table at file_path.
+
+        Args:
+            file_path (str): The path to a table made by build_answer_table.
+
+        Raises:
+            sqlite3.Error: If the file is not an answer table.
+        """
+        self.file_path = file_path
+        self._connection = sqlite3.connect(
+            f"file:{file_path}?mode=ro",
+            uri=True,
+            check_same_thread=False
+        )
+        self._count = self._connection.execute(
+            "SELECT COUNT(*) FROM answers"
+        ).fetchone()[0]
+        # the version of the dictionary the answers were solved with,
+        # None if it was not recorded, as in tables built before it was
+        try:
+            row = self._connection.execute(
+                "SELECT value FROM meta WHERE key = ?", (VERSION_KEY,)
+            ).fetchone()
+        except sqlite3.OperationalError:
+            row = None
+        self.version = row[0] if row else None
+
+    def get(
+        self,
+        letters: str,
+        include_definitions: bool = True,
+        limit: Union[int, None] = None,
+        min_length: int = 2
+    ) -> Union[List[dict], None]:
+        """
+        Get the answers of a rack, in any case and order.
+
+        Args:
+            letters (str): The letters of the rack.
+            include_definitions (bool): If False the definitions are
+                                        left out of the results.
+            limit (int | None): Only return this many of the longest words.
+            min_length (int): Only return words at least this long.
+
+        Returns:
+            List[dict] | None: The answers longest first, as returned by the
+                               solvers, None if the rack is not in the table.
+        """
+        row = self._connection.execute(
+            "SELECT results FROM answers WHERE rack = ?",
+            (canonical_rack(letters),)
+        ).fetchone()
+        if row is None:
+            return None
+
+        results = [
+            result for result in json.loads(row[0])
+            if result["length"] >= min_length
+        ]
+        if not include_definitions:
+            for result in results:
+                del result["definition"]
+        return results if limit is None else results[:limit]
+
+    def __contains__(self, letters: str) -> bool:
+        return self._connection.execute(
+            "SELECT 1 FROM answers WHERE rack = ?", (canonical_rack(letters),)
+        ).fetchone() is not None
+
+    def __len__(self) -> int:
+        return self._count
+
+    def close(self) -> None:
+        """
+        Close the table.
+        """
+        self._connection.close()
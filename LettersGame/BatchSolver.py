@@ -0,0 +1,148 @@
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Iterable, Iterator, List, Tuple, Union
+
+from LettersGame.CreateDict import load_dict
+from LettersGame.Engines import DEFAULT_ENGINE, create_engine
+
+"""
+Solves a stream of racks across a pool of worker processes.
+
+Each worker loads the dictionary once, when it starts, from the path it is
+given rather than having it pickled with every task. A binary dictionary is
+memory mapped (see MappedDict), so the workers share its pages through the
+OS page cache. Racks are sent to the workers in chunks, and only a bounded
+number of chunks are in flight at once, so a stream of any length is solved
+in bounded memory, with the results coming back in the order of the racks.
+"""
+
+# the solver of the worker process, set by initialise_worker
+_solver = None
+
+
+def solve_racks(
+    racks: Iterable[str],
+    dict_path: str,
+    engine: str = DEFAULT_ENGINE,
+    workers: Union[int, None] = None,
+    chunk_size: int = 256,
+    include_definitions: bool = True,
+    limit: Union[int, None] = None,
+    min_length: int = 2
+) -> Iterator[Tuple[str, List[dict]]]:
+    """
+    Solve every rack across a pool of worker processes.
+
+    Args:
+        racks (Iterable[str]): The lowercase racks to solve,
+                               read as the workers need them.
+        dict_path (str): The path to the dictionary, loaded by each worker.
+        engine (str): The solver engine, see Engines.ENGINES.
+        workers (int | None): The number of worker processes,
+                              None for one per CPU.
+        chunk_size (int): The number of racks sent to a worker at once.
+        include_definitions (bool): If False the definitions are
+                                    left out of the results.
+        limit (int | None): Only return this many of the longest words.
+        min_length (int): Only return words at least this long.
+
+    Raises:
+        ValueError: If chunk_size is not positive.
+        BrokenProcessPool: If a worker could not load the dictionary.
+
+    Yields:
+        Tuple[str, List[dict]]: Each rack and its answers,
+                                in the order of racks.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+
+    racks = iter(racks)
+    options = (include_definitions, limit, min_length)
+    workers = workers or os.cpu_count() or 1
+    # two chunks per worker keeps every worker busy while
+    # the results of the oldest chunk are being yielded
+    max_pending = 2 * workers
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=initialise_worker,
+        initargs=(dict_path, engine)
+    ) as executor:
+        pending = deque()
+
+        while True:
+            while len(pending) < max_pending:
+                chunk = list(islice(racks, chunk_size))
+                if not chunk:
+                    break
+                pending.append(
+                    (chunk, executor.submit(solve_chunk, chunk, options))
+                )
+
+            if not pending:
+                return
+
+            chunk, future = pending.popleft()
+            yield from zip(chunk, future.result())
+
+
+def initialise_worker(dict_path: str, engine: str) -> None:
+    """
+    Load the dictionary and build the solver of a worker process,
+    the initializer of the worker processes of solve_racks and of
+    SolverExecutor.
+
+    Args:
+        dict_path (str): The path to the dictionary.
+        engine (str): The solver engine, see Engines.ENGINES.
+
+    Raises:
+        RuntimeError: If the dictionary could not be loaded.
+    """
+    global _solver
+    dictionary = load_dict(dict_path, mapped=True)
+    if dictionary is None:
+        raise RuntimeError(f"Failed to load the dictionary {dict_path}")
+    _solver = create_engine(dictionary, engine)
+
+
+def solve_chunk(chunk: List[str], options: tuple) -> List[List[dict]]:
+    """
+    Solve a chunk of racks in a worker process
+    started with initialise_worker.
+
+    Args:
+        chunk (List[str]): The racks to solve.
+        options (tuple): include_definitions, limit and min_length.
+
+    Returns:
+        List[List[dict]]: The answers to each rack.
+    """
+    return [_solver(rack, *options) for rack in chunk]
+
+
+def solve_chunk_counting(
+    chunk: List[str],
+    options: tuple
+) -> Tuple[List[List[dict]], dict]:
+    """
+    Solve a chunk of racks in a worker process started with
+    initialise_worker, counting the records the solver scans.
+
+    Args:
+        chunk (List[str]): The racks to solve.
+        options (tuple): include_definitions, limit and min_length.
+
+    Returns:
+        Tuple[List[List[dict]], dict]: The answers to each rack and the
+                                       scan counts, see
+                                       Engines.create_engine.
+    """
+    scan_counts = {}
+    results = [
+        _solver(rack, *options, scan_counts=scan_counts) for rack in chunk
+    ]
+    return results, scan_counts
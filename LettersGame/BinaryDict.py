@@ -0,0 +1,484 @@
+import string
+import struct
+import sys
+import zlib
+from array import array
+from collections import Counter
+from typing import Callable, Iterator, Union
+
+from LettersGame.CreateDict import (
+    MAX_PACKED_COUNT,
+    get_definitions,
+    initialise_dict,
+    letter_mask
+)
+
+"""
+The binary dictionary format, all integers are little endian:
+
+header:
+    magic (8 bytes) b"CDLGDICT"
+    version (u16), flags (u16)
+    word count (u32), definition count (u32), section count (u32)
+    a directory entry for each section:
+        name (16 bytes, null padded), offset (u64), length (u64)
+
+sections, each starting on an 8 byte boundary:
+    buckets: 677 u32, records of bucket (first, second) are
+             [buckets[first * 26 + second], buckets[first * 26 + second + 1])
+    word_offsets: word count + 1 u32 into the words blob
+    words: the ascii words, concatenated
+    counts: 26 u8 per word, the count of each letter capped at 127
+    masks: 1 u32 per word, the letter mask
+    signatures: a hash table of word ids keyed by count vector,
+                see build_hash_table
+    word_hashes: a hash table of word ids keyed by the ascii word,
+                 files without it are still read
+
+The definitions are kept apart from the word index, in a side file at
+the path of the dictionary plus ".defs", so they are only read for the
+words that need them. It has the same header with magic b"CDLGDEFS" and
+the sections:
+    def_ranges: word count + 1 u32, the definitions of word i are
+                [ranges[i], ranges[i + 1]) in the definition offsets
+    def_offsets: definition count + 1 u64 into the definitions blob
+    definitions: the utf-8 definitions, concatenated
+
+Readers find sections by name, so sections can be added
+without changing the version.
+"""
+
+BINARY_MAGIC = b"CDLGDICT"
+DEFINITIONS_MAGIC = b"CDLGDEFS"
+BINARY_VERSION = 3
+BINARY_EXTENSION = ".bin"
+DEFINITIONS_EXTENSION = ".defs"
+ALPHABET_SIZE = len(string.ascii_lowercase)
+BUCKET_COUNT = ALPHABET_SIZE * ALPHABET_SIZE
+HEADER = struct.Struct("<8sHHIII")
+SECTION_NAME_LENGTH = 16
+SECTION_ENTRY = struct.Struct(f"<{SECTION_NAME_LENGTH}sQQ")
+SECTION_ALIGNMENT = 8
+
+
+def is_binary_dict(file_path: str) -> bool:
+    """
+    Checks if a file is a binary dictionary by reading its magic bytes.
+
+    Args:
+        file_path (str): The path to the file.
+
+    Returns:
+        bool: True if the file starts with BINARY_MAGIC
+    """
+    with open(file_path, 'rb') as file:
+        return file.read(len(BINARY_MAGIC)) == BINARY_MAGIC
+
+
+def store_dict_binary(dictionary: dict, file_path: str) -> None:
+    """
+    Store the dictionary to a file in the binary format.
+
+    Args:
+        dictionary (dict): The dictionary to store.
+        file_path (str): The path to the file to store the dictionary.
+    """
+    buckets = array("I", [0])
+    word_offsets = array("I", [0])
+    words = bytearray()
+    word_keys = []
+    counts = bytearray()
+    masks = array("I")
+    definition_ranges = array("I", [0])
+    definition_offsets = array("Q", [0])
+    definitions = bytearray()
+
+    for first_letter in string.ascii_lowercase:
+        for second_letter in string.ascii_lowercase:
+            records = dictionary.get(first_letter, {}).get(second_letter, [])
+            for record in records:
+                word = record["word"]
+                word_keys.append(word.encode("ascii"))
+                words += word_keys[-1]
+                word_offsets.append(len(words))
+                counts += word_count_vector(word)
+                masks.append(letter_mask(Counter(word)))
+
+                for definition in get_definitions(record):
+                    definitions += definition.encode("utf-8")
+                    definition_offsets.append(len(definitions))
+                definition_ranges.append(len(definition_offsets) - 1)
+            buckets.append(len(masks))
+
+    signatures = build_hash_table([
+        bytes(counts[i * ALPHABET_SIZE:(i + 1) * ALPHABET_SIZE])
+        for i in range(len(masks))
+    ])
+
+    write_sections(file_path, len(masks), len(definition_offsets) - 1, {
+        "buckets": to_little_endian(buckets),
+        "word_offsets": to_little_endian(word_offsets),
+        "words": bytes(words),
+        "counts": bytes(counts),
+        "masks": to_little_endian(masks),
+        "signatures": to_little_endian(signatures),
+        "word_hashes": to_little_endian(build_hash_table(word_keys)),
+    })
+    write_sections(
+        definitions_path(file_path),
+        len(masks),
+        len(definition_offsets) - 1,
+        {
+            "def_ranges": to_little_endian(definition_ranges),
+            "def_offsets": to_little_endian(definition_offsets),
+            "definitions": bytes(definitions),
+        },
+        magic=DEFINITIONS_MAGIC
+    )
+
+
+def definitions_path(file_path: str) -> str:
+    """
+    Get the path of the definitions side file of a binary dictionary.
+
+    Args:
+        file_path (str): The path to the binary dictionary.
+
+    Returns:
+        str: The path to its definitions.
+    """
+    return file_path + DEFINITIONS_EXTENSION
+
+
+def write_sections(
+    file_path: str,
+    word_count: int,
+    definition_count: int,
+    sections: dict,
+    magic: bytes = BINARY_MAGIC
+) -> None:
+    """
+    Write the header, section directory and sections of a binary dictionary.
+
+    Args:
+        file_path (str): The path to write to.
+        word_count (int): The number of words in the dictionary.
+        definition_count (int): The number of definitions in the dictionary.
+        sections (dict): The bytes of each section, keyed by name.
+        magic (bytes): The magic bytes identifying the kind of file.
+    """
+    position = HEADER.size + SECTION_ENTRY.size * len(sections)
+    directory = []
+    for name, section in sections.items():
+        if len(name) > SECTION_NAME_LENGTH:
+            raise ValueError(f"Section name {name} is too long")
+        position += -position % SECTION_ALIGNMENT
+        directory.append(SECTION_ENTRY.pack(
+            name.encode("ascii"), position, len(section)
+        ))
+        position += len(section)
+
+    with open(file_path, 'wb') as file:
+        file.write(HEADER.pack(
+            magic,
+            BINARY_VERSION,
+            0,
+            word_count,
+            definition_count,
+            len(sections)
+        ))
+        for entry in directory:
+            file.write(entry)
+        for section in sections.values():
+            file.write(bytes(-file.tell() % SECTION_ALIGNMENT))
+            file.write(section)
+
+
+def load_dict_binary(
+    file_path: str,
+    include_definitions: bool = True
+) -> dict:
+    """
+    Load a dictionary stored by store_dict_binary into the nested
+    dictionary structure described in CreateDict.
+
+    Records loaded from the binary format carry "letter_mask" and
+    "packed_counts" in place of "letter_counter".
+
+    Args:
+        file_path (str): The path to the binary dictionary.
+        include_definitions (bool): Read the definitions side file,
+                                    if False records have no "definitions".
+
+    Raises:
+        ValueError: If the file is not a binary dictionary of a
+                    supported version.
+
+    Returns:
+        dict: The dictionary loaded from the file.
+    """
+    with open(file_path, 'rb') as file:
+        data = file.read()
+
+    header = read_header(data)
+    buckets = read_array("I", data, header, "buckets")
+    word_offsets = read_array("I", data, header, "word_offsets")
+    masks = read_array("I", data, header, "masks")
+    # ascii, so byte offsets are also character offsets
+    words = section_bytes(data, header, "words").decode("ascii")
+    counts = section_bytes(data, header, "counts")
+
+    if include_definitions:
+        with open(definitions_path(file_path), 'rb') as file:
+            definitions_data = file.read()
+        definitions_header = read_header(definitions_data, DEFINITIONS_MAGIC)
+        definition_ranges = read_array(
+            "I", definitions_data, definitions_header, "def_ranges"
+        )
+        definition_offsets = read_array(
+            "Q", definitions_data, definitions_header, "def_offsets"
+        )
+        definitions = section_bytes(
+            definitions_data, definitions_header, "definitions"
+        )
+
+    dictionary = initialise_dict()
+    for bucket in range(BUCKET_COUNT):
+        records = dictionary[
+            string.ascii_lowercase[bucket // ALPHABET_SIZE]
+        ][
+            string.ascii_lowercase[bucket % ALPHABET_SIZE]
+        ]
+        for i in range(buckets[bucket], buckets[bucket + 1]):
+            word = words[word_offsets[i]:word_offsets[i + 1]]
+            record = {
+                "word": word,
+                "count": len(word),
+                "letter_mask": masks[i],
+                "packed_counts": pack_count_vector(
+                    counts[i * ALPHABET_SIZE:(i + 1) * ALPHABET_SIZE]
+                )
+            }
+            if include_definitions:
+                record["definitions"] = [
+                    definitions[
+                        definition_offsets[definition]:
+                        definition_offsets[definition + 1]
+                    ].decode("utf-8")
+                    for definition in range(
+                        definition_ranges[i], definition_ranges[i + 1]
+                    )
+                ]
+            records.append(record)
+
+    return dictionary
+
+
+def read_header(
+    data: Union[bytes, memoryview],
+    magic: bytes = BINARY_MAGIC
+) -> dict:
+    """
+    Read and validate the header and section directory
+    of a binary dictionary.
+
+    Args:
+        data (bytes | memoryview): The contents of the file.
+        magic (bytes): The magic bytes expected for the kind of file.
+
+    Raises:
+        ValueError: If the magic bytes or version do not match,
+                    or the file is truncated.
+
+    Returns:
+        dict: The version, flags, word and definition counts
+              and the (start, end) of each section by name.
+    """
+    if len(data) < HEADER.size:
+        raise ValueError("File is too short to be a binary dictionary")
+
+    file_magic, version, flags, word_count, definition_count, section_count = \
+        HEADER.unpack_from(data, 0)
+    if file_magic != magic:
+        raise ValueError(f"File is not a {magic.decode('ascii')} file")
+    if version != BINARY_VERSION:
+        raise ValueError(
+            f"Unsupported binary dictionary version {version}, "
+            f"expected {BINARY_VERSION}"
+        )
+
+    sections = {}
+    for i in range(section_count):
+        entry_offset = HEADER.size + i * SECTION_ENTRY.size
+        if entry_offset + SECTION_ENTRY.size > len(data):
+            raise ValueError("Binary dictionary section directory truncated")
+        name, offset, length = SECTION_ENTRY.unpack_from(data, entry_offset)
+        if offset + length > len(data):
+            raise ValueError("Binary dictionary section truncated")
+        sections[name.rstrip(b"\0").decode("ascii")] = (
+            offset, offset + length
+        )
+
+    return {
+        "version": version,
+        "flags": flags,
+        "word_count": word_count,
+        "definition_count": definition_count,
+        "sections": sections
+    }
+
+
+def section_bytes(
+    data: Union[bytes, memoryview],
+    header: dict,
+    name: str
+) -> Union[bytes, memoryview]:
+    """
+    Get the bytes of one section of a binary dictionary.
+
+    Args:
+        data (bytes | memoryview): The contents of the file.
+        header (dict): The header returned by read_header.
+        name (str): The name of the section.
+
+    Raises:
+        ValueError: If the file does not have the section.
+
+    Returns:
+        bytes | memoryview: The section, sliced without copying a memoryview.
+    """
+    if name not in header["sections"]:
+        raise ValueError(f"Binary dictionary has no {name} section")
+    start, end = header["sections"][name]
+    return data[start:end]
+
+
+def word_count_vector(word: str) -> bytes:
+    """
+    Create the fixed width count vector of a word,
+    one byte per letter of the alphabet capped at MAX_PACKED_COUNT.
+
+    Args:
+        word (str): The word.
+
+    Returns:
+        bytes: 26 bytes, the count of each letter
+    """
+    vector = bytearray(ALPHABET_SIZE)
+    for letter in word:
+        index = ord(letter) - ord("a")
+        vector[index] = min(vector[index] + 1, MAX_PACKED_COUNT)
+    return bytes(vector)
+
+
+def pack_count_vector(vector: Union[bytes, memoryview]) -> int:
+    """
+    Convert a fixed width count vector into the packed counts
+    used by the solver, the vector is already laid out as one
+    byte per letter so this is a single conversion.
+
+    Args:
+        vector (bytes | memoryview): 26 bytes, the count of each letter
+
+    Returns:
+        int: The packed counts, see CreateDict.pack_letter_counts
+    """
+    return int.from_bytes(vector, "little")
+
+
+def build_hash_table(keys: list) -> array:
+    """
+    Build an open addressing hash table of the indexes of keys.
+
+    The table has a power of two number of u32 slots, at least twice
+    the number of keys. Each slot holds 0 if empty, otherwise the index
+    of a key plus one. Keys are placed by linear probing from
+    zlib.crc32(key), equal keys are all kept so they can be found by
+    probing until an empty slot.
+
+    Args:
+        keys (list[bytes]): The keys, in index order.
+
+    Returns:
+        array: The slots of the table.
+    """
+    size = 1
+    while size < 2 * len(keys):
+        size *= 2
+    mask = size - 1
+
+    slots = array("I", bytes(4 * size))
+    for index, key in enumerate(keys):
+        slot = zlib.crc32(key) & mask
+        while slots[slot]:
+            slot = (slot + 1) & mask
+        slots[slot] = index + 1
+
+    return slots
+
+
+def hash_table_lookup(
+    slots,
+    key: bytes,
+    matches: Callable[[int], bool]
+) -> Iterator[int]:
+    """
+    Find the indexes stored under a key in a table from build_hash_table.
+
+    Args:
+        slots (array | memoryview): The slots of the table.
+        key (bytes): The key to look up.
+        matches (Callable[[int], bool]): Checks if the key of an index
+                                        equals the key looked up.
+
+    Yields:
+        int: the index of each key equal to key
+    """
+    mask = len(slots) - 1
+    slot = zlib.crc32(key) & mask
+    while slots[slot]:
+        index = slots[slot] - 1
+        if matches(index):
+            yield index
+        slot = (slot + 1) & mask
+
+
+def to_little_endian(values: array) -> bytes:
+    """
+    Get the bytes of an array in little endian order.
+
+    Args:
+        values (array): The array to convert.
+
+    Returns:
+        bytes: The little endian bytes of the array.
+    """
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def read_array(
+    typecode: str,
+    data: Union[bytes, memoryview],
+    header: dict,
+    name: str
+) -> array:
+    """
+    Read a little endian section of a binary dictionary into an array.
+
+    Args:
+        typecode (str): The array typecode of the section.
+        data (bytes | memoryview): The contents of the file.
+        header (dict): The header returned by read_header.
+        name (str): The name of the section.
+
+    Returns:
+        array: The values of the section.
+    """
+    values = array(typecode)
+    values.frombytes(section_bytes(data, header, name))
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
@@ -0,0 +1,227 @@
+import hashlib
+import math
+import os
+import struct
+from typing import Iterable, Union
+
+"""
+A Bloom filter of the words of a dictionary, for rejecting guesses which
+are not words without reading the dictionary.
+
+A word not in the filter is certainly not in the dictionary, a word in the
+filter is in the dictionary except for a false positive rate chosen when
+the filter is built. The filter is sized for that rate, about 1.2 bytes a
+word at 1%, and kept in a side file at the path of the dictionary plus
+".bloom", so it can be loaded on its own:
+
+    magic (8 bytes) b"CDLGBLOM"
+    version (u16), hash count (u16), bit count (u64)
+    dictionary version (16 bytes), ASCII padded with zero bytes
+    the bits, bit i is bit i % 8 of byte i // 8
+
+The dictionary version is that of the dictionary the filter was built from
+(see DictionaryStore.dictionary_version), a filter left next to a rebuilt
+dictionary would reject its new words so is not used. Filters of version 1
+have no dictionary version.
+
+Each word sets hash_count bits, picked by double hashing
+the two halves of its BLAKE2b digest.
+"""
+
+BLOOM_MAGIC = b"CDLGBLOM"
+BLOOM_VERSION = 2
+BLOOM_EXTENSION = ".bloom"
+BLOOM_HEADER = struct.Struct("<8sHHQ")
+DICTIONARY_VERSION_FIELD = struct.Struct("<16s")
+DEFAULT_FALSE_POSITIVE_RATE = 0.01
+
+
+class BloomFilter:
+    """
+    A set of words which can answer "certainly not present"
+    or "probably present".
+    """
+
+    def __init__(
+        self,
+        bit_count: int,
+        hash_count: int,
+        bits: Union[bytearray, None] = None,
+        dictionary_version: Union[str, None] = None
+    ):
+        """
+        Args:
+            bit_count (int): The number of bits in the filter.
+            hash_count (int): The number of bits set for each word.
+            bits (bytearray | None): The bits of the filter, empty if None.
+            dictionary_version (str | None): The version of the dictionary
+                                             the filter is of, if known.
+
+        Raises:
+            ValueError: If bit_count or hash_count is not positive,
+                        or bits is not bit_count bits long.
+        """
+        if bit_count < 1 or hash_count < 1:
+            raise ValueError("bit_count and hash_count must be positive")
+        if bits is None:
+            bits = bytearray((bit_count + 7) // 8)
+        if len(bits) != (bit_count + 7) // 8:
+            raise ValueError("bits does not match bit_count")
+
+        self.bit_count = bit_count
+        self.hash_count = hash_count
+        self.bits = bits
+        self.dictionary_version = dictionary_version
+
+    @classmethod
+    def for_capacity(
+        cls,
+        capacity: int,
+        false_positive_rate: float = DEFAULT_FALSE_POSITIVE_RATE
+    ) -> "BloomFilter":
+        """
+        Create an empty filter sized for capacity words.
+
+        Args:
+            capacity (int): The number of words to be added.
+            false_positive_rate (float): The chance a word not added
+                                         is reported present.
+
+        Raises:
+            ValueError: If false_positive_rate is not between 0 and 1.
+
+        Returns:
+            BloomFilter: The filter.
+        """
+        if not 0 < false_positive_rate < 1:
+            raise ValueError("false_positive_rate must be between 0 and 1")
+
+        capacity = max(capacity, 1)
+        bit_count = math.ceil(
+            -capacity * math.log(false_positive_rate) / math.log(2) ** 2
+        )
+        hash_count = max(1, round(bit_count / capacity * math.log(2)))
+        return cls(bit_count, hash_count)
+
+    def add(self, word: str) -> None:
+        """
+        Args:
+            word (str): The word to add.
+        """
+        for bit in self._bit_positions(word):
+            self.bits[bit >> 3] |= 1 << (bit & 7)
+
+    def update(self, words: Iterable[str]) -> None:
+        """
+        Args:
+            words (Iterable[str]): The words to add.
+        """
+        for word in words:
+            self.add(word)
+
+    def __contains__(self, word: str) -> bool:
+        return all(
+            self.bits[bit >> 3] & (1 << (bit & 7))
+            for bit in self._bit_positions(word)
+        )
+
+    def store(self, file_path: str) -> None:
+        """
+        Store the filter in a file.
+
+        Args:
+            file_path (str): The path to store the filter at.
+
+        Raises:
+            ValueError: If the dictionary version is longer than 16 bytes.
+        """
+        dictionary_version = (self.dictionary_version or "").encode("ascii")
+        if len(dictionary_version) > DICTIONARY_VERSION_FIELD.size:
+            raise ValueError("dictionary_version is too long")
+        with open(file_path, 'wb') as file:
+            file.write(BLOOM_HEADER.pack(
+                BLOOM_MAGIC, BLOOM_VERSION, self.hash_count, self.bit_count
+            ))
+            file.write(DICTIONARY_VERSION_FIELD.pack(dictionary_version))
+            file.write(self.bits)
+
+    @classmethod
+    def load(cls, file_path: str) -> "BloomFilter":
+        """
+        Load a filter stored by store.
+
+        Args:
+            file_path (str): The path to the filter.
+
+        Raises:
+            ValueError: If the file is not a filter of a supported version.
+
+        Returns:
+            BloomFilter: The filter.
+        """
+        with open(file_path, 'rb') as file:
+            data = file.read()
+
+        if len(data) < BLOOM_HEADER.size:
+            raise ValueError("File is too short to be a Bloom filter")
+        magic, version, hash_count, bit_count = BLOOM_HEADER.unpack_from(
+            data, 0
+        )
+        if magic != BLOOM_MAGIC:
+            raise ValueError("File is not a Bloom filter")
+        if version not in (1, BLOOM_VERSION):
+            raise ValueError(
+                f"Unsupported Bloom filter version {version}, "
+                f"expected {BLOOM_VERSION}"
+            )
+        offset = BLOOM_HEADER.size
+        dictionary_version = None
+        if version >= 2:
+            if len(data) < offset + DICTIONARY_VERSION_FIELD.size:
+                raise ValueError("File is too short to be a Bloom filter")
+            (field,) = DICTIONARY_VERSION_FIELD.unpack_from(data, offset)
+            dictionary_version = field.rstrip(b"\0").decode("ascii") or None
+            offset += DICTIONARY_VERSION_FIELD.size
+        return cls(
+            bit_count,
+            hash_count,
+            bytearray(data[offset:]),
+            dictionary_version
+        )
+
+    def _bit_positions(self, word: str) -> Iterable[int]:
+        digest = hashlib.blake2b(
+            word.encode("utf-8"), digest_size=16
+        ).digest()
+        first = int.from_bytes(digest[:8], "little")
+        # never zero, so each of the hash_count steps moves
+        second = int.from_bytes(digest[8:], "little") | 1
+        return (
+            (first + i * second) % self.bit_count
+            for i in range(self.hash_count)
+        )
+
+
+def bloom_path(file_path: str) -> str:
+    """
+    Get the path of the Bloom filter side file of a dictionary.
+
+    Args:
+        file_path (str): The path to the dictionary.
+
+    Returns:
+        str: The path to its Bloom filter.
+    """
+    return file_path + BLOOM_EXTENSION
+
+
+def remove_bloom_filter(file_path: str) -> None:
+    """
+    Remove the Bloom filter side file of a dictionary, if it has one,
+    as its filter is out of date once the dictionary is rewritten.
+
+    Args:
+        file_path (str): The path to the dictionary.
+    """
+    if os.path.isfile(bloom_path(file_path)):
+        os.remove(bloom_path(file_path))
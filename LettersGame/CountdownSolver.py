@@ -1,22 +1,88 @@
 from collections import Counter
-from typing import List
+from itertools import groupby, islice, product
+from typing import Iterable, Iterator, List, Tuple, Union
 
+from LettersGame.CreateDict import (
+    COUNT_GUARD_BITS,
+    get_definitions,
+    letter_mask,
+    pack_letter_counts
+)
 
-def solve_countdown(letters: str, search_dict: dict) -> List[dict]:
+
+def solve_countdown(
+    letters: str,
+    search_dict: dict,
+    include_definitions: bool = True,
+    limit: Union[int, None] = None,
+    min_length: int = 2,
+    scan_counts: Union[dict, None] = None
+) -> List[dict]:
     """
     Solve the Countdown numbers game using a dictionary and
-    the provided letters. Ensuring no duplicate words are used.
+    the provided letters. Ensuring no duplicate words are used,
+    records of the same word are merged into one result.
+
+    The buckets are not ordered by length, so with a limit every
+    bucket is still scanned before the longest words are kept.
 
     Args:
         letters (str): The letters provided for the game.
         search_dict (dict): The dictionary to search for valid words.
+        include_definitions (bool): If False the definitions are
+                                    not read and left out of the results.
+        limit (int | None): Only return this many of the longest words,
+                            longest first.
+        min_length (int): Only return words at least this long.
+        scan_counts (dict | None): If given, its "visited" count is
+                                   increased by the records scanned and its
+                                   "matched" count by those that can be
+                                   made from the letters.
 
     Returns:
         list[dict]: A list of dictionaries containing the words,
                     their definitions, and the word lengths.
     """
+    return longest_results(
+        list(iter_countdown(
+            letters, search_dict, include_definitions, min_length,
+            scan_counts
+        )),
+        limit
+    )
+
+
+def iter_countdown(
+    letters: str,
+    search_dict: dict,
+    include_definitions: bool = True,
+    min_length: int = 2,
+    scan_counts: Union[dict, None] = None
+) -> Iterator[dict]:
+    """
+    Yields the results of solve_countdown as they are found,
+    one bucket of the dictionary at a time, in no order of length.
+
+    Every record of a word is in the same bucket, so the records of a
+    word are merged before it is yielded.
+
+    Args:
+        letters (str): The letters provided for the game.
+        search_dict (dict): The dictionary to search for valid words.
+        include_definitions (bool): If False the definitions are
+                                    not read and left out of the results.
+        min_length (int): Only yield words at least this long.
+        scan_counts (dict | None): If given, its "visited" count is
+                                   increased by the records scanned and its
+                                   "matched" count by those that can be
+                                   made from the letters.
+
+    Yields:
+        dict: {"word", "definition", "length"}, see word_result
+    """
     letter_counts = Counter(letters)
-    valid_words = []
+    rack_mask = letter_mask(letter_counts)
+    rack_packed = pack_letter_counts(letter_counts)
     letters_seen = []
 
     for i in range(len(letters)):
@@ -30,15 +96,231 @@ def solve_countdown(letters: str, search_dict: dict) -> List[dict]:
                 continue
             second_letters_seen.append(letters[j])
 
-            for record in search_dict[letters[i]][letters[j]]:
-                if check_word(letter_counts, record["letter_counter"]):
-                    valid_words.append({
-                        "word": record["word"],
-                        "definition": record["definition"],
-                        "length": len(record["word"])
-                        })
+            found = {}
+            bucket = search_dict[letters[i]][letters[j]]
+            matches = fitting_records(
+                bucket, rack_mask, rack_packed, letter_counts
+            )
+            for record in matches:
+                if len(record["word"]) >= min_length:
+                    add_found_word(found, record, include_definitions)
+
+            if scan_counts is not None:
+                scan_counts["visited"] = (
+                    scan_counts.get("visited", 0) + len(bucket)
+                )
+                scan_counts["matched"] = (
+                    scan_counts.get("matched", 0) + len(matches)
+                )
+            yield from found_results(found, include_definitions)
 
-    return valid_words
+
+def solve_countdown_by_signature(
+    letters: str,
+    signature_index: dict,
+    include_definitions: bool = True,
+    limit: Union[int, None] = None,
+    min_length: int = 2
+) -> List[dict]:
+    """
+    Solve the Countdown letters game using a signature index,
+    looking up every sub-multiset of the letters rather than
+    scanning every word with the same opening letters.
+    Records of the same word are merged into one result.
+
+    The sub-multisets are looked up longest first,
+    so with a limit it stops as soon as enough words are found.
+
+    Args:
+        letters (str): The letters provided for the game.
+        signature_index (dict): The index created by
+                                CreateDict.create_signature_index.
+        include_definitions (bool): If False the definitions are
+                                    not read and left out of the results.
+        limit (int | None): Only return this many of the longest words,
+                            longest first.
+        min_length (int): Only return words at least this long.
+
+    Returns:
+        list[dict]: A list of dictionaries containing the words,
+                    their definitions, and the word lengths, longest first.
+    """
+    return list(islice(
+        iter_countdown_by_signature(
+            letters, signature_index, include_definitions, min_length
+        ),
+        limit
+    ))
+
+
+def iter_countdown_by_signature(
+    letters: str,
+    signature_index: dict,
+    include_definitions: bool = True,
+    min_length: int = 2
+) -> Iterator[dict]:
+    """
+    Yields the results of solve_countdown_by_signature as they are found,
+    longest first, so the stream can be cut off or grouped by length
+    (see group_by_length) without waiting for the shorter words.
+
+    Args:
+        letters (str): The letters provided for the game.
+        signature_index (dict): The index created by
+                                CreateDict.create_signature_index.
+        include_definitions (bool): If False the definitions are
+                                    not read and left out of the results.
+        min_length (int): Only yield words at least this long.
+
+    Yields:
+        dict: {"word", "definition", "length"}, see word_result
+    """
+    for signature in sorted(
+        rack_signatures(letters, min_length), key=len, reverse=True
+    ):
+        # every record of a word has the same signature,
+        # so a word's definitions are merged before it is yielded
+        found = {}
+        for record in signature_index.get(signature, []):
+            add_found_word(found, record, include_definitions)
+        yield from found_results(found, include_definitions)
+
+
+def group_by_length(
+    results: Iterable[dict]
+) -> Iterator[Tuple[int, List[dict]]]:
+    """
+    Group a stream of results ordered by length,
+    such as from iter_countdown_by_signature.
+
+    Args:
+        results (Iterable[dict]): The results, longest or shortest first.
+
+    Yields:
+        Tuple[int, List[dict]]: Each length and the results of that length,
+                                as soon as the last of them has been found.
+    """
+    for length, group in groupby(results, key=lambda result: result["length"]):
+        yield length, list(group)
+
+
+def longest_results(
+    results: List[dict],
+    limit: Union[int, None] = None
+) -> List[dict]:
+    """
+    Keep only the longest results, for solvers that
+    cannot find words in order of length.
+
+    Args:
+        results (List[dict]): The results of a solver.
+        limit (int | None): The number of results to keep,
+                            None keeps the results unchanged.
+
+    Returns:
+        List[dict]: The longest results, longest first.
+    """
+    if limit is None:
+        return results
+    return sorted(
+        results, key=lambda result: result["length"], reverse=True
+    )[:limit]
+
+
+def add_found_word(
+    found: dict,
+    record: dict,
+    include_definitions: bool = True
+) -> None:
+    """
+    Add the record of a word found by a solver,
+    merging its definitions with any record of the same word found before.
+
+    Args:
+        found (dict): The definitions of each word found so far.
+        record (dict): The record of the word in the dictionary.
+        include_definitions (bool): If False the definitions are not read.
+    """
+    word = record["word"]
+    definitions = found.get(word)
+    if definitions is None:
+        # the definitions of one record are already distinct,
+        # only those of later records of the word need comparing
+        found[word] = (
+            list(get_definitions(record)) if include_definitions else []
+        )
+        return
+    if include_definitions:
+        for definition in get_definitions(record):
+            if definition not in definitions:
+                definitions.append(definition)
+
+
+def found_results(found: dict, include_definitions: bool = True) -> List[dict]:
+    """
+    Create the results of the words found by a solver.
+
+    Args:
+        found (dict): The definitions of each word found.
+        include_definitions (bool): If False the definitions are left out.
+
+    Returns:
+        list[dict]: The result of each word, in the order they were found.
+    """
+    return [
+        word_result(word, definitions, include_definitions)
+        for word, definitions in found.items()
+    ]
+
+
+def word_result(
+    word: str,
+    definitions: List[str],
+    include_definitions: bool = True
+) -> dict:
+    """
+    Create the result returned for a word found by a solver.
+
+    Args:
+        word (str): The word.
+        definitions (List[str]): The definitions of the word.
+        include_definitions (bool): If False the definition is left out.
+
+    Returns:
+        dict: {"word", "definition", "length"}, where definition joins
+              every definition of the word, without "definition"
+              if include_definitions is False
+    """
+    if not include_definitions:
+        return {"word": word, "length": len(word)}
+    return {
+        "word": word,
+        "definition": "; ".join(definitions),
+        "length": len(word)
+    }
+
+
+def rack_signatures(letters: str, min_length: int = 2) -> Iterator[str]:
+    """
+    Yields the signature of every distinct sub-multiset of the letters
+    which is at least min_length letters long. At most 2^9 for 9 letters.
+
+    Args:
+        letters (str): The letters provided for the game.
+        min_length (int): The shortest signature to yield, at least 2.
+
+    Yields:
+        str: a sorted-letter signature that can be formed from the letters
+    """
+    letter_counts = sorted(Counter(letters).items())
+
+    for choice in product(*(range(count + 1) for _, count in letter_counts)):
+        signature = "".join(
+            letter * amount
+            for (letter, _), amount in zip(letter_counts, choice)
+        )
+        if len(signature) >= max(min_length, 2):
+            yield signature
 
 
 def check_word(
@@ -62,6 +344,96 @@ def check_word(
     return False
 
 
+def record_fits(
+    record: dict,
+    rack_mask: int,
+    rack_packed: int,
+    letter_counts: dict
+) -> bool:
+    """
+    checks if the word of a dictionary record can be formed from the
+    letters given, by its letter mask and packed counts if it has them,
+    otherwise by its letter counter
+
+    Args:
+        record (dict): The record of the word, see CreateDict.create_record
+        rack_mask (int): The letter mask of the letters available,
+                         see CreateDict.letter_mask
+        rack_packed (int): The packed counts of the letters available,
+                           see CreateDict.pack_letter_counts
+        letter_counts (dict): The counts of the letters available
+
+    Returns:
+        bool: True if the word can be formed from the letters
+    """
+    if "letter_mask" in record:
+        # one AND rejects words using letters not in the rack
+        return not record["letter_mask"] & ~rack_mask and check_packed_counts(
+            rack_packed, record["packed_counts"]
+        )
+    return check_word(letter_counts, record["letter_counter"])
+
+
+def fitting_records(
+    bucket: List[dict],
+    rack_mask: int,
+    rack_packed: int,
+    letter_counts: dict
+) -> List[dict]:
+    """
+    Get the records of a bucket whose words can be formed from the letters
+    given, checking each as record_fits does but in one pass over the
+    bucket, as calling record_fits for every record scanned costs more
+    than the checks themselves
+
+    Args:
+        bucket (List[dict]): The records to check
+        rack_mask (int): The letter mask of the letters available,
+                         see CreateDict.letter_mask
+        rack_packed (int): The packed counts of the letters available,
+                           see CreateDict.pack_letter_counts
+        letter_counts (dict): The counts of the letters available
+
+    Returns:
+        List[dict]: The records which fit, in the order of the bucket
+    """
+    outside_rack = ~rack_mask
+    guarded_rack = rack_packed | COUNT_GUARD_BITS
+    # most records are rejected by their mask before their counts are read,
+    # the counts are compared as in check_packed_counts
+    return [
+        record for record in bucket
+        if (
+            not record["letter_mask"] & outside_rack
+            and (guarded_rack - record["packed_counts"]) & COUNT_GUARD_BITS
+            == COUNT_GUARD_BITS
+            if "letter_mask" in record
+            else check_word(letter_counts, record["letter_counter"])
+        )
+    ]
+
+
+def check_packed_counts(rack_packed: int, word_packed: int) -> bool:
+    """
+    checks if a word can be formed from the letters given
+    using the packed count vectors from CreateDict.pack_letter_counts.
+
+    Setting the guard bit of every field in the rack and subtracting
+    the word leaves the guard bit set only where the rack count is
+    at least the word count, no borrow can cross into the next field.
+
+    Args:
+        rack_packed (int): The packed counts of the letters available
+        word_packed (int): The packed counts of the word
+
+    Returns:
+        bool: True if every word count is at most the rack count
+    """
+    return (
+        (rack_packed | COUNT_GUARD_BITS) - word_packed
+    ) & COUNT_GUARD_BITS == COUNT_GUARD_BITS
+
+
 def output_words(words: List[dict]) -> None:
     """
     Output the words to the console.
@@ -78,7 +450,35 @@ def output_words(words: List[dict]) -> None:
             )
 
 
-def check_answer(word: str, letters: str, search_dict: dict) -> dict:
+def output_words_stream(words: Iterable[dict]) -> int:
+    """
+    Output each word to the console as soon as it is found,
+    in the order of the stream rather than by length.
+
+    Args:
+        words (Iterable[dict]): The results of a solver,
+                                such as from iter_countdown.
+
+    Returns:
+        int: The number of words output.
+    """
+    count = 0
+    for record in words:
+        print(
+            f'{record["length"]} - {record["word"]} - {record["definition"]}',
+            flush=True
+            )
+        count += 1
+    return count
+
+
+def check_answer(
+    word: str,
+    letters: str,
+    search_dict: dict,
+    include_definitions: bool = True,
+    word_index: Union[dict, None] = None
+) -> dict:
     """
     checks if the word can be formed from a subset of 'letters'
     checks if  the word is in the dict
@@ -88,33 +488,53 @@ def check_answer(word: str, letters: str, search_dict: dict) -> dict:
         word (str): The word submitted
         letters (str): The available letters
         search_dict (dict): the search dict to search for words
+        include_definitions (bool): If False the definitions are
+                                    not read and left out of the result
+        word_index (dict | None): the records of search_dict by word,
+                                  see CreateDict.create_word_index,
+                                  so the word is found without
+                                  scanning its bucket
 
     Returns:
         dict: The return dict
                 {
                     correct: (bool) if the word is correct
-                    definitions: (list[string]) the definitions of the word
+                    definitions: (list[string]) the definitions of the word,
+                                 left out if include_definitions is False
                 }
     """
     return_dict = {
         "correct": False,
         "definitions": []
     }
+    if not include_definitions:
+        del return_dict["definitions"]
 
-    word_counter = Counter(word)
-    letters_counter = Counter(letters)
-
-    for key in word_counter:
-        if (
-            key not in letters_counter or
-            word_counter[key] > letters_counter[key]
-        ):
-            return return_dict
-
-    same_opening_words = search_dict[word[0]][word[1]]
-    for word_dict in same_opening_words:
-        if word_dict["word"] == word:
-            return_dict["correct"] = True
-            return_dict["definitions"].append(word_dict["definition"])
+    if word_index is not None:
+        # most guesses are not words, so the rack is only checked once the
+        # word is found, against the letter masks and packed counts of its
+        # records rather than by counting the letters of the word
+        word_dicts = word_index.get(word, ())
+        if word_dicts:
+            letter_counts = Counter(letters)
+            rack_mask = letter_mask(letter_counts)
+            rack_packed = pack_letter_counts(letter_counts)
+            word_dicts = [
+                word_dict for word_dict in word_dicts if record_fits(
+                    word_dict, rack_mask, rack_packed, letter_counts
+                )
+            ]
+    elif not check_word(Counter(letters), Counter(word)):
+        return return_dict
+    else:
+        word_dicts = (
+            word_dict for word_dict in search_dict[word[0]][word[1]]
+            if word_dict["word"] == word
+        )
+    for word_dict in word_dicts:
+        return_dict["correct"] = True
+        if not include_definitions:
+            break
+        return_dict["definitions"].extend(get_definitions(word_dict))
 
     return return_dict
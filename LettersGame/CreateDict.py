@@ -1,8 +1,10 @@
 import csv
+import os
 import string
 from collections import Counter
 import json
-from typing import Union
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, List, Set, Tuple, Union
 
 """
 The structure of the dictionary is as follows:
@@ -12,17 +14,37 @@ The structure of the dictionary is as follows:
         "second letter of word": [
             {
                 "word": "the word",
-                "definition": "the definition",
+                "definitions": ["each definition of the word"],
                 "count": the length of the word,
-                "letter_counter": a counter of the letters in the word
+                "letter_counter": a counter of the letters in the word,
+                "letter_mask": a 26 bit mask of the letters in the word,
+                "packed_counts": the letter counts packed into one integer
             },
         ]
     }
 }
+
+Each word has one record, rows of the same word are merged into its
+definitions. Dictionaries stored before this have one record per row with
+a single "definition" instead, get_definitions reads either.
 """
 
+# each letter count is packed into a byte, 7 bits for the count (capped at
+# 127) and a guard bit so that packed vectors can be compared in one
+# subtraction, the packed counts are the little endian count vector bytes
+COUNT_FIELD_BITS = 8
+MAX_PACKED_COUNT = 127
+COUNT_GUARD_BITS = sum(
+    1 << (COUNT_FIELD_BITS * i + COUNT_FIELD_BITS - 1)
+    for i in range(len(string.ascii_lowercase))
+)
+
 
-def create_dict(csv_file_path: str, file_path: str) -> Union[dict, None]:
+def create_dict(
+    csv_file_path: str,
+    file_path: str,
+    bloom_false_positive_rate: Union[float, None] = None
+) -> Union[dict, None]:
     """
     Create a dict object that stores all valid answers
     to a possible countdown letters game from a CSV file.
@@ -30,6 +52,10 @@ def create_dict(csv_file_path: str, file_path: str) -> Union[dict, None]:
     Args:
         csv_file_path (str): The path to the CSV file.
         file_path (str): The path to the file to store the dictionary.
+        bloom_false_positive_rate (float | None): If set, a Bloom filter
+            of the words with this false positive rate is stored next to
+            the dictionary, see create_bloom_filter, otherwise the filter
+            of the dictionary replaced is removed.
     Returns:
         dictionary (dict): A dictionary with first letters of words as keys
                             and dictionary with second letters of words
@@ -38,32 +64,179 @@ def create_dict(csv_file_path: str, file_path: str) -> Union[dict, None]:
     try:
         with open(csv_file_path, 'r') as file:
             dictionary = initialise_dict()
+            word_index = {}
 
             csv_reader = csv.reader(file)
             for row in csv_reader:
-                # skip header
-                if row[1] == 'Count':
-                    continue
-                if not row[1][0].isdigit() or int(row[1]) < 2:
-                    continue
-                word, definition = row[0].lower(), row[3]
-
-                # ignoring words in the dataset that could not be valid answers
-                valid_word = True
-                for char in word:
-                    if not char.isalpha():
-                        valid_word = False
-                if valid_word:
-                    add_to_dict(dictionary, word, definition)
+                entry = parse_row(row)
+                if entry is not None:
+                    add_to_dict(dictionary, *entry, word_index)
 
     except Exception as e:
         print(f"Error: {e}")
         return None
 
     store_dict(dictionary, file_path)
+    if bloom_false_positive_rate is not None:
+        from LettersGame.BloomFilter import bloom_path
+        from LettersGame.DictionaryStore import dictionary_version
+
+        bloom_filter = create_bloom_filter(
+            dictionary, bloom_false_positive_rate
+        )
+        bloom_filter.dictionary_version = dictionary_version(file_path)
+        bloom_filter.store(bloom_path(file_path))
     return dictionary
 
 
+def create_dict_from_sources(
+    csv_file_paths: Iterable[str],
+    file_path: str,
+    blocklist_paths: Iterable[str] = (),
+    workers: Union[int, None] = None
+) -> Union[dict, None]:
+    """
+    Create a dictionary from several CSV files, as create_dict does
+    from one, leaving out the words of the blocklists.
+
+    Each file is read in its own worker process, so the files are read
+    in about the time of the slowest one. The records of the sources are
+    then merged in the order of csv_file_paths, a word found in several
+    sources having one record with the definitions of each.
+
+    Args:
+        csv_file_paths (Iterable[str]): The paths to the CSV files.
+        file_path (str): The path to the file to store the dictionary.
+        blocklist_paths (Iterable[str]): The paths to files of words
+                                         to leave out, one per line.
+        workers (int | None): The number of worker processes,
+                              None for one per file up to one per CPU.
+
+    Returns:
+        dictionary (dict): The dictionary, None if a file could not be read.
+    """
+    csv_file_paths = list(csv_file_paths)
+    blocklist_paths = list(blocklist_paths)
+    workers = min(
+        workers or os.cpu_count() or 1,
+        len(csv_file_paths) + len(blocklist_paths)
+    )
+
+    try:
+        if workers <= 1:
+            sources = [read_source(path) for path in csv_file_paths]
+            blocklists = [read_blocklist(path) for path in blocklist_paths]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                source_futures = [
+                    executor.submit(read_source, path)
+                    for path in csv_file_paths
+                ]
+                blocklist_futures = [
+                    executor.submit(read_blocklist, path)
+                    for path in blocklist_paths
+                ]
+                sources = [future.result() for future in source_futures]
+                blocklists = [
+                    future.result() for future in blocklist_futures
+                ]
+    except Exception as e:
+        print(f"Error: {e}")
+        return None
+
+    blocked = set().union(*blocklists)
+    dictionary = initialise_dict()
+    word_index = {}
+    for records in sources:
+        for record in records:
+            word = record["word"]
+            if word in blocked:
+                continue
+            existing = word_index.get(word)
+            if existing is None:
+                dictionary[word[0]][word[1]].append(record)
+                word_index[word] = record
+                continue
+            for definition in record["definitions"]:
+                if definition not in existing["definitions"]:
+                    existing["definitions"].append(definition)
+
+    store_dict(dictionary, file_path)
+    return dictionary
+
+
+def read_source(csv_file_path: str) -> List[dict]:
+    """
+    Read the records of the words in a CSV file, rows of the same word
+    merged into one record as in create_dict.
+
+    Args:
+        csv_file_path (str): The path to the CSV file.
+
+    Returns:
+        List[dict]: The records, in the order their words first appear.
+    """
+    records = {}
+    with open(csv_file_path, 'r') as file:
+        for row in csv.reader(file):
+            entry = parse_row(row)
+            if entry is None:
+                continue
+            word, definition = entry
+            record = records.get(word)
+            if record is None:
+                records[word] = create_record(word, [definition])
+            elif definition not in record["definitions"]:
+                record["definitions"].append(definition)
+
+    return list(records.values())
+
+
+def read_blocklist(file_path: str) -> Set[str]:
+    """
+    Read a file of words to leave out of a dictionary, one per line,
+    only the first column is read from a CSV file.
+
+    Args:
+        file_path (str): The path to the blocklist.
+
+    Returns:
+        Set[str]: The lowercase words.
+    """
+    with open(file_path, 'r') as file:
+        return {
+            row[0].strip().lower()
+            for row in csv.reader(file)
+            if row and row[0].strip()
+        }
+
+
+def parse_row(row: List[str]) -> Union[Tuple[str, str], None]:
+    """
+    Parse a row of the dataset: word, count, part of speech, definition.
+
+    Args:
+        row (List[str]): The columns of the row.
+
+    Returns:
+        Tuple[str, str] | None: The lowercase word and its definition,
+                                None for the header and for words that
+                                could not be valid answers.
+    """
+    # skip header
+    if row[1] == 'Count':
+        return None
+    if not row[1][0].isdigit() or int(row[1]) < 2:
+        return None
+    word, definition = row[0].lower(), row[3]
+
+    # ignoring words in the dataset that could not be valid answers
+    for char in word:
+        if char not in string.ascii_lowercase:
+            return None
+    return word, definition
+
+
 def initialise_dict() -> dict:
     """
     Initialise a dictionary with all possible first letters of words
@@ -85,51 +258,337 @@ def initialise_dict() -> dict:
     return dictionary
 
 
-def add_to_dict(dictionary: dict, word: str, definition: str) -> None:
+def add_to_dict(
+    dictionary: dict,
+    word: str,
+    definition: str,
+    word_index: Union[dict, None] = None
+) -> None:
     """
     Add a word, its definition, count and counter of letters to the dictionary.
+    If the word is already in the dictionary the definition is added
+    to its record instead, unless the record already has that definition.
 
     Args:
         dictionary (dict): The dictionary to add to.
         word (str): the word to add
         definition (str): the words definition
+        word_index (dict | None): the records of the dictionary by word,
+                                  kept up to date so that existing words are
+                                  found without scanning their bucket
+    """
+    if word_index is not None:
+        record = word_index.get(word)
+    else:
+        record = next(
+            (
+                record for record in dictionary[word[0]][word[1]]
+                if record["word"] == word
+            ),
+            None
+        )
+
+    if record is not None:
+        if definition not in record["definitions"]:
+            record["definitions"].append(definition)
+        return
+
+    record = create_record(word, [definition])
+    dictionary[word[0]][word[1]].append(record)
+    if word_index is not None:
+        word_index[word] = record
+
+
+def create_record(word: str, definitions: List[str]) -> dict:
+    """
+    Create the record of a word, its definitions, count and letters.
+
+    Args:
+        word (str): the word
+        definitions (List[str]): the words definitions
+
+    Returns:
+        dict: the record of the word
     """
     letter_counter = Counter(word)
-    dictionary[word[0]][word[1]].append({
+    return {
         "word": word,
-        "definition": definition,
+        "definitions": definitions,
         "count": len(word),
-        "letter_counter": letter_counter
-        })
+        "letter_counter": letter_counter,
+        "letter_mask": letter_mask(letter_counter),
+        "packed_counts": pack_letter_counts(letter_counter)
+        }
+
+
+def get_definitions(record: dict) -> List[str]:
+    """
+    Get the definitions of a record, including records
+    stored with a single "definition".
+
+    Args:
+        record (dict): The record of a word.
+
+    Returns:
+        List[str]: The definitions of the word.
+    """
+    if "definitions" in record:
+        return record["definitions"]
+    return [record["definition"]]
+
+
+def letter_mask(letter_counts: dict) -> int:
+    """
+    Create a 26 bit mask with a bit set for each letter present.
+
+    Args:
+        letter_counts (dict): the counts of each letter
+
+    Returns:
+        int: bit i is set if the i-th letter of the alphabet is present
+    """
+    mask = 0
+    for letter, count in letter_counts.items():
+        if count > 0:
+            mask |= 1 << (ord(letter) - ord("a"))
+    return mask
+
+
+def pack_letter_counts(letter_counts: dict) -> int:
+    """
+    Pack the count of each letter into a single integer,
+    COUNT_FIELD_BITS per letter with counts capped at MAX_PACKED_COUNT.
+
+    Args:
+        letter_counts (dict): the counts of each letter
+
+    Returns:
+        int: the packed count vector
+    """
+    packed = 0
+    for letter, count in letter_counts.items():
+        shift = COUNT_FIELD_BITS * (ord(letter) - ord("a"))
+        packed |= min(count, MAX_PACKED_COUNT) << shift
+    return packed
+
+
+def word_signature(word: str) -> str:
+    """
+    Get the sorted-letter signature of a word,
+    all anagrams of a word share the same signature.
+
+    Args:
+        word (str): The word to get the signature of.
+
+    Returns:
+        str: The letters of the word in alphabetical order.
+    """
+    return "".join(sorted(word))
+
+
+def create_signature_index(dictionary: dict) -> dict:
+    """
+    Create an index of the records in the dictionary
+    keyed by the sorted-letter signature of each word.
+
+    {
+        "sorted letters of word": [
+            the records from the dictionary with that signature
+        ]
+    }
+
+    A mapped dictionary already has a signature index in its file,
+    which is returned rather than building one in memory.
+
+    Args:
+        dictionary (dict): The dictionary to index.
+
+    Returns:
+        dict: The signature index, the records are shared
+              with the dictionary rather than copied.
+    """
+    if hasattr(dictionary, "signature_index"):
+        return dictionary.signature_index
+
+    signature_index = {}
+    for first_letter in dictionary:
+        for second_letter in dictionary[first_letter]:
+            for record in dictionary[first_letter][second_letter]:
+                signature = word_signature(record["word"])
+                signature_index.setdefault(signature, []).append(record)
+
+    return signature_index
+
+
+def create_word_index(dictionary: dict) -> dict:
+    """
+    Create an index of the records in the dictionary keyed by word,
+    so a word is found without scanning its bucket.
+
+    {
+        "word": [the records from the dictionary of that word]
+    }
+
+    A mapped dictionary with a word_hashes section already has a word index
+    in its file, which is returned rather than building one in memory.
+
+    Args:
+        dictionary (dict): The dictionary to index.
+
+    Returns:
+        dict: The word index, the records are shared
+              with the dictionary rather than copied.
+    """
+    if getattr(dictionary, "word_index", None) is not None:
+        return dictionary.word_index
+
+    word_index = {}
+    for first_letter in dictionary:
+        for second_letter in dictionary[first_letter]:
+            for record in dictionary[first_letter][second_letter]:
+                word_index.setdefault(record["word"], []).append(record)
+
+    return word_index
+
+
+def create_bloom_filter(
+    dictionary: dict,
+    false_positive_rate: float = 0.01
+):
+    """
+    Create a Bloom filter of the words in the dictionary,
+    rejecting most words which are not in it without reading it.
+
+    Args:
+        dictionary (dict): The dictionary of words.
+        false_positive_rate (float): The chance a word not in the
+                                     dictionary is reported present.
+
+    Returns:
+        BloomFilter: The filter, see LettersGame.BloomFilter.
+    """
+    from LettersGame.BloomFilter import BloomFilter
+
+    words = [
+        record["word"]
+        for first_letter in dictionary
+        for second_letter in dictionary[first_letter]
+        for record in dictionary[first_letter][second_letter]
+    ]
+    bloom_filter = BloomFilter.for_capacity(len(words), false_positive_rate)
+    bloom_filter.update(words)
+    return bloom_filter
+
+
+def create_count_matrix(dictionary: dict) -> dict:
+    """
+    Create a matrix of the letter counts of every word in the dictionary,
+    used by the matrix engine (see MatrixSolver). Requires numpy.
+
+    {
+        "counts": a (number of words, 26) uint8 array, each row the
+                  count vector of a word (see BinaryDict.word_count_vector),
+        "letter_counts": counts transposed, a contiguous row per letter,
+                         so comparing one letter of every word is fast,
+        "lengths": the length of each word,
+        "records": the record of each word, by row
+    }
+
+    A mapped dictionary already holds the count vectors of its words in
+    that layout, so its counts are a view of the file rather than a copy.
+    The matrix must be dropped before the mapped dictionary is closed.
+
+    Args:
+        dictionary (dict): The dictionary to index.
+
+    Raises:
+        ImportError: If numpy is not installed.
+
+    Returns:
+        dict: The count matrix, the records are shared
+              with the dictionary rather than copied.
+    """
+    import numpy as np
+
+    from LettersGame.BinaryDict import ALPHABET_SIZE, word_count_vector
+
+    if hasattr(dictionary, "count_vectors"):
+        records = dictionary.records()
+        vectors = dictionary.count_vectors()
+    else:
+        records = [
+            record
+            for first_letter in dictionary
+            for second_letter in dictionary[first_letter]
+            for record in dictionary[first_letter][second_letter]
+        ]
+        vectors = b"".join(
+            word_count_vector(record["word"]) for record in records
+        )
+
+    counts = np.frombuffer(vectors, dtype=np.uint8).reshape(
+        -1, ALPHABET_SIZE
+    )
+    return {
+        "counts": counts,
+        "letter_counts": np.ascontiguousarray(counts.T),
+        "lengths": counts.sum(axis=1, dtype=np.uint16),
+        "records": records,
+    }
 
 
 def store_dict(dictionary: dict, file_path: str) -> None:
     """
-    Store the dictionary to a file in JSON format.
+    Store the dictionary to a file in JSON format,
+    or in the binary format if the path ends in ".bin",
+    removing the Bloom filter of the dictionary it replaces.
 
     Args:
         dictionary (dict): The dictionary to store.
         file_path (str): The path to the file to store the dictionary.
     """
+    from LettersGame.BinaryDict import BINARY_EXTENSION, store_dict_binary
+    from LettersGame.BloomFilter import remove_bloom_filter
+
     try:
-        with open(file_path, 'w') as file:
-            json.dump(dictionary, file)
+        if file_path.endswith(BINARY_EXTENSION):
+            store_dict_binary(dictionary, file_path)
+        else:
+            with open(file_path, 'w') as file:
+                json.dump(dictionary, file)
+        remove_bloom_filter(file_path)
     except Exception as e:
         print(f"Error: {e}")
         return None
 
 
-def load_dict(file_path: str) -> Union[dict, None]:
+def load_dict(file_path: str, mapped: bool = False) -> Union[dict, None]:
     """
-    Load the dictionary from a file in JSON format.
+    Load the dictionary from a file in JSON format,
+    or in the binary format if the file starts with its magic bytes,
+    or from the directory of a dictionary compiled by
+    IncrementalDict.update_dict.
 
     Args:
         file_path (str): The path to the file to load the dictionary from.
+        mapped (bool): Memory map a binary dictionary rather than
+                       loading it, so it is shared between processes.
+                       JSON dictionaries are always loaded.
 
     Returns:
         dictionary (dict): The dictionary loaded from the file.
     """
+    from LettersGame.BinaryDict import is_binary_dict, load_dict_binary
+    from LettersGame.IncrementalDict import is_dict_shards, load_dict_shards
+    from LettersGame.MappedDict import MappedDict
+
     try:
+        if is_dict_shards(file_path):
+            return load_dict_shards(file_path)
+        if is_binary_dict(file_path):
+            if mapped:
+                return MappedDict(file_path)
+            return load_dict_binary(file_path)
         with open(file_path, 'r') as file:
             dictionary = json.load(file)
 
@@ -0,0 +1,230 @@
+import os
+import threading
+import time
+from typing import Callable, List, Union
+
+from LettersGame.BloomFilter import BloomFilter, bloom_path
+from LettersGame.CreateDict import create_word_index, load_dict
+from LettersGame.Engines import DEFAULT_ENGINE, create_engine
+from LettersGame.IncrementalDict import (
+    MANIFEST_NAME,
+    file_checksum,
+    is_dict_shards
+)
+
+"""
+Holds the dictionary a server answers from, so it can be replaced while
+the server is running.
+
+The dictionary, its solver and its version are held together in a
+LoadedDictionary, which is never changed once built. A reload builds the new
+LoadedDictionary in a background thread and then replaces the current one
+in a single assignment, so a request which took the current LoadedDictionary
+when it started finishes on that version, and the old dictionary is freed
+once the last such request is done.
+
+A Bloom filter stored next to the dictionary (see BloomFilter) is loaded
+with it, for rejecting guesses which are not words without reading it,
+if it was built for this version of the dictionary.
+
+The version of a dictionary is the start of the SHA-256 of its file, or of
+the manifest of a compiled directory (see IncrementalDict), so the same
+dictionary has the same version in every worker.
+"""
+
+VERSION_LENGTH = 12
+
+
+class LoadedDictionary:
+    """
+    A loaded dictionary with its solver engine, word index and version.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        version: str,
+        dictionary: dict,
+        solver: Callable[..., List[dict]],
+        word_index: dict,
+        load_seconds: float,
+        bloom_filter: Union[BloomFilter, None] = None
+    ):
+        """
+        Args:
+            path (str): The path the dictionary was loaded from.
+            version (str): The version of the dictionary.
+            dictionary (dict): The dictionary.
+            solver (Callable[..., List[dict]]): Its solver,
+                                                see Engines.create_engine.
+            word_index (dict): Its records by word,
+                               see CreateDict.create_word_index.
+            load_seconds (float): The time taken to load it and build
+                                  the solver.
+            bloom_filter (BloomFilter | None): The Bloom filter of its words,
+                                               None if it has none.
+        """
+        self.path = path
+        self.version = version
+        self.dictionary = dictionary
+        self.solver = solver
+        self.word_index = word_index
+        self.load_seconds = load_seconds
+        self.bloom_filter = bloom_filter
+
+
+class DictionaryStore:
+    """
+    The current dictionary of a server, replaced atomically on reload.
+    """
+
+    def __init__(
+        self,
+        engine: str = DEFAULT_ENGINE,
+        on_swap: Union[Callable[[LoadedDictionary], None], None] = None
+    ):
+        """
+        Args:
+            engine (str): The solver engine, see Engines.ENGINES.
+            on_swap (Callable[[LoadedDictionary], None] | None): Called with
+                the new dictionary each time one is swapped in.
+        """
+        self.engine = engine
+        self.on_swap = on_swap
+        self.current = None
+        self.last_error = None
+        self._reload_thread = None
+        self._lock = threading.Lock()
+
+    def load(self, path: str) -> LoadedDictionary:
+        """
+        Load the dictionary at path and swap it in.
+
+        Args:
+            path (str): The path to the dictionary.
+
+        Raises:
+            RuntimeError: If the dictionary could not be loaded.
+
+        Returns:
+            LoadedDictionary: The dictionary swapped in.
+        """
+        started = time.perf_counter()
+        # a binary dictionary is memory mapped, so every worker shares one copy
+        dictionary = load_dict(path, mapped=True)
+        if dictionary is None:
+            raise RuntimeError(f"Failed to load the dictionary {path}")
+        version = dictionary_version(path)
+        bloom_filter = None
+        if os.path.isfile(bloom_path(path)):
+            bloom_filter = BloomFilter.load(bloom_path(path))
+            # a filter built for another version of the dictionary
+            # would reject the words added since, so is not used
+            if bloom_filter.dictionary_version != version:
+                bloom_filter = None
+        loaded = LoadedDictionary(
+            path,
+            version,
+            dictionary,
+            create_engine(dictionary, self.engine),
+            create_word_index(dictionary),
+            time.perf_counter() - started,
+            bloom_filter
+        )
+
+        self.current = loaded
+        if self.on_swap is not None:
+            self.on_swap(loaded)
+        return loaded
+
+    def reload(self, path: str) -> bool:
+        """
+        Load the dictionary at path in a background thread and swap it in,
+        keeping the current dictionary if it could not be loaded.
+
+        Args:
+            path (str): The path to the dictionary.
+
+        Returns:
+            bool: False if a reload is already in progress.
+        """
+        with self._lock:
+            if self.reloading:
+                return False
+            self._reload_thread = threading.Thread(
+                target=self._reload, args=(path,), daemon=True
+            )
+            self._reload_thread.start()
+        return True
+
+    @property
+    def reloading(self) -> bool:
+        """
+        Returns:
+            bool: True while a reload is in progress.
+        """
+        thread = self._reload_thread
+        return thread is not None and thread.is_alive()
+
+    def wait(self, timeout: Union[float, None] = None) -> None:
+        """
+        Wait for the reload in progress, if any, to finish.
+
+        Args:
+            timeout (float | None): The most seconds to wait.
+        """
+        thread = self._reload_thread
+        if thread is not None:
+            thread.join(timeout)
+
+    def status(self) -> dict:
+        """
+        Returns:
+            dict: {
+                "path": the path of the current dictionary,
+                "version": the version of the current dictionary,
+                "load_seconds": the time taken to load it,
+                "bloom_filter_bytes": the size of its Bloom filter,
+                                      None if it has none,
+                "reloading": True while a reload is in progress,
+                "last_error": why the last reload failed, None if it did not
+            }
+        """
+        current = self.current
+        return {
+            "path": current.path if current else None,
+            "version": current.version if current else None,
+            "load_seconds": current.load_seconds if current else None,
+            "bloom_filter_bytes": (
+                len(current.bloom_filter.bits)
+                if current and current.bloom_filter else None
+            ),
+            "reloading": self.reloading,
+            "last_error": self.last_error,
+        }
+
+    def _reload(self, path: str) -> None:
+        try:
+            self.load(path)
+            self.last_error = None
+        except Exception as e:
+            self.last_error = str(e)
+
+
+def dictionary_version(path: str) -> str:
+    """
+    Get the version of a dictionary from its contents.
+
+    Args:
+        path (str): The path to the dictionary.
+
+    Raises:
+        OSError: If the dictionary could not be read.
+
+    Returns:
+        str: The first VERSION_LENGTH hex digits of the SHA-256
+             of the dictionary file, or of the manifest of a directory.
+    """
+    if is_dict_shards(path):
+        path = os.path.join(path, MANIFEST_NAME)
+    return file_checksum(path)[:VERSION_LENGTH]
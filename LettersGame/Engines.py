@@ -0,0 +1,114 @@
+from typing import Callable, Iterator, List, Union
+
+from LettersGame.CountdownSolver import (
+    iter_countdown,
+    iter_countdown_by_signature,
+    solve_countdown,
+    solve_countdown_by_signature
+)
+from LettersGame.CreateDict import create_count_matrix, create_signature_index
+from LettersGame.MatrixSolver import (
+    NUMPY_AVAILABLE,
+    iter_countdown_matrix,
+    solve_countdown_matrix
+)
+from LettersGame.TrieSolver import (
+    create_trie,
+    iter_countdown_trie,
+    solve_countdown_trie
+)
+
+"""
+The solver engines, each a function building its index from the dictionary,
+a solver taking (letters, index, include_definitions, limit, min_length)
+returning the same {"word", "definition", "length"} records and a generator
+taking (letters, index, include_definitions, min_length) yielding them
+as they are found:
+
+    bucket: scans the first and second letter buckets of the dictionary
+    signature: looks up each sub-multiset of the rack by sorted letters,
+               yielding the words longest first
+    trie: walks a minimised DAWG of the words, using up the rack
+    matrix: compares the rack with the letter counts of every word at once,
+            only available if numpy is installed
+"""
+
+ENGINES = {
+    "bucket": (
+        lambda dictionary: dictionary,
+        solve_countdown,
+        iter_countdown
+    ),
+    "signature": (
+        create_signature_index,
+        solve_countdown_by_signature,
+        iter_countdown_by_signature
+    ),
+    "trie": (create_trie, solve_countdown_trie, iter_countdown_trie),
+}
+if NUMPY_AVAILABLE:
+    ENGINES["matrix"] = (
+        create_count_matrix,
+        solve_countdown_matrix,
+        iter_countdown_matrix
+    )
+DEFAULT_ENGINE = "signature"
+
+# the engines which count the records they scan, see solve_countdown
+SCAN_COUNTING_ENGINES = ("bucket",)
+
+
+def create_engine(
+    dictionary: dict,
+    engine: str = DEFAULT_ENGINE
+) -> Callable[..., List[dict]]:
+    """
+    Build the index of an engine and return its solver.
+
+    Args:
+        dictionary (dict): The dictionary of words.
+        engine (str): The name of the engine, one of ENGINES.
+
+    Raises:
+        ValueError: If there is no engine with that name.
+
+    Returns:
+        Callable[..., List[dict]]: solver(letters, include_definitions=True,
+                                          limit=None, min_length=2,
+                                          scan_counts=None), scan_counts
+                                   only counted by SCAN_COUNTING_ENGINES,
+                                   with solver.stream(letters,
+                                   include_definitions=True, min_length=2)
+                                   yielding the results as they are found
+    """
+    if engine not in ENGINES:
+        raise ValueError(
+            f"Unknown engine {engine}, expected one of {', '.join(ENGINES)}"
+        )
+
+    build_index, solve, iterate = ENGINES[engine]
+    index = build_index(dictionary)
+
+    def solver(
+        letters: str,
+        include_definitions: bool = True,
+        limit: Union[int, None] = None,
+        min_length: int = 2,
+        scan_counts: Union[dict, None] = None
+    ) -> List[dict]:
+        if scan_counts is not None and engine in SCAN_COUNTING_ENGINES:
+            return solve(
+                letters, index, include_definitions, limit, min_length,
+                scan_counts
+            )
+        return solve(letters, index, include_definitions, limit, min_length)
+
+    def stream(
+        letters: str,
+        include_definitions: bool = True,
+        min_length: int = 2
+    ) -> Iterator[dict]:
+        return iterate(letters, index, include_definitions, min_length)
+
+    solver.stream = stream
+    return solver
@@ -0,0 +1,158 @@
+import secrets
+import time
+from typing import Callable, Dict, Iterable, List, Union
+
+from LettersGame.CreateDict import get_definitions
+from LettersGame.ResultCache import ResultCache, canonical_rack
+
+"""
+Game sessions, for when many guesses are checked against the same rack.
+
+A rack is registered once with the words that can be made from it, found by
+a solver, and their definitions, read from the word index of the dictionary
+(see CreateDict.create_word_index). Each guess against the session is then a
+lookup in those answers rather than a check against the dictionary.
+
+Sessions are held in a ResultCache keyed by session id, so there are at most
+max_sessions of them, the least recently used are dropped to make room and
+sessions unused for longer than the time to live expire.
+"""
+
+
+class GameSession:
+    """
+    The answers to a rack, with their definitions.
+    """
+
+    def __init__(
+        self,
+        letters: str,
+        answers: Dict[str, List[str]],
+        version: Union[str, None] = None
+    ):
+        """
+        Args:
+            letters (str): The canonical rack, see ResultCache.canonical_rack.
+            answers (Dict[str, List[str]]): The definitions of every word
+                                            that can be made from the rack.
+            version (str | None): The version of the dictionary the answers
+                                  were found in, see DictionaryStore.
+        """
+        self.letters = letters
+        self.answers = answers
+        self.version = version
+
+    def check(self, word: str, include_definitions: bool = True) -> dict:
+        """
+        Check a guess, as CountdownSolver.check_answer does.
+
+        Args:
+            word (str): The lowercase word guessed.
+            include_definitions (bool): If False the definitions are
+                                        left out of the result.
+
+        Returns:
+            dict: {
+                "correct": (bool) if the word is an answer,
+                "definitions": (List[str]) the definitions of the word,
+                               left out if include_definitions is False
+            }
+        """
+        definitions = self.answers.get(word)
+        result = {"correct": definitions is not None}
+        if include_definitions:
+            result["definitions"] = list(definitions or [])
+        return result
+
+
+class GameSessions:
+    """
+    A bounded, expiring set of game sessions, looked up by id.
+    """
+
+    def __init__(
+        self,
+        max_sessions: int = 10000,
+        ttl: Union[float, None] = 3600,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            max_sessions (int): The most sessions held, the least recently
+                                used is dropped to make room.
+            ttl (float | None): Seconds a session lasts after it was last
+                                used, None to keep sessions until dropped.
+            clock (Callable[[], float]): The time source, in seconds.
+
+        Raises:
+            ValueError: If max_sessions is not positive
+                        or ttl is not positive.
+        """
+        if max_sessions < 1:
+            raise ValueError("max_sessions must be positive")
+        self._sessions = ResultCache(
+            max_size=max_sessions, ttl=ttl, clock=clock
+        )
+
+    def create(
+        self,
+        letters: str,
+        words: Iterable[str],
+        word_index: dict,
+        version: Union[str, None] = None
+    ) -> str:
+        """
+        Register a rack with the words that can be made from it.
+
+        Args:
+            letters (str): The letters of the rack, in any case and order.
+            words (Iterable[str]): The words that can be made from the rack.
+            word_index (dict): The records of the dictionary by word,
+                               see CreateDict.create_word_index.
+            version (str | None): The version of the dictionary.
+
+        Returns:
+            str: The id of the new session.
+        """
+        answers = {
+            word: [
+                definition
+                for record in word_index.get(word, ())
+                for definition in get_definitions(record)
+            ]
+            for word in words
+        }
+        session_id = secrets.token_urlsafe(16)
+        self._sessions.put(
+            session_id,
+            GameSession(canonical_rack(letters), answers, version)
+        )
+        return session_id
+
+    def get(self, session_id: str) -> Union[GameSession, None]:
+        """
+        Get a session, renewing its time to live.
+
+        Args:
+            session_id (str): The id of the session.
+
+        Returns:
+            GameSession | None: The session, None if there is no such
+                                session or it has expired.
+        """
+        session = self._sessions.get(session_id)
+        if session is not None:
+            # put again, so the time to live counts from the last use
+            self._sessions.put(session_id, session)
+        return session
+
+    def stats(self) -> dict:
+        """
+        Returns:
+            dict: The size, max_size, hits, misses and evictions of the
+                  sessions, see ResultCache.stats.
+        """
+        return self._sessions.stats()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
@@ -0,0 +1,295 @@
+import csv
+import hashlib
+import json
+import os
+import string
+from typing import Iterable, List, Set, Union
+
+from LettersGame.BloomFilter import remove_bloom_filter
+from LettersGame.CreateDict import (
+    add_to_dict,
+    get_definitions,
+    initialise_dict,
+    parse_row
+)
+
+"""
+A dictionary compiled into a directory so it can be updated in place:
+
+    <directory>/manifest.json
+    <directory>/<first letter>.json, the buckets of each first letter
+                                     as in the dictionary (see CreateDict)
+
+The manifest records the checksums of the sources it was built from:
+
+{
+    "version": SHARDS_VERSION,
+    "source": the SHA-256 of the dataset CSV,
+    "deltas": [the SHA-256 of each delta CSV applied, in order]
+}
+
+A delta CSV has the columns of the dataset after an action:
+
+    add,word,count,part of speech,definition
+    remove,word                          removes the word
+    remove,word,,,definition             removes one definition of the word
+
+update_dict only re-reads the dataset if its checksum has changed, only
+applies deltas it has not applied before, and only rewrites the files of
+the first letters whose words changed, so re-running it with unchanged
+sources writes nothing. An update which writes removes the Bloom filter
+of the dictionary (see BloomFilter), as it no longer holds every word.
+"""
+
+MANIFEST_NAME = "manifest.json"
+SHARDS_VERSION = 1
+ADD_ACTION = "add"
+REMOVE_ACTION = "remove"
+
+
+def update_dict(
+    directory: str,
+    csv_file_path: str,
+    delta_paths: Iterable[str] = ()
+) -> Union[List[str], None]:
+    """
+    Bring the compiled dictionary in directory up to date with
+    the dataset and the delta CSVs, creating it if needed.
+
+    Args:
+        directory (str): The directory of the compiled dictionary.
+        csv_file_path (str): The path to the dataset CSV.
+        delta_paths (Iterable[str]): The delta CSVs to apply, in order.
+
+    Returns:
+        List[str] | None: The first letters whose files were rewritten,
+                          empty if it was already up to date,
+                          None if it could not be updated.
+    """
+    try:
+        manifest = read_manifest(directory)
+        source = file_checksum(csv_file_path)
+        delta_paths = list(delta_paths)
+        deltas = [file_checksum(path) for path in delta_paths]
+
+        if manifest is None or manifest["source"] != source:
+            # the dataset changed, so every delta is applied again to it
+            dictionary = read_dataset(csv_file_path)
+            changed = set(string.ascii_lowercase)
+            manifest = {
+                "version": SHARDS_VERSION,
+                "source": source,
+                "deltas": [],
+            }
+        else:
+            dictionary = None
+            changed = set()
+
+        for path, checksum in zip(delta_paths, deltas):
+            if checksum in manifest["deltas"]:
+                continue
+            if dictionary is None:
+                dictionary = load_dict_shards(directory)
+            changed |= apply_delta(dictionary, path)
+            manifest["deltas"].append(checksum)
+
+        if dictionary is None:
+            return []
+
+        os.makedirs(directory, exist_ok=True)
+        for first_letter in sorted(changed):
+            write_json(
+                os.path.join(directory, f"{first_letter}.json"),
+                dictionary[first_letter]
+            )
+        # written last, so an interrupted update is redone next time
+        write_json(os.path.join(directory, MANIFEST_NAME), manifest)
+        remove_bloom_filter(directory)
+    except Exception as e:
+        print(f"Error: {e}")
+        return None
+
+    return sorted(changed)
+
+
+def read_dataset(csv_file_path: str) -> dict:
+    """
+    Read every word of the dataset CSV into a new dictionary,
+    as CreateDict.create_dict does.
+
+    Args:
+        csv_file_path (str): The path to the dataset CSV.
+
+    Returns:
+        dict: The dictionary.
+    """
+    dictionary = initialise_dict()
+    word_index = {}
+    with open(csv_file_path, 'r') as file:
+        for row in csv.reader(file):
+            entry = parse_row(row)
+            if entry is not None:
+                add_to_dict(dictionary, *entry, word_index)
+    return dictionary
+
+
+def apply_delta(dictionary: dict, delta_path: str) -> Set[str]:
+    """
+    Apply the adds and removes of a delta CSV to the dictionary.
+
+    Args:
+        dictionary (dict): The dictionary to update.
+        delta_path (str): The path to the delta CSV.
+
+    Raises:
+        ValueError: If a row has an unknown action.
+
+    Returns:
+        Set[str]: The first letters of the words that changed.
+    """
+    changed = set()
+    with open(delta_path, 'r') as file:
+        for row in csv.reader(file):
+            if not row:
+                continue
+            action, row = row[0].strip().lower(), row[1:]
+
+            if action == ADD_ACTION:
+                entry = parse_row(row)
+                if entry is not None:
+                    add_to_dict(dictionary, *entry)
+                    changed.add(entry[0][0])
+            elif action == REMOVE_ACTION:
+                word = row[0].lower()
+                definition = row[3] if len(row) > 3 and row[3] else None
+                if remove_from_dict(dictionary, word, definition):
+                    changed.add(word[0])
+            else:
+                raise ValueError(f"Unknown delta action {action}")
+
+    return changed
+
+
+def remove_from_dict(
+    dictionary: dict,
+    word: str,
+    definition: Union[str, None] = None
+) -> bool:
+    """
+    Remove a word, or one of its definitions, from the dictionary.
+    A word left without definitions is removed.
+
+    Args:
+        dictionary (dict): The dictionary to remove from.
+        word (str): The word to remove.
+        definition (str | None): The definition to remove,
+                                 None to remove the whole word.
+
+    Returns:
+        bool: True if the dictionary changed.
+    """
+    if len(word) < 2 or any(
+        char not in string.ascii_lowercase for char in word[:2]
+    ):
+        return False
+
+    bucket = dictionary[word[0]][word[1]]
+    for index, record in enumerate(bucket):
+        if record["word"] != word:
+            continue
+        if definition is not None:
+            definitions = get_definitions(record)
+            if definition not in definitions:
+                return False
+            record["definitions"] = [
+                d for d in definitions if d != definition
+            ]
+            record.pop("definition", None)
+            if record["definitions"]:
+                return True
+        del bucket[index]
+        return True
+
+    return False
+
+
+def load_dict_shards(directory: str) -> dict:
+    """
+    Load a dictionary compiled by update_dict.
+
+    Args:
+        directory (str): The directory of the compiled dictionary.
+
+    Raises:
+        ValueError: If the directory has no manifest of a supported version.
+
+    Returns:
+        dict: The dictionary.
+    """
+    if read_manifest(directory) is None:
+        raise ValueError(f"{directory} is not a compiled dictionary")
+
+    dictionary = initialise_dict()
+    for first_letter in string.ascii_lowercase:
+        with open(os.path.join(directory, f"{first_letter}.json"), 'r') as file:
+            dictionary[first_letter].update(json.load(file))
+    return dictionary
+
+
+def read_manifest(directory: str) -> Union[dict, None]:
+    """
+    Args:
+        directory (str): The directory of the compiled dictionary.
+
+    Returns:
+        dict | None: The manifest, None if there is none
+                     or it is of an unsupported version.
+    """
+    try:
+        with open(os.path.join(directory, MANIFEST_NAME), 'r') as file:
+            manifest = json.load(file)
+    except FileNotFoundError:
+        return None
+    if manifest.get("version") != SHARDS_VERSION:
+        return None
+    return manifest
+
+
+def is_dict_shards(file_path: str) -> bool:
+    """
+    Args:
+        file_path (str): The path to a dictionary.
+
+    Returns:
+        bool: True if the path is a directory with a manifest.
+    """
+    return os.path.isfile(os.path.join(file_path, MANIFEST_NAME))
+
+
+def file_checksum(file_path: str) -> str:
+    """
+    Args:
+        file_path (str): The path to the file.
+
+    Returns:
+        str: The SHA-256 of the file, in hex.
+    """
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as file:
+        for block in iter(lambda: file.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def write_json(file_path: str, value) -> None:
+    """
+    Write a value as JSON, replacing the file only once it is complete.
+
+    Args:
+        file_path (str): The path to write to.
+        value: The value to write.
+    """
+    temporary_path = file_path + ".tmp"
+    with open(temporary_path, 'w') as file:
+        json.dump(value, file)
+    os.replace(temporary_path, file_path)
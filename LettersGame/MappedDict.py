@@ -0,0 +1,500 @@
+import mmap
+import string
+import sys
+from array import array
+from collections.abc import Mapping, Sequence
+from typing import Iterator, List, Tuple, Union
+
+from LettersGame.BinaryDict import (
+    ALPHABET_SIZE,
+    DEFINITIONS_MAGIC,
+    definitions_path,
+    hash_table_lookup,
+    read_array,
+    read_header,
+    section_bytes,
+    word_count_vector
+)
+
+"""
+A read only view of a binary dictionary (see BinaryDict) through mmap.
+
+Nothing is decoded up front, records are read from the mapping as they are
+accessed, so processes opening the same file share its pages through the
+OS page cache rather than each holding a copy of the dictionary.
+
+It has the same shape as the nested dictionary described in CreateDict:
+    mapped_dict["first letter"]["second letter"] -> the records of the bucket
+and carries a signature index usable by solve_countdown_by_signature
+and a word index usable by check_answer, both looked up in hash tables
+of the file.
+
+The definitions side file is only mapped the first time a definition
+is read, by word id, so solving without definitions never touches it.
+"""
+
+
+class MappedDict(Mapping):
+    """
+    A nested dictionary of words backed by a memory mapped binary dictionary.
+    """
+
+    def __init__(self, file_path: str):
+        """
+        Map the binary dictionary at file_path.
+
+        Args:
+            file_path (str): The path to the binary dictionary.
+
+        Raises:
+            ValueError: If the file is not a binary dictionary of a
+                        supported version.
+        """
+        self.file_path = file_path
+        self._mmap, self._data = map_file(file_path)
+
+        self.header = read_header(self._data)
+        self._buckets = view_array(self._data, self.header, "I", "buckets")
+        self._word_offsets = view_array(
+            self._data, self.header, "I", "word_offsets"
+        )
+        self._masks = view_array(self._data, self.header, "I", "masks")
+        self._signatures = view_array(
+            self._data, self.header, "I", "signatures"
+        )
+        self._words = section_bytes(self._data, self.header, "words")
+        self._counts = section_bytes(self._data, self.header, "counts")
+        self._definitions = None
+        self.signature_index = MappedSignatureIndex(self, self._signatures)
+        # files written before the word_hashes section have no word index
+        self._word_hashes = None
+        self.word_index = None
+        if "word_hashes" in self.header["sections"]:
+            self._word_hashes = view_array(
+                self._data, self.header, "I", "word_hashes"
+            )
+            self.word_index = MappedWordIndex(self, self._word_hashes)
+
+    def __getitem__(self, first_letter: str) -> "MappedRow":
+        if (
+            len(first_letter) != 1 or
+            first_letter not in string.ascii_lowercase
+        ):
+            raise KeyError(first_letter)
+        return MappedRow(self, string.ascii_lowercase.index(first_letter))
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(string.ascii_lowercase)
+
+    def __len__(self) -> int:
+        return ALPHABET_SIZE
+
+    @property
+    def word_count(self) -> int:
+        """
+        int: The number of words in the dictionary.
+        """
+        return self.header["word_count"]
+
+    def bucket(self, bucket: int) -> "MappedBucket":
+        """
+        Get the records of a bucket by its index.
+
+        Args:
+            bucket (int): first letter index * 26 + second letter index
+
+        Returns:
+            MappedBucket: The records in the bucket.
+        """
+        return MappedBucket(
+            self, self._buckets[bucket], self._buckets[bucket + 1]
+        )
+
+    def word(self, index: int) -> str:
+        """
+        Args:
+            index (int): The id of the word.
+
+        Returns:
+            str: The word.
+        """
+        return str(
+            self._words[
+                self._word_offsets[index]:self._word_offsets[index + 1]
+            ],
+            "ascii"
+        )
+
+    def definitions(self, index: int) -> List[str]:
+        """
+        Args:
+            index (int): The id of the word.
+
+        Returns:
+            List[str]: The definitions of the word.
+        """
+        if self._definitions is None:
+            self._definitions = MappedDefinitions(
+                definitions_path(self.file_path)
+            )
+        return self._definitions.definitions(index)
+
+    def letter_mask(self, index: int) -> int:
+        """
+        Args:
+            index (int): The id of the word.
+
+        Returns:
+            int: The letter mask of the word.
+        """
+        return self._masks[index]
+
+    def count_vector(self, index: int) -> memoryview:
+        """
+        Args:
+            index (int): The id of the word.
+
+        Returns:
+            memoryview: The 26 byte count vector of the word.
+        """
+        return self._counts[index * ALPHABET_SIZE:(index + 1) * ALPHABET_SIZE]
+
+    def packed_counts(self, index: int) -> int:
+        """
+        Args:
+            index (int): The id of the word.
+
+        Returns:
+            int: The packed counts of the word, see
+                 CreateDict.pack_letter_counts.
+        """
+        return int.from_bytes(self.count_vector(index), "little")
+
+    def count_vectors(self) -> memoryview:
+        """
+        Returns:
+            memoryview: The count vectors of every word by id,
+                        26 bytes each, see CreateDict.create_count_matrix.
+        """
+        return self._counts
+
+    def records(self) -> "MappedBucket":
+        """
+        Returns:
+            MappedBucket: The records of every word, by id.
+        """
+        return MappedBucket(self, 0, self.word_count)
+
+    def close(self) -> None:
+        """
+        Unmap the file, records must not be used afterwards.
+        """
+        if self._definitions is not None:
+            self._definitions.close()
+        release_views(self._mmap, self._data, (
+            self._buckets,
+            self._word_offsets,
+            self._masks,
+            self._signatures,
+            self._word_hashes,
+            self._words,
+            self._counts,
+        ))
+
+
+class MappedDefinitions:
+    """
+    The definitions side file of a binary dictionary, read by word id.
+    """
+
+    def __init__(self, file_path: str):
+        """
+        Map the definitions side file at file_path.
+
+        Args:
+            file_path (str): The path to the definitions.
+
+        Raises:
+            ValueError: If the file is not a definitions file of a
+                        supported version.
+        """
+        self._mmap, self._data = map_file(file_path)
+        self.header = read_header(self._data, DEFINITIONS_MAGIC)
+        self._ranges = view_array(self._data, self.header, "I", "def_ranges")
+        self._offsets = view_array(
+            self._data, self.header, "Q", "def_offsets"
+        )
+        self._definitions = section_bytes(
+            self._data, self.header, "definitions"
+        )
+
+    def definitions(self, index: int) -> List[str]:
+        """
+        Args:
+            index (int): The id of the word.
+
+        Returns:
+            List[str]: The definitions of the word.
+        """
+        return [
+            str(
+                self._definitions[
+                    self._offsets[definition]:self._offsets[definition + 1]
+                ],
+                "utf-8"
+            )
+            for definition in range(
+                self._ranges[index], self._ranges[index + 1]
+            )
+        ]
+
+    def close(self) -> None:
+        """
+        Unmap the file.
+        """
+        release_views(self._mmap, self._data, (
+            self._ranges,
+            self._offsets,
+            self._definitions,
+        ))
+
+
+def map_file(file_path: str) -> Tuple[mmap.mmap, memoryview]:
+    """
+    Map a file read only.
+
+    Args:
+        file_path (str): The path to the file.
+
+    Returns:
+        Tuple[mmap.mmap, memoryview]: The mapping and a view of it.
+    """
+    with open(file_path, 'rb') as file:
+        mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    return mapping, memoryview(mapping)
+
+
+def view_array(
+    data: memoryview,
+    header: dict,
+    typecode: str,
+    name: str
+) -> Union[memoryview, array]:
+    """
+    View a section of a mapped file as an array of integers.
+
+    Args:
+        data (memoryview): The view of the mapped file.
+        header (dict): The header returned by read_header.
+        typecode (str): The array typecode of the section.
+        name (str): The name of the section.
+
+    Returns:
+        memoryview | array: The values of the section, viewed in place on
+                            little endian machines and copied otherwise.
+    """
+    if sys.byteorder == "little":
+        return section_bytes(data, header, name).cast(typecode)
+    return read_array(typecode, data, header, name)
+
+
+def release_views(mapping: mmap.mmap, data: memoryview, views: tuple) -> None:
+    """
+    Release the views of a mapped file then unmap it.
+
+    Args:
+        mapping (mmap.mmap): The mapping.
+        data (memoryview): The view of the whole mapping.
+        views (tuple): The views of sections of the mapping.
+    """
+    for view in views:
+        if isinstance(view, memoryview):
+            view.release()
+    data.release()
+    mapping.close()
+
+
+class MappedRow(Mapping):
+    """
+    The buckets of every second letter for one first letter.
+    """
+
+    def __init__(self, source: MappedDict, first: int):
+        self._source = source
+        self._first = first
+
+    def __getitem__(self, second_letter: str) -> "MappedBucket":
+        if (
+            len(second_letter) != 1 or
+            second_letter not in string.ascii_lowercase
+        ):
+            raise KeyError(second_letter)
+        return self._source.bucket(
+            self._first * ALPHABET_SIZE +
+            string.ascii_lowercase.index(second_letter)
+        )
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(string.ascii_lowercase)
+
+    def __len__(self) -> int:
+        return ALPHABET_SIZE
+
+
+class MappedBucket(Sequence):
+    """
+    The records of one bucket, created as they are accessed.
+    """
+
+    def __init__(self, source: MappedDict, start: int, end: int):
+        self._source = source
+        self._start = start
+        self._end = end
+
+    def __getitem__(self, index: int) -> "MappedRecord":
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        return MappedRecord(self._source, self._start + index)
+
+    def __iter__(self) -> Iterator["MappedRecord"]:
+        for index in range(self._start, self._end):
+            yield MappedRecord(self._source, index)
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+
+class MappedRecord(Mapping):
+    """
+    A record of the dictionary, read from the mapping when a key is accessed.
+    """
+
+    __slots__ = ("_source", "_index")
+
+    KEYS = ("word", "definitions", "count", "letter_mask", "packed_counts")
+
+    def __init__(self, source: MappedDict, index: int):
+        self._source = source
+        self._index = index
+
+    def __getitem__(self, key: str):
+        if key == "letter_mask":
+            return self._source.letter_mask(self._index)
+        if key == "packed_counts":
+            return self._source.packed_counts(self._index)
+        if key == "word":
+            return self._source.word(self._index)
+        if key == "definitions":
+            return self._source.definitions(self._index)
+        if key == "count":
+            return len(self._source.word(self._index))
+        raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.KEYS
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.KEYS)
+
+    def __len__(self) -> int:
+        return len(self.KEYS)
+
+    @property
+    def index(self) -> int:
+        """
+        int: The id of the word in the binary dictionary.
+        """
+        return self._index
+
+
+class MappedSignatureIndex:
+    """
+    The signature index of a mapped dictionary, looked up in the
+    signatures hash table of the file rather than built in memory.
+    """
+
+    def __init__(self, source: MappedDict, slots: memoryview):
+        self._source = source
+        self._slots = slots
+
+    def get(self, signature: str, default=None) -> Union[list, None]:
+        """
+        Get the records of every word with a sorted-letter signature.
+
+        Args:
+            signature (str): The sorted letters of the word.
+            default: Returned if no word has the signature.
+
+        Returns:
+            list[MappedRecord] | default: The records with the signature.
+        """
+        # only the letters a to z have a place in the count vector
+        if not (signature.isascii() and signature.isalpha()
+                and signature.islower()):
+            return default
+        vector = word_count_vector(signature)
+        records = [
+            MappedRecord(self._source, index)
+            for index in hash_table_lookup(
+                self._slots,
+                vector,
+                lambda index: self._source.count_vector(index) == vector
+            )
+        ]
+        return records if records else default
+
+    def __getitem__(self, signature: str) -> list:
+        records = self.get(signature)
+        if records is None:
+            raise KeyError(signature)
+        return records
+
+    def __contains__(self, signature: str) -> bool:
+        return self.get(signature) is not None
+
+
+class MappedWordIndex:
+    """
+    The word index of a mapped dictionary, looked up in the
+    word_hashes hash table of the file rather than built in memory.
+    """
+
+    def __init__(self, source: MappedDict, slots: memoryview):
+        self._source = source
+        self._slots = slots
+
+    def get(self, word: str, default=None) -> Union[list, None]:
+        """
+        Get the records of a word.
+
+        Args:
+            word (str): The lowercase word.
+            default: Returned if the word is not in the dictionary.
+
+        Returns:
+            list[MappedRecord] | default: The records of the word.
+        """
+        if not word.isascii():
+            return default
+        records = [
+            MappedRecord(self._source, index)
+            for index in hash_table_lookup(
+                self._slots,
+                word.encode("ascii"),
+                lambda index: self._source.word(index) == word
+            )
+        ]
+        return records if records else default
+
+    def __getitem__(self, word: str) -> list:
+        records = self.get(word)
+        if records is None:
+            raise KeyError(word)
+        return records
+
+    def __contains__(self, word: str) -> bool:
+        return self.get(word) is not None
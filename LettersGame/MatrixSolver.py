@@ -0,0 +1,225 @@
+from itertools import islice
+from typing import Iterable, Iterator, List, Union
+
+from LettersGame.BinaryDict import word_count_vector
+from LettersGame.CountdownSolver import add_found_word, found_results
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional, only this engine needs it
+    np = None
+
+"""
+Solves racks with numpy over the count matrix of the dictionary
+(see CreateDict.create_count_matrix), rather than checking each record
+in Python: a word can be formed from a rack if no letter count in its
+row of the matrix is more than the count of that letter in the rack.
+
+The comparison is made a letter at a time over the transposed counts,
+as reducing each (26,) row of the matrix is many times slower.
+
+Several racks can be solved at once as a (number of racks, 26) matrix,
+in chunks so the (racks, words) comparison stays a bounded size.
+"""
+
+NUMPY_AVAILABLE = np is not None
+
+
+def rack_vector(letters: str) -> "np.ndarray":
+    """
+    Args:
+        letters (str): The lowercase letters of the rack.
+
+    Returns:
+        np.ndarray: The (26,) uint8 count vector of the rack.
+    """
+    return np.frombuffer(word_count_vector(letters), dtype=np.uint8)
+
+
+def matching_words(
+    letters: str,
+    matrix: dict,
+    min_length: int = 2
+) -> "np.ndarray":
+    """
+    Find every word in the count matrix that can be formed from the rack.
+
+    Args:
+        letters (str): The lowercase letters of the rack.
+        matrix (dict): The count matrix created by
+                       CreateDict.create_count_matrix.
+        min_length (int): Only find words at least this long.
+
+    Returns:
+        np.ndarray: The rows of the words, longest first.
+    """
+    found = matrix["lengths"] >= max(min_length, 2)
+    for counts, rack_count in zip(
+        matrix["letter_counts"], rack_vector(letters).tolist()
+    ):
+        found &= counts <= rack_count
+    return longest_first(np.flatnonzero(found), matrix)
+
+
+def longest_first(rows: "np.ndarray", matrix: dict) -> "np.ndarray":
+    """
+    Args:
+        rows (np.ndarray): Rows of the count matrix.
+        matrix (dict): The count matrix.
+
+    Returns:
+        np.ndarray: The rows ordered by the length of their word,
+                    longest first, otherwise in the order given.
+    """
+    lengths = matrix["lengths"][rows].astype(np.int32)
+    return rows[np.argsort(-lengths, kind="stable")]
+
+
+def solve_countdown_matrix(
+    letters: str,
+    matrix: dict,
+    include_definitions: bool = True,
+    limit: Union[int, None] = None,
+    min_length: int = 2
+) -> List[dict]:
+    """
+    Solve the Countdown letters game with one vectorised comparison
+    of the rack against the count matrix of every word.
+    Records of the same word are merged into one result.
+
+    Args:
+        letters (str): The letters provided for the game.
+        matrix (dict): The count matrix created by
+                       CreateDict.create_count_matrix.
+        include_definitions (bool): If False the definitions are
+                                    not read and left out of the results.
+        limit (int | None): Only return this many of the longest words,
+                            longest first.
+        min_length (int): Only return words at least this long.
+
+    Returns:
+        list[dict]: A list of dictionaries containing the words,
+                    their definitions, and the word lengths, longest first.
+    """
+    return matrix_results(
+        matching_words(letters, matrix, min_length),
+        matrix,
+        include_definitions,
+        limit
+    )
+
+
+def iter_countdown_matrix(
+    letters: str,
+    matrix: dict,
+    include_definitions: bool = True,
+    min_length: int = 2
+) -> Iterator[dict]:
+    """
+    Yields the results of solve_countdown_matrix, longest first.
+    The comparison finds every word at once, only the results
+    are created as they are taken.
+
+    Args:
+        letters (str): The letters provided for the game.
+        matrix (dict): The count matrix created by
+                       CreateDict.create_count_matrix.
+        include_definitions (bool): If False the definitions are
+                                    not read and left out of the results.
+        min_length (int): Only yield words at least this long.
+
+    Yields:
+        dict: {"word", "definition", "length"},
+              see CountdownSolver.word_result
+    """
+    rows = matching_words(letters, matrix, min_length)
+    lengths = matrix["lengths"][rows]
+    # the records of a word all have the same length,
+    # so the words of each length are merged then yielded
+    for length in np.unique(lengths)[::-1]:
+        yield from matrix_results(
+            rows[lengths == length], matrix, include_definitions
+        )
+
+
+def solve_racks_matrix(
+    racks: Iterable[str],
+    matrix: dict,
+    include_definitions: bool = True,
+    limit: Union[int, None] = None,
+    min_length: int = 2,
+    chunk_size: int = 32
+) -> Iterator[List[dict]]:
+    """
+    Solve many racks, comparing a chunk of racks against
+    the count matrix at once.
+
+    Args:
+        racks (Iterable[str]): The lowercase racks to solve.
+        matrix (dict): The count matrix created by
+                       CreateDict.create_count_matrix.
+        include_definitions (bool): If False the definitions are
+                                    not read and left out of the results.
+        limit (int | None): Only return this many of the longest words.
+        min_length (int): Only return words at least this long.
+        chunk_size (int): The number of racks compared at once, each
+                          needs a byte per word of working memory.
+
+    Raises:
+        ValueError: If chunk_size is not positive.
+
+    Yields:
+        List[dict]: The answers to each rack, in the order of racks,
+                    as returned by solve_countdown_matrix.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+
+    long_enough = matrix["lengths"] >= max(min_length, 2)
+    racks = iter(racks)
+
+    while True:
+        chunk = list(islice(racks, chunk_size))
+        if not chunk:
+            return
+
+        rack_counts = np.stack([rack_vector(letters) for letters in chunk])
+        found = np.repeat(long_enough[None, :], len(chunk), axis=0)
+        # one letter at a time keeps the comparison (racks, words)
+        # rather than (racks, words, 26)
+        for letter, counts in enumerate(matrix["letter_counts"]):
+            found &= counts <= rack_counts[:, letter, None]
+
+        for row in found:
+            yield matrix_results(
+                longest_first(np.flatnonzero(row), matrix),
+                matrix,
+                include_definitions,
+                limit
+            )
+
+
+def matrix_results(
+    rows: "np.ndarray",
+    matrix: dict,
+    include_definitions: bool = True,
+    limit: Union[int, None] = None
+) -> List[dict]:
+    """
+    Create the results of the words found in the count matrix.
+
+    Args:
+        rows (np.ndarray): The rows of the words found, longest first.
+        matrix (dict): The count matrix.
+        include_definitions (bool): If False the definitions are
+                                    not read and left out of the results.
+        limit (int | None): Only return this many results.
+
+    Returns:
+        list[dict]: The result of each word, in the order of rows.
+    """
+    found = {}
+    records = matrix["records"]
+    for row in rows.tolist():
+        add_found_word(found, records[row], include_definitions)
+    return found_results(found, include_definitions)[:limit]
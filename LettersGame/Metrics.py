@@ -0,0 +1,538 @@
+import bisect
+import heapq
+import math
+import threading
+import time
+from contextlib import contextmanager
+from operator import itemgetter
+from typing import Callable, Dict, Iterable, Iterator, List, Tuple, Union
+
+"""
+Metrics of a server, counted in process and rendered in the Prometheus text
+exposition format, so they can be scraped from an endpoint or read with curl
+without a Prometheus client library or server.
+
+A MetricsRegistry holds counters, gauges and histograms by name. Each metric
+has a fixed tuple of label names and a series for every combination of label
+values it has been given:
+
+    registry = MetricsRegistry()
+    requests = registry.counter(
+        "requests_total", "Requests served", ("endpoint",)
+    )
+    requests.inc(endpoint="/answers/get/")
+    registry.render()
+
+Histograms count observations into cumulative buckets of upper bounds, as
+Prometheus does, so quantiles of latencies can be estimated from them.
+
+Values kept elsewhere, such as the counters of a ResultCache, are read when
+the registry is rendered by collectors, functions returning metrics built
+for that render (see stats_metrics).
+
+HotKeys counts the most frequent keys of an unbounded set, such as racks,
+in bounded memory.
+"""
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# upper bounds in seconds, from half a millisecond to ten seconds
+DEFAULT_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+
+class Metric:
+    """
+    A named metric with a series of values for each combination of labels.
+    """
+
+    metric_type = "untyped"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        label_names: Tuple[str, ...] = ()
+    ):
+        """
+        Args:
+            name (str): The name of the metric.
+            help_text (str): What the metric measures.
+            label_names (Tuple[str, ...]): The names of its labels.
+        """
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(label_names)
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def render(self) -> List[str]:
+        """
+        Returns:
+            List[str]: The lines of the metric in the text format.
+        """
+        with self._lock:
+            series = [
+                (key, self._copy(value))
+                for key, value in self._series.items()
+            ]
+
+        lines = [
+            f"# HELP {self.name} {escape_help(self.help_text)}",
+            f"# TYPE {self.name} {self.metric_type}",
+        ]
+        for key, value in sorted(series):
+            labels = dict(zip(self.label_names, key))
+            for suffix, extra_labels, sample in self._samples(value):
+                lines.append(
+                    f"{self.name}{suffix}"
+                    f"{format_labels({**labels, **extra_labels})} "
+                    f"{format_value(sample)}"
+                )
+        return lines
+
+    def clear(self) -> None:
+        """
+        Remove every series.
+        """
+        with self._lock:
+            self._series.clear()
+
+    def _key(self, labels: Dict[str, str]) -> tuple:
+        if len(labels) != len(self.label_names) or any(
+            name not in labels for name in self.label_names
+        ):
+            raise ValueError(
+                f"{self.name} takes the labels "
+                f"{', '.join(self.label_names) or 'none'}"
+            )
+        return tuple(str(labels[name]) for name in self.label_names)
+
+    def _copy(self, value):
+        return value
+
+    def _samples(self, value) -> Iterable[Tuple[str, dict, float]]:
+        return [("", {}, value)]
+
+
+class Counter(Metric):
+    """
+    A total which only goes up.
+    """
+
+    metric_type = "counter"
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        """
+        Args:
+            amount (float): The amount to add.
+            **labels (str): The value of each label.
+
+        Raises:
+            ValueError: If amount is negative or the labels are wrong.
+        """
+        if amount < 0:
+            raise ValueError("a counter can only be increased")
+        key = self._key(labels)
+        with self._lock:
+            self._series[key] = self._series.get(key, 0) + amount
+
+    def value(self, **labels: str) -> float:
+        """
+        Args:
+            **labels (str): The value of each label.
+
+        Returns:
+            float: The total of the series, 0 if it was never increased.
+        """
+        key = self._key(labels)
+        with self._lock:
+            return self._series.get(key, 0)
+
+
+class Gauge(Metric):
+    """
+    A value which can go up and down.
+    """
+
+    metric_type = "gauge"
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        """
+        Args:
+            amount (float): The amount to add, negative to subtract.
+            **labels (str): The value of each label.
+        """
+        key = self._key(labels)
+        with self._lock:
+            self._series[key] = self._series.get(key, 0) + amount
+
+    def set(self, value: float, **labels: str) -> None:
+        """
+        Args:
+            value (float): The new value.
+            **labels (str): The value of each label.
+        """
+        key = self._key(labels)
+        with self._lock:
+            self._series[key] = value
+
+    def value(self, **labels: str) -> float:
+        """
+        Args:
+            **labels (str): The value of each label.
+
+        Returns:
+            float: The value of the series, 0 if it was never set.
+        """
+        key = self._key(labels)
+        with self._lock:
+            return self._series.get(key, 0)
+
+
+class Histogram(Metric):
+    """
+    Counts of observations at or below each of a set of upper bounds,
+    with their sum and count.
+    """
+
+    metric_type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        label_names: Tuple[str, ...] = (),
+        buckets: Iterable[float] = DEFAULT_BUCKETS
+    ):
+        """
+        Args:
+            name (str): The name of the metric.
+            help_text (str): What the metric measures.
+            label_names (Tuple[str, ...]): The names of its labels.
+            buckets (Iterable[float]): The upper bounds of the buckets,
+                                       +Inf is always added.
+
+        Raises:
+            ValueError: If there are no buckets.
+        """
+        super().__init__(name, help_text, label_names)
+        self.buckets = sorted(
+            {float(bound) for bound in buckets} - {math.inf}
+        )
+        if not self.buckets:
+            raise ValueError("a histogram needs at least one bucket")
+
+    def observe(self, value: float, **labels: str) -> None:
+        """
+        Args:
+            value (float): The value observed.
+            **labels (str): The value of each label.
+        """
+        key = self._key(labels)
+        # the first bucket whose upper bound is at least value,
+        # len(buckets) being the +Inf bucket
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [
+                    [0] * (len(self.buckets) + 1), 0.0, 0
+                ]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    @contextmanager
+    def time(self, **labels: str) -> Iterator[None]:
+        """
+        Observe the seconds taken by the body of a with statement.
+
+        Args:
+            **labels (str): The value of each label.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def count(self, **labels: str) -> int:
+        """
+        Args:
+            **labels (str): The value of each label.
+
+        Returns:
+            int: The number of values observed in the series.
+        """
+        key = self._key(labels)
+        with self._lock:
+            series = self._series.get(key)
+            return series[2] if series else 0
+
+    def _copy(self, value):
+        return [list(value[0]), value[1], value[2]]
+
+    def _samples(self, value) -> Iterable[Tuple[str, dict, float]]:
+        counts, total, count = value
+        cumulative = 0
+        for bound, bucket_count in zip(
+            self.buckets + [math.inf], counts
+        ):
+            cumulative += bucket_count
+            yield "_bucket", {"le": format_value(bound)}, cumulative
+        yield "_sum", {}, total
+        yield "_count", {}, count
+
+
+class MetricsRegistry:
+    """
+    The metrics of a process, rendered together.
+    """
+
+    def __init__(self):
+        self._metrics = {}
+        self._collectors = []
+        self._lock = threading.Lock()
+
+    def counter(
+        self,
+        name: str,
+        help_text: str,
+        label_names: Tuple[str, ...] = ()
+    ) -> Counter:
+        """
+        Get the counter of a name, registering it if it is new.
+
+        Raises:
+            ValueError: If the name is registered as another type of metric.
+        """
+        return self._register(Counter, name, help_text, label_names)
+
+    def gauge(
+        self,
+        name: str,
+        help_text: str,
+        label_names: Tuple[str, ...] = ()
+    ) -> Gauge:
+        """
+        Get the gauge of a name, registering it if it is new.
+
+        Raises:
+            ValueError: If the name is registered as another type of metric.
+        """
+        return self._register(Gauge, name, help_text, label_names)
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str,
+        label_names: Tuple[str, ...] = (),
+        buckets: Iterable[float] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        """
+        Get the histogram of a name, registering it if it is new.
+
+        Raises:
+            ValueError: If the name is registered as another type of metric.
+        """
+        return self._register(
+            Histogram, name, help_text, label_names, buckets
+        )
+
+    def add_collector(self, collector: Callable[[], Iterable[Metric]]):
+        """
+        Add a function called on each render,
+        returning metrics to render with the registered ones.
+
+        Args:
+            collector (Callable[[], Iterable[Metric]]): The function.
+        """
+        with self._lock:
+            self._collectors.append(collector)
+
+    def render(self) -> str:
+        """
+        Returns:
+            str: Every metric in the Prometheus text exposition format.
+        """
+        with self._lock:
+            metrics = list(self._metrics.values())
+            collectors = list(self._collectors)
+        for collector in collectors:
+            metrics.extend(collector())
+
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def _register(self, metric_class, name: str, *args) -> Metric:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = metric_class(name, *args)
+            elif type(metric) is not metric_class:
+                raise ValueError(
+                    f"{name} is already registered as a {metric.metric_type}"
+                )
+            return metric
+
+
+class HotKeys:
+    """
+    Approximate counts of the most frequent keys, keeping at most max_keys.
+
+    When a new key arrives and max_keys are held, the least counted key is
+    replaced and the new key starts from its count plus one (the Space-Saving
+    algorithm), so a count is never too low and any key seen more often than
+    1 / max_keys of the time is held.
+
+    The least counted key is found with a min-heap of (count, key) entries,
+    one per key. A count seen again is only increased in the dict, leaving
+    its entry behind; stale entries are brought up to date as they reach
+    the top of the heap, so each add is O(log max_keys) amortised.
+    """
+
+    def __init__(self, max_keys: int = 1000):
+        """
+        Args:
+            max_keys (int): The most keys counted.
+
+        Raises:
+            ValueError: If max_keys is not positive.
+        """
+        if max_keys < 1:
+            raise ValueError("max_keys must be positive")
+        self.max_keys = max_keys
+        self._counts = {}
+        self._heap = []
+        self._lock = threading.Lock()
+
+    def add(self, key: str) -> None:
+        """
+        Args:
+            key (str): The key seen.
+        """
+        with self._lock:
+            count = self._counts.get(key)
+            if count is not None:
+                self._counts[key] = count + 1
+                return
+            floor = 0
+            if len(self._counts) >= self.max_keys:
+                floor = self._pop_least()
+            self._counts[key] = floor + 1
+            heapq.heappush(self._heap, (floor + 1, key))
+
+    def top(self, n: int) -> List[Tuple[str, int]]:
+        """
+        Args:
+            n (int): The number of keys.
+
+        Returns:
+            List[Tuple[str, int]]: The n most counted keys and their counts,
+                                   most counted first.
+        """
+        with self._lock:
+            return heapq.nlargest(
+                n, self._counts.items(), key=itemgetter(1)
+            )
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def _pop_least(self) -> int:
+        # an entry's count is at most its key's, so an up to date entry
+        # at the top of the heap is the least counted key
+        while True:
+            count, key = self._heap[0]
+            current = self._counts[key]
+            if count == current:
+                heapq.heappop(self._heap)
+                del self._counts[key]
+                return count
+            heapq.heapreplace(self._heap, (current, key))
+
+
+def stats_metrics(
+    prefix: str,
+    help_text: str,
+    stats: Dict[str, Union[int, float, bool, None]],
+    counters: Iterable[str] = ()
+) -> List[Metric]:
+    """
+    Build the metrics of a stats dict, such as ResultCache.stats,
+    a gauge for each value and a counter for each of counters.
+
+    Values which are None or not numbers are left out.
+
+    Args:
+        prefix (str): The start of the names of the metrics.
+        help_text (str): What the stats are of.
+        stats (Dict[str, int | float | bool | None]): The stats.
+        counters (Iterable[str]): The keys of the stats which are totals,
+                                  named with a _total suffix.
+
+    Returns:
+        List[Metric]: The metrics.
+    """
+    counters = set(counters)
+    metrics = []
+    for key, value in stats.items():
+        if isinstance(value, bool):
+            value = int(value)
+        if not isinstance(value, (int, float)):
+            continue
+        if key in counters:
+            metric = Counter(f"{prefix}_{key}_total", f"{help_text} {key}")
+            metric.inc(value)
+        else:
+            metric = Gauge(f"{prefix}_{key}", f"{help_text} {key}")
+            metric.set(value)
+        metrics.append(metric)
+    return metrics
+
+
+def format_value(value: float) -> str:
+    """
+    Args:
+        value (float): A sample value or bucket bound.
+
+    Returns:
+        str: The value in the text format.
+    """
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    if isinstance(value, int):
+        return str(value)
+    return repr(float(value))
+
+
+def format_labels(labels: Dict[str, str]) -> str:
+    """
+    Args:
+        labels (Dict[str, str]): The labels of a sample.
+
+    Returns:
+        str: The labels in the text format, empty if there are none.
+    """
+    if not labels:
+        return ""
+    return "{" + ",".join(
+        f'{name}="{escape_label(value)}"' for name, value in labels.items()
+    ) + "}"
+
+
+def escape_label(value: str) -> str:
+    return (
+        value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+    )
+
+
+def escape_help(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
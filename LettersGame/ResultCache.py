@@ -0,0 +1,162 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Hashable, Union
+
+"""
+A bounded least recently used cache of solver results.
+
+The answers to a rack do not depend on the order of its letters, so results
+are keyed on the canonical rack, its lowercase letters sorted, together with
+the options of the query; "STARELINE" and "elinestar" share one entry.
+
+Entries older than the time to live are treated as missing, and the whole
+cache is invalidated when the dictionary it was filled from is replaced.
+"""
+
+
+def canonical_rack(letters: str) -> str:
+    """
+    Get the canonical form of a rack, shared by all of its anagrams.
+
+    Args:
+        letters (str): The letters of the rack, in any case and order.
+
+    Returns:
+        str: The lowercase letters of the rack in sorted order.
+    """
+    return "".join(sorted(letters.lower()))
+
+
+class ResultCache:
+    """
+    A thread safe LRU cache with an optional time to live,
+    counting its hits, misses and evictions.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        ttl: Union[float, None] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            max_size (int): The most entries held, the least recently used
+                            is evicted to make room. 0 disables the cache.
+            ttl (float | None): Seconds an entry is served for,
+                                None to keep entries until evicted.
+            clock (Callable[[], float]): The time source, in seconds.
+
+        Raises:
+            ValueError: If max_size is negative or ttl is not positive.
+        """
+        if max_size < 0:
+            raise ValueError("max_size must not be negative")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be positive")
+
+        self.max_size = max_size
+        self.ttl = ttl
+        self._clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default=None):
+        """
+        Get the value cached under key, marking it most recently used.
+
+        Args:
+            key (Hashable): The key of the entry.
+            default: Returned if there is no live entry for key.
+
+        Returns:
+            The cached value, or default.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._expired(entry[0]):
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: Hashable, value) -> None:
+        """
+        Cache value under key, evicting the least recently used entries
+        if the cache is full.
+
+        Args:
+            key (Hashable): The key of the entry.
+            value: The value to cache.
+        """
+        if self.max_size == 0:
+            return
+        with self._lock:
+            self._entries[key] = (self._clock(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], object]):
+        """
+        Get the value cached under key, computing and caching it on a miss.
+
+        The lock is not held while computing, so two threads missing
+        the same key at once may both compute it.
+
+        Args:
+            key (Hashable): The key of the entry.
+            compute (Callable[[], object]): Computes the value on a miss.
+
+        Returns:
+            The cached or computed value.
+        """
+        missing = object()
+        value = self.get(key, missing)
+        if value is missing:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def invalidate(self) -> None:
+        """
+        Remove every entry, for when the dictionary has changed.
+        The counters are kept.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        """
+        Returns:
+            dict: {
+                "size": the number of entries,
+                "max_size": the most entries held,
+                "hits": lookups served from the cache,
+                "misses": lookups not in the cache or expired,
+                "evictions": entries removed to make room
+            }
+        """
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _expired(self, stored_at: float) -> bool:
+        return self.ttl is not None and self._clock() - stored_at >= self.ttl
@@ -0,0 +1,285 @@
+import asyncio
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import AsyncIterator, Callable, Iterator, List, Union
+
+from LettersGame.BatchSolver import (
+    initialise_worker,
+    solve_chunk,
+    solve_chunk_counting
+)
+from LettersGame.DictionaryStore import LoadedDictionary
+from LettersGame.Engines import DEFAULT_ENGINE
+
+"""
+Runs solver work for an asyncio server away from its event loop.
+
+Light work, such as checking a word or reading the table of precomputed
+answers, runs on a pool of threads, as do streams of answers, each a job
+holding its place in the queue until the stream ends. Full solves run on a
+pool of worker processes, each loading the dictionary once as in
+BatchSolver, so they do not hold the GIL of the server; without worker
+processes they run on the threads too. The process pool is replaced when
+the dictionary is, which may happen on another thread, such as the reload
+thread of DictionaryStore, and a solve for any other version of the
+dictionary runs on the threads.
+
+At most max_queue jobs are queued or running at once. Past that, jobs are
+refused with ExecutorBusy rather than queued, so a burst of slow solves
+cannot build up an unbounded backlog behind the event loop.
+"""
+
+
+class ExecutorBusy(RuntimeError):
+    """
+    Raised when a job is refused because max_queue jobs are in flight.
+    """
+
+    def __init__(self, queue_depth: int):
+        """
+        Args:
+            queue_depth (int): The number of jobs in flight.
+        """
+        super().__init__(f"{queue_depth} jobs are already queued")
+        self.queue_depth = queue_depth
+
+
+class SolverExecutor:
+    """
+    A thread pool and an optional process pool with a bound
+    on the jobs in flight across both.
+    """
+
+    def __init__(
+        self,
+        threads: int = 4,
+        processes: int = 0,
+        max_queue: int = 64,
+        engine: str = DEFAULT_ENGINE
+    ):
+        """
+        Args:
+            threads (int): The number of threads.
+            processes (int): The number of worker processes for full
+                             solves, 0 to solve on the threads.
+            max_queue (int): The most jobs queued or running at once.
+            engine (str): The solver engine of the worker processes,
+                          see Engines.ENGINES.
+
+        Raises:
+            ValueError: If threads or max_queue is not positive
+                        or processes is negative.
+        """
+        if threads < 1 or max_queue < 1:
+            raise ValueError("threads and max_queue must be positive")
+        if processes < 0:
+            raise ValueError("processes must not be negative")
+
+        self.threads = threads
+        self.processes = processes
+        self.max_queue = max_queue
+        self.engine = engine
+        self.queue_depth = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self._thread_pool = ThreadPoolExecutor(max_workers=threads)
+        self._process_pool = None
+        self._process_version = None
+        # held while the process pool is swapped, and while a solve chooses
+        # and submits to it, so no job is sent to a pool being shut down
+        self._process_lock = threading.Lock()
+
+    def use_dictionary(self, loaded: LoadedDictionary) -> None:
+        """
+        Start worker processes for a new dictionary, letting the workers
+        of the previous one finish their jobs and exit, safe to call from
+        any thread.
+
+        Args:
+            loaded (LoadedDictionary): The new dictionary.
+        """
+        if self.processes == 0:
+            return
+        new_pool = ProcessPoolExecutor(
+            max_workers=self.processes,
+            initializer=initialise_worker,
+            initargs=(loaded.path, self.engine)
+        )
+        with self._process_lock:
+            old_pool = self._process_pool
+            self._process_pool = new_pool
+            self._process_version = loaded.version
+        if old_pool is not None:
+            old_pool.shutdown(wait=False)
+
+    async def run(self, function: Callable, *args):
+        """
+        Run a function on the threads.
+
+        Args:
+            function (Callable): The function to run.
+            *args: Its arguments.
+
+        Raises:
+            ExecutorBusy: If max_queue jobs are already in flight.
+
+        Returns:
+            The result of the function.
+        """
+        return await self._submit(self._thread_pool, function, *args)
+
+    async def solve(
+        self,
+        loaded: LoadedDictionary,
+        racks: List[str],
+        include_definitions: bool = True,
+        limit: Union[int, None] = None,
+        min_length: int = 2,
+        scan_counts: Union[dict, None] = None
+    ) -> List[List[dict]]:
+        """
+        Solve racks as one job, on the worker processes if they
+        have loaded the same version of the dictionary.
+
+        Args:
+            loaded (LoadedDictionary): The dictionary to solve with.
+            racks (List[str]): The lowercase racks to solve.
+            include_definitions (bool): If False the definitions are
+                                        left out of the results.
+            limit (int | None): Only return this many of the longest words.
+            min_length (int): Only return words at least this long.
+            scan_counts (dict | None): Counts the records the solver scans,
+                                       see Engines.create_engine.
+
+        Raises:
+            ExecutorBusy: If max_queue jobs are already in flight.
+
+        Returns:
+            List[List[dict]]: The answers to each rack.
+        """
+        options = (include_definitions, limit, min_length)
+        solve_on_worker = (
+            solve_chunk if scan_counts is None else solve_chunk_counting
+        )
+        job = None
+        with self._process_lock:
+            if (
+                self._process_pool is not None
+                and self._process_version == loaded.version
+            ):
+                job = self._start(
+                    self._process_pool, solve_on_worker, racks, options
+                )
+        if job is not None:
+            results = await self._finish(job)
+            if scan_counts is None:
+                return results
+            results, counted = results
+            for name, count in counted.items():
+                scan_counts[name] = scan_counts.get(name, 0) + count
+            return results
+        return await self._submit(
+            self._thread_pool,
+            lambda: [
+                loaded.solver(rack, *options, scan_counts=scan_counts)
+                for rack in racks
+            ]
+        )
+
+    async def iterate(self, iterator: Iterator) -> AsyncIterator:
+        """
+        Iterate an iterator on the threads as one job, which holds its
+        place in the queue until the iterator is exhausted or closed.
+
+        Args:
+            iterator (Iterator): The iterator, such as a solver's stream.
+
+        Raises:
+            ExecutorBusy: On the first item, if max_queue jobs are
+                          already in flight.
+
+        Yields:
+            The items of the iterator, each found on the threads.
+        """
+        self._reserve()
+        loop = asyncio.get_running_loop()
+        done = object()
+        try:
+            while True:
+                item = await loop.run_in_executor(
+                    self._thread_pool, next, iterator, done
+                )
+                if item is done:
+                    break
+                yield item
+        except Exception:
+            self.failed += 1
+            raise
+        finally:
+            self.queue_depth -= 1
+        self.completed += 1
+
+    def stats(self) -> dict:
+        """
+        Returns:
+            dict: {
+                "queue_depth": the jobs queued or running,
+                "max_queue": the most jobs in flight before refusing,
+                "completed": the jobs finished,
+                "failed": the jobs which raised an exception,
+                "rejected": the jobs refused,
+                "threads": the number of threads,
+                "processes": the number of worker processes
+            }
+        """
+        return {
+            "queue_depth": self.queue_depth,
+            "max_queue": self.max_queue,
+            "completed": self.completed,
+            "failed": self.failed,
+            "rejected": self.rejected,
+            "threads": self.threads,
+            "processes": self.processes,
+        }
+
+    def shutdown(self) -> None:
+        """
+        Stop the threads and worker processes once their jobs are done.
+        """
+        self._thread_pool.shutdown()
+        if self._process_pool is not None:
+            self._process_pool.shutdown()
+
+    def _reserve(self) -> None:
+        # the counters are only changed on the event loop, so need no lock
+        if self.queue_depth >= self.max_queue:
+            self.rejected += 1
+            raise ExecutorBusy(self.queue_depth)
+        self.queue_depth += 1
+
+    def _start(self, pool, function: Callable, *args) -> asyncio.Future:
+        # the job is submitted before returning,
+        # so the pool can be chosen under _process_lock
+        self._reserve()
+        try:
+            loop = asyncio.get_running_loop()
+            return loop.run_in_executor(pool, function, *args)
+        except Exception:
+            self.queue_depth -= 1
+            self.failed += 1
+            raise
+
+    async def _finish(self, job: asyncio.Future):
+        try:
+            result = await job
+        except Exception:
+            self.failed += 1
+            raise
+        finally:
+            self.queue_depth -= 1
+        self.completed += 1
+        return result
+
+    async def _submit(self, pool, function: Callable, *args):
+        return await self._finish(self._start(pool, function, *args))
@@ -0,0 +1,247 @@
+import csv
+import heapq
+import itertools
+import json
+import os
+import string
+import tempfile
+from typing import Iterable, Iterator, List, Tuple, Union
+
+from LettersGame.BinaryDict import BINARY_EXTENSION
+from LettersGame.BloomFilter import remove_bloom_filter
+from LettersGame.CreateDict import create_record, parse_row
+
+"""
+A compiler for word lists too big to hold in memory as a dictionary.
+
+The dataset CSV is read in runs of run_size rows, each run is sorted by word
+and written to a temporary file as JSON lines of [word, definition]. The runs
+are then merged in word order, at most MERGE_FAN_IN files at a time, so rows
+of the same word meet and are merged into one record, and the records are
+written straight into the JSON dictionary (see CreateDict) bucket by bucket.
+
+Peak memory is one run of rows plus a record per open run, however big the
+input is. Records within a bucket are in alphabetical order, and the
+definitions of a word in the order of the dataset.
+"""
+
+DEFAULT_RUN_SIZE = 100000
+MERGE_FAN_IN = 64
+
+
+def compile_dict(
+    csv_file_path: str,
+    file_path: str,
+    run_size: int = DEFAULT_RUN_SIZE
+) -> Union[int, None]:
+    """
+    Compile the dataset CSV into a JSON dictionary at file_path
+    without holding the dictionary in memory.
+
+    The dictionary is written next to file_path and moved over it
+    once complete, removing the Bloom filter of the dictionary replaced.
+
+    Args:
+        csv_file_path (str): The path to the dataset CSV.
+        file_path (str): The path to store the dictionary at.
+        run_size (int): The number of rows sorted in memory at a time.
+
+    Returns:
+        int | None: The number of words in the dictionary,
+                    None if it could not be compiled.
+    """
+    temporary_path = file_path + ".tmp"
+    try:
+        if file_path.endswith(BINARY_EXTENSION):
+            raise ValueError("only JSON dictionaries can be compiled")
+
+        with tempfile.TemporaryDirectory() as run_directory:
+            run_paths = write_runs(csv_file_path, run_directory, run_size)
+            while len(run_paths) > MERGE_FAN_IN:
+                run_paths = merge_run_files(run_paths, run_directory)
+
+            with open(temporary_path, 'w') as file:
+                word_count = write_records(
+                    merge_records(run_paths), file
+                )
+        os.replace(temporary_path, file_path)
+        remove_bloom_filter(file_path)
+    except Exception as e:
+        print(f"Error: {e}")
+        if os.path.exists(temporary_path):
+            os.remove(temporary_path)
+        return None
+
+    return word_count
+
+
+def write_runs(
+    csv_file_path: str,
+    run_directory: str,
+    run_size: int
+) -> List[str]:
+    """
+    Split the valid rows of the dataset CSV into sorted run files.
+
+    Args:
+        csv_file_path (str): The path to the dataset CSV.
+        run_directory (str): The directory to write the runs to.
+        run_size (int): The number of rows in each run.
+
+    Returns:
+        List[str]: The paths of the runs, in the order of the dataset.
+    """
+    run_paths = []
+    with open(csv_file_path, 'r') as file:
+        rows = (parse_row(row) for row in csv.reader(file))
+        entries = (entry for entry in rows if entry is not None)
+        while True:
+            run = list(itertools.islice(entries, run_size))
+            if not run:
+                break
+            # sorted is stable, so definitions keep the order of the dataset
+            run.sort(key=lambda entry: entry[0])
+            run_paths.append(
+                write_run(run, run_directory, f"run{len(run_paths)}")
+            )
+
+    return run_paths
+
+
+def write_run(
+    entries: Iterable[Tuple[str, str]],
+    run_directory: str,
+    name: str
+) -> str:
+    """
+    Write a sorted run of [word, definition] entries as JSON lines.
+
+    Args:
+        entries (Iterable[Tuple[str, str]]): The entries, sorted by word.
+        run_directory (str): The directory to write the run to.
+        name (str): The name of the run, unique within the directory.
+
+    Returns:
+        str: The path of the run.
+    """
+    run_path = os.path.join(run_directory, f"{name}.jsonl")
+    with open(run_path, 'w') as file:
+        for entry in entries:
+            file.write(json.dumps(entry) + "\n")
+    return run_path
+
+
+def read_run(run_path: str) -> Iterator[Tuple[str, str]]:
+    """
+    Args:
+        run_path (str): The path of a run.
+
+    Yields:
+        Tuple[str, str]: The word and definition of each entry of the run.
+    """
+    with open(run_path, 'r') as file:
+        for line in file:
+            word, definition = json.loads(line)
+            yield word, definition
+
+
+def merge_runs(run_paths: List[str]) -> Iterator[Tuple[str, str]]:
+    """
+    Merge sorted runs into one sorted stream of entries.
+
+    Args:
+        run_paths (List[str]): The paths of the runs, in the order of the
+                               dataset, so ties keep the order of the rows.
+
+    Yields:
+        Tuple[str, str]: The word and definition of each entry.
+    """
+    return heapq.merge(
+        *(read_run(run_path) for run_path in run_paths),
+        key=lambda entry: entry[0]
+    )
+
+
+def merge_run_files(run_paths: List[str], run_directory: str) -> List[str]:
+    """
+    Merge the runs MERGE_FAN_IN at a time into fewer, longer runs,
+    removing the merged runs.
+
+    Args:
+        run_paths (List[str]): The paths of the runs, in order.
+        run_directory (str): The directory of the runs.
+
+    Returns:
+        List[str]: The paths of the merged runs, in order.
+    """
+    merged_paths = []
+    for start in range(0, len(run_paths), MERGE_FAN_IN):
+        group = run_paths[start:start + MERGE_FAN_IN]
+        # each pass leaves fewer runs, so its names are not taken
+        name = f"merged{len(run_paths)}_{start}"
+        merged_paths.append(write_run(merge_runs(group), run_directory, name))
+        for run_path in group:
+            os.remove(run_path)
+
+    return merged_paths
+
+
+def merge_records(run_paths: List[str]) -> Iterator[dict]:
+    """
+    Merge the entries of the runs into a record per word.
+
+    Args:
+        run_paths (List[str]): The paths of the runs, in order.
+
+    Yields:
+        dict: The record of each word, in alphabetical order,
+              see CreateDict.create_record.
+    """
+    grouped = itertools.groupby(
+        merge_runs(run_paths), key=lambda entry: entry[0]
+    )
+    for word, entries in grouped:
+        definitions = []
+        for _, definition in entries:
+            if definition not in definitions:
+                definitions.append(definition)
+        yield create_record(word, definitions)
+
+
+def write_records(records: Iterable[dict], file) -> int:
+    """
+    Write records in alphabetical order as a JSON dictionary,
+    one bucket at a time.
+
+    Args:
+        records (Iterable[dict]): The records, in alphabetical order.
+        file: The text file to write to.
+
+    Returns:
+        int: The number of records written.
+    """
+    records = iter(records)
+    record = next(records, None)
+    word_count = 0
+
+    file.write("{")
+    for i, first_letter in enumerate(string.ascii_lowercase):
+        file.write(
+            ("" if i == 0 else ", ") + json.dumps(first_letter) + ": {"
+        )
+        for j, second_letter in enumerate(string.ascii_lowercase):
+            file.write(
+                ("" if j == 0 else ", ") + json.dumps(second_letter) + ": ["
+            )
+            bucket = first_letter + second_letter
+            first = True
+            while record is not None and record["word"][:2] == bucket:
+                file.write(("" if first else ", ") + json.dumps(record))
+                first = False
+                word_count += 1
+                record = next(records, None)
+            file.write("]")
+        file.write("}")
+    file.write("}")
+
+    return word_count
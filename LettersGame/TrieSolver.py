@@ -0,0 +1,182 @@
+from collections import Counter
+from typing import Iterator, List, Union
+
+from LettersGame.CountdownSolver import (
+    add_found_word,
+    found_results,
+    longest_results
+)
+
+"""
+The structure of the trie is as follows:
+
+{
+    "root": {
+        "letter": the node reached by that letter,
+        "$": True if the path to the node spells a word
+    },
+    "records": {
+        "word": [the records of the word from the dictionary]
+    }
+}
+
+Once minimised, nodes with the same letters, children and end of word
+flag are shared, making it a DAWG. The records are looked up by the word
+spelled on the way to a node so they do not stop nodes being shared.
+"""
+
+WORD_KEY = "$"
+
+
+def create_trie(dictionary: dict, minimise: bool = True) -> dict:
+    """
+    Create a trie of every word in the dictionary.
+
+    Args:
+        dictionary (dict): The dictionary of words.
+        minimise (bool): Share identical subtrees, turning the trie
+                         into a minimised DAWG.
+
+    Returns:
+        dict: The trie, as described above.
+    """
+    root = {}
+    records = {}
+
+    for first_letter in dictionary:
+        for second_letter in dictionary[first_letter]:
+            for record in dictionary[first_letter][second_letter]:
+                word = record["word"]
+                node = root
+                for letter in word:
+                    node = node.setdefault(letter, {})
+                node[WORD_KEY] = True
+                records.setdefault(word, []).append(record)
+
+    if minimise:
+        root = minimise_trie(root, {})
+
+    return {"root": root, "records": records}
+
+
+def minimise_trie(node: dict, registry: dict) -> dict:
+    """
+    Share identical subtrees of a trie, children first,
+    so that equal subtrees are always the same object.
+
+    Args:
+        node (dict): The node to minimise.
+        registry (dict): The minimised nodes seen so far, by signature.
+
+    Returns:
+        dict: The node to use in place of node.
+    """
+    for letter in node:
+        if letter != WORD_KEY:
+            node[letter] = minimise_trie(node[letter], registry)
+
+    signature = tuple(sorted(
+        (letter, id(child) if letter != WORD_KEY else child)
+        for letter, child in node.items()
+    ))
+    return registry.setdefault(signature, node)
+
+
+def solve_countdown_trie(
+    letters: str,
+    trie: dict,
+    include_definitions: bool = True,
+    limit: Union[int, None] = None,
+    min_length: int = 2
+) -> List[dict]:
+    """
+    Solve the Countdown letters game by walking the trie depth first,
+    using up a letter of the rack at each step, so a subtree is skipped
+    as soon as the letter leading into it has run out.
+
+    The walk finds words in alphabetical rather than length order,
+    so with a limit the whole walk is done before the longest are kept.
+
+    Args:
+        letters (str): The letters provided for the game.
+        trie (dict): The trie created by create_trie.
+        include_definitions (bool): If False the definitions are
+                                    not read and left out of the results.
+        limit (int | None): Only return this many of the longest words,
+                            longest first.
+        min_length (int): Only return words at least this long.
+
+    Returns:
+        list[dict]: A list of dictionaries containing the words,
+                    their definitions, and the word lengths.
+    """
+    return longest_results(
+        list(iter_countdown_trie(
+            letters, trie, include_definitions, min_length
+        )),
+        limit
+    )
+
+
+def iter_countdown_trie(
+    letters: str,
+    trie: dict,
+    include_definitions: bool = True,
+    min_length: int = 2
+) -> Iterator[dict]:
+    """
+    Yields the results of solve_countdown_trie as they are found
+    by the walk, in alphabetical order.
+
+    Args:
+        letters (str): The letters provided for the game.
+        trie (dict): The trie created by create_trie.
+        include_definitions (bool): If False the definitions are
+                                    not read and left out of the results.
+        min_length (int): Only yield words at least this long.
+
+    Yields:
+        dict: {"word", "definition", "length"},
+              see CountdownSolver.word_result
+    """
+    letter_counts = Counter(letters)
+    rack_letters = sorted(letter_counts)
+
+    def walk(node: dict, prefix: str) -> Iterator[dict]:
+        if WORD_KEY in node and len(prefix) >= max(min_length, 2):
+            # the records of a word are all reached at the same node
+            found = {}
+            for record in trie["records"][prefix]:
+                add_found_word(found, record, include_definitions)
+            yield from found_results(found, include_definitions)
+
+        for letter in rack_letters:
+            if letter_counts[letter] and letter in node:
+                letter_counts[letter] -= 1
+                yield from walk(node[letter], prefix + letter)
+                letter_counts[letter] += 1
+
+    yield from walk(trie["root"], "")
+
+
+def count_nodes(trie: dict) -> int:
+    """
+    Count the distinct nodes of a trie, shared nodes are counted once.
+
+    Args:
+        trie (dict): The trie created by create_trie.
+
+    Returns:
+        int: The number of nodes.
+    """
+    seen = set()
+    stack = [trie["root"]]
+    while stack:
+        node = stack.pop()
+        if id(node) in seen:
+            continue
+        seen.add(id(node))
+        stack.extend(
+            child for letter, child in node.items() if letter != WORD_KEY
+        )
+    return len(seen)
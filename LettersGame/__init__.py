@@ -1 +1,19 @@
-__all__ = ["CountdownSolver", "CreateDict"]
\ No newline at end of file
+__all__ = [
+    "CountdownSolver",
+    "CreateDict",
+    "BinaryDict",
+    "MappedDict",
+    "TrieSolver",
+    "Engines",
+    "ResultCache",
+    "AnswerTable",
+    "BatchSolver",
+    "MatrixSolver",
+    "IncrementalDict",
+    "StreamDict",
+    "DictionaryStore",
+    "SolverExecutor",
+    "GameSessions",
+    "BloomFilter",
+    "Metrics"
+]
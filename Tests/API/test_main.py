@@ -0,0 +1,972 @@
+import unittest
+import asyncio
+import json
+import os
+import re
+import threading
+from unittest.mock import patch
+from LettersGame.AnswerTable import AnswerTable, build_answer_table
+from LettersGame.BinaryDict import definitions_path, store_dict_binary
+from LettersGame.BloomFilter import bloom_path
+from LettersGame.CreateDict import (
+    initialise_dict,
+    add_to_dict,
+    create_dict,
+    load_dict,
+    store_dict
+)
+from LettersGame.DictionaryStore import DictionaryStore, dictionary_version
+from LettersGame.GameSessions import GameSessions
+from LettersGame.SolverExecutor import SolverExecutor
+
+try:
+    from fastapi.testclient import TestClient
+    from API import main
+    FASTAPI_AVAILABLE = True
+except ImportError:
+    FASTAPI_AVAILABLE = False
+
+
+@unittest.skipIf(not FASTAPI_AVAILABLE, "fastapi is not installed")
+class TestAPI(unittest.TestCase):
+    """
+    Test suite for the letters game server.
+    """
+
+    def setUp(self):
+        """
+        Store a sample dictionary and give the server a store, executor
+        and cache of its own, so each test starts with nothing loaded.
+        """
+        self.dict_path = 'test_api_dictionary.json'
+        self.new_dict_path = 'test_api_new_dictionary.json'
+        self.table_path = 'test_api_answers.db'
+        self.csv_path = 'test_api_words.csv'
+        dictionary = initialise_dict()
+        add_to_dict(dictionary, 'apple', 'a fruit')
+        add_to_dict(dictionary, 'at', 'in, on, or near')
+        add_to_dict(dictionary, 'tea', 'a drink')
+        store_dict(dictionary, self.dict_path)
+
+        self.executor = SolverExecutor(threads=2, max_queue=4)
+        self.store = DictionaryStore(
+            engine=main.engine, on_swap=main.dictionary_swapped
+        )
+        for name, value in (
+            ('dict_path', self.dict_path),
+            ('background_load', False),
+            ('store', self.store),
+            ('executor', self.executor),
+            ('answer_table', None),
+            ('ready_seconds', None),
+        ):
+            patcher = patch.object(main, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        main.cache.invalidate()
+
+    def tearDown(self):
+        """
+        Removes the files created by the tests.
+        """
+        self.executor.shutdown()
+        for path in (
+            self.dict_path,
+            bloom_path(self.dict_path),
+            self.new_dict_path,
+            self.table_path,
+            self.csv_path
+        ):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def get_words(self, client, letters: str) -> list:
+        """
+        Gets the words the server answers for letters.
+
+        Args:
+            client (TestClient): The client of the server.
+            letters (str): The letters to answer.
+
+        Returns:
+            list: The words, in the order they were answered.
+        """
+        response = client.get(
+            '/answers/get/', params={'letters': letters}
+        )
+        self.assertEqual(response.status_code, 200)
+        return [result['word'] for result in response.json()]
+
+    def test_answer_table(self):
+        """
+        Test that racks in a table built from the loaded dictionary
+        are answered from it.
+        """
+        build_answer_table(
+            ['appletaxx'],
+            lambda rack: [{'word': 'tabled', 'definition': '', 'length': 6}],
+            self.table_path,
+            version=dictionary_version(self.dict_path)
+        )
+        with patch.object(main, 'answer_table', AnswerTable(self.table_path)):
+            with TestClient(main.app) as client:
+                self.assertEqual(
+                    self.get_words(client, 'APPLETAXX'), ['tabled']
+                )
+                self.assertEqual(
+                    self.get_words(client, 'teaxxxxxx'), ['tea', 'at']
+                )
+            main.answer_table.close()
+
+    def test_answer_table_other_version(self):
+        """
+        Test that a table built from another dictionary, or without
+        a version, is not used and the racks are solved instead.
+        """
+        with TestClient(main.app) as client:
+            for version in ('000000000000', None):
+                build_answer_table(
+                    ['appletaxx'],
+                    lambda rack: [
+                        {'word': 'tabled', 'definition': '', 'length': 6}
+                    ],
+                    self.table_path,
+                    version=version
+                )
+                table = AnswerTable(self.table_path)
+                with patch.object(main, 'answer_table', table):
+                    self.assertEqual(
+                        self.get_words(client, 'appletaxx'),
+                        ['apple', 'tea', 'at']
+                    )
+                table.close()
+                main.cache.invalidate()
+
+    def test_executor_busy(self):
+        """
+        Test that with the executor full, requests needing it are refused
+        with a 503 and a Retry-After header, and that /executor/stats/
+        counts them.
+        """
+        release = threading.Event()
+        executor = SolverExecutor(threads=1, max_queue=1)
+
+        async def block() -> asyncio.Future:
+            job = asyncio.ensure_future(executor.run(release.wait))
+            await asyncio.sleep(0)
+            return job
+
+        with patch.object(main, 'executor', executor):
+            with TestClient(main.app) as client:
+                stats = client.get('/executor/stats/').json()
+                self.assertEqual(stats['max_queue'], 1)
+                self.assertEqual(stats['threads'], 1)
+                self.assertEqual(stats['queue_depth'], 0)
+
+                job = client.portal.call(block)
+                for path, params in (
+                    ('/answers/get/', {'letters': 'appletaxx'}),
+                    ('/answers/stream/', {'letters': 'appletaxx'}),
+                    ('/answers/check/', {'letters': 'appletaxx',
+                                         'word': 'apple'}),
+                ):
+                    response = client.get(path, params=params)
+                    self.assertEqual(response.status_code, 503)
+                    self.assertEqual(response.headers['Retry-After'], '1')
+                    self.assertEqual(response.json()['queue_depth'], 1)
+
+                stats = client.get('/executor/stats/').json()
+                self.assertEqual(stats['queue_depth'], 1)
+                self.assertEqual(stats['rejected'], 3)
+                self.assertEqual(stats['completed'], 0)
+
+                release.set()
+                client.portal.call(asyncio.wait_for, job, 5)
+                self.assertEqual(
+                    self.get_words(client, 'appletaxx'),
+                    ['apple', 'tea', 'at']
+                )
+                stats = client.get('/executor/stats/').json()
+                self.assertEqual(stats['queue_depth'], 0)
+                self.assertEqual(stats['rejected'], 3)
+                self.assertEqual(stats['completed'], 2)
+                self.assertEqual(stats['failed'], 0)
+
+    def reload(self, client, path=None, token='secret'):
+        """
+        Asks the server to reload its dictionary.
+
+        Args:
+            client (TestClient): The client of the server.
+            path (str | None): The path to the new dictionary.
+            token (str | None): The admin token to send, none if None.
+
+        Returns:
+            Response: The response of the server.
+        """
+        return client.post(
+            '/admin/reload/',
+            json={'path': path} if path else None,
+            headers={'X-Admin-Token': token} if token else {}
+        )
+
+    def test_reload_token(self):
+        """
+        Test that reloading is refused without the admin token,
+        and always when no token is set.
+        """
+        with TestClient(main.app) as client:
+            response = self.reload(client, token=None)
+            self.assertEqual(response.status_code, 403)
+            with patch.object(main, 'admin_token', 'secret'):
+                self.assertEqual(
+                    self.reload(client, token=None).status_code, 403
+                )
+                self.assertEqual(
+                    self.reload(client, token='guess').status_code, 403
+                )
+            self.assertEqual(self.reload(client).status_code, 403)
+            self.assertFalse(self.store.reloading)
+
+    def test_reload(self):
+        """
+        Test that a reload swaps in the new dictionary, and that each
+        response reports the version it was answered from.
+        """
+        dictionary = load_dict(self.dict_path)
+        add_to_dict(dictionary, 'eat', 'to have food')
+        store_dict(dictionary, self.new_dict_path)
+
+        with patch.object(main, 'admin_token', 'secret'):
+            with TestClient(main.app) as client:
+                response = client.get(
+                    '/answers/get/', params={'letters': 'appletaxx'}
+                )
+                self.assertEqual(
+                    response.headers['X-Dictionary-Version'],
+                    dictionary_version(self.dict_path)
+                )
+
+                response = self.reload(client, self.new_dict_path)
+                self.assertEqual(response.status_code, 202)
+                self.store.wait()
+
+                response = client.get(
+                    '/answers/get/', params={'letters': 'appletaxx'}
+                )
+                self.assertEqual(
+                    response.headers['X-Dictionary-Version'],
+                    dictionary_version(self.new_dict_path)
+                )
+                self.assertIn(
+                    'eat', [result['word'] for result in response.json()]
+                )
+                status = client.get('/admin/dictionary/').json()
+                self.assertEqual(status['path'], self.new_dict_path)
+                self.assertIsNone(status['last_error'])
+
+    def test_reload_failure(self):
+        """
+        Test that when the new dictionary cannot be loaded the old one
+        is kept and the error is reported.
+        """
+        with patch.object(main, 'admin_token', 'secret'):
+            with TestClient(main.app) as client:
+                response = self.reload(client, 'test_api_missing.json')
+                self.assertEqual(response.status_code, 202)
+                self.store.wait()
+
+                status = client.get('/admin/dictionary/').json()
+                self.assertEqual(status['path'], self.dict_path)
+                self.assertEqual(
+                    status['version'], dictionary_version(self.dict_path)
+                )
+                self.assertIsNotNone(status['last_error'])
+
+                response = client.get(
+                    '/answers/get/', params={'letters': 'appletaxx'}
+                )
+                self.assertEqual(
+                    response.headers['X-Dictionary-Version'],
+                    dictionary_version(self.dict_path)
+                )
+                self.assertEqual(
+                    [result['word'] for result in response.json()],
+                    ['apple', 'tea', 'at']
+                )
+
+    def test_reload_in_progress(self):
+        """
+        Test that a reload is refused while another is in progress.
+        """
+        release = threading.Event()
+
+        def slow_load_dict(path, **kwargs):
+            release.wait(5)
+            return load_dict(path, **kwargs)
+
+        with patch.object(main, 'admin_token', 'secret'):
+            with TestClient(main.app) as client:
+                with patch(
+                    'LettersGame.DictionaryStore.load_dict', slow_load_dict
+                ):
+                    self.assertEqual(self.reload(client).status_code, 202)
+                    response = self.reload(client)
+                    self.assertEqual(response.status_code, 409)
+                    release.set()
+                    self.store.wait()
+                self.assertIsNone(self.store.last_error)
+
+    def test_health_before_load(self):
+        """
+        Test that the server is live but not ready until the dictionary
+        is loaded, and requests needing it get a 503 until then.
+        """
+        client = TestClient(main.app)
+        self.assertEqual(client.get('/health/live/').status_code, 200)
+        response = client.get('/health/ready/')
+        self.assertEqual(response.status_code, 503)
+        self.assertFalse(response.json()['ready'])
+        self.assertIsNone(response.json()['ready_seconds'])
+        response = client.get(
+            '/answers/get/', params={'letters': 'appletaxx'}
+        )
+        self.assertEqual(response.status_code, 503)
+
+        self.store.load(self.dict_path)
+        response = client.get('/health/ready/')
+        self.assertEqual(response.status_code, 200)
+        status = response.json()
+        self.assertTrue(status['ready'])
+        self.assertGreater(status['ready_seconds'], 0)
+        self.assertEqual(status['version'], dictionary_version(self.dict_path))
+
+    def test_health_background_load(self):
+        """
+        Test that with the dictionary loaded in the background the server
+        is live while it loads and ready once it has.
+        """
+        release = threading.Event()
+
+        def slow_load_dict(path, **kwargs):
+            release.wait(5)
+            return load_dict(path, **kwargs)
+
+        with patch.object(main, 'background_load', True), patch(
+            'LettersGame.DictionaryStore.load_dict', slow_load_dict
+        ):
+            with TestClient(main.app) as client:
+                self.assertEqual(
+                    client.get('/health/live/').status_code, 200
+                )
+                response = client.get('/health/ready/')
+                self.assertEqual(response.status_code, 503)
+                self.assertIsNone(response.json()['last_error'])
+
+                release.set()
+                self.store.wait()
+                self.assertEqual(
+                    client.get('/health/ready/').status_code, 200
+                )
+
+    def test_health_background_load_failure(self):
+        """
+        Test that a server whose dictionary failed to load in the
+        background stays live, and is not ready with the error reported.
+        """
+        with patch.object(main, 'background_load', True), patch.object(
+            main, 'dict_path', 'test_api_missing.json'
+        ):
+            with TestClient(main.app) as client:
+                self.store.wait()
+                self.assertEqual(
+                    client.get('/health/live/').status_code, 200
+                )
+                response = client.get('/health/ready/')
+                self.assertEqual(response.status_code, 503)
+                self.assertIsNotNone(response.json()['last_error'])
+
+    def read_metrics(self, client) -> dict:
+        """
+        Reads /metrics, asserting every line is in the Prometheus text
+        format and every sample belongs to a declared metric.
+
+        Args:
+            client (TestClient): The client of the server.
+
+        Returns:
+            dict: {
+                (name, frozenset of (label, value)): the sample's value
+            }
+        """
+        response = client.get('/metrics')
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(
+            response.headers['content-type'].startswith(
+                'text/plain; version=0.0.4'
+            )
+        )
+        name_pattern = r'[a-zA-Z_:][a-zA-Z0-9_:]*'
+        label_pattern = r'([a-zA-Z_][a-zA-Z0-9_]*)="((?:[^"\\]|\\.)*)"'
+        sample_pattern = re.compile(
+            rf'({name_pattern})(?:{{((?:{label_pattern},?)*)}})? (\S+)'
+        )
+        types = {}
+        samples = {}
+        for line in response.text.splitlines():
+            if line.startswith('# HELP '):
+                self.assertRegex(line, rf'^# HELP {name_pattern} \S')
+                continue
+            if line.startswith('# TYPE '):
+                _, _, name, kind = line.split(' ')
+                self.assertIn(kind, ('counter', 'gauge', 'histogram'))
+                types[name] = kind
+                continue
+            match = sample_pattern.fullmatch(line)
+            self.assertIsNotNone(match, line)
+            name, labels, value = match.group(1, 2, 5)
+            base = re.sub(r'_(bucket|sum|count)$', '', name)
+            self.assertTrue(name in types or base in types, line)
+            samples[(
+                name, frozenset(re.findall(label_pattern, labels or ''))
+            )] = float(value)
+        return samples
+
+    def test_metrics(self):
+        """
+        Test that requests are counted and their stages timed at /metrics,
+        with sessions counted by route rather than by path.
+        """
+        def key(name, **labels):
+            return (name, frozenset(labels.items()))
+
+        requests = key(
+            'letters_http_requests_total',
+            method='GET', endpoint='/answers/get/', status='200'
+        )
+        solve = key('letters_stage_duration_seconds_count', stage='solve')
+        cache = key('letters_stage_duration_seconds_count', stage='cache')
+        session_checks = key(
+            'letters_http_requests_total',
+            method='GET', endpoint='/sessions/{session_id}/check/',
+            status='200'
+        )
+
+        with TestClient(main.app) as client:
+            before = self.read_metrics(client)
+            self.get_words(client, 'appletaxx')
+            self.get_words(client, 'XXATELPPA')
+            session_id = client.post(
+                '/sessions/', json={'letters': 'teaxxxxxx'}
+            ).json()['session_id']
+            client.get(
+                f'/sessions/{session_id}/check/', params={'word': 'tea'}
+            )
+            after = self.read_metrics(client)
+
+        self.assertEqual(after[requests] - before.get(requests, 0), 2)
+        self.assertEqual(after[solve] - before.get(solve, 0), 2)
+        self.assertEqual(after[cache] - before.get(cache, 0), 3)
+        self.assertEqual(
+            after[session_checks] - before.get(session_checks, 0), 1
+        )
+        self.assertFalse(any(
+            session_id in value
+            for _, labels in after for _, value in labels
+        ))
+        self.assertEqual(after[key(
+            'letters_dictionary_info',
+            version=dictionary_version(self.dict_path),
+            engine=main.engine
+        )], 1)
+        self.assertGreaterEqual(
+            after[key('letters_hot_rack_requests', rack='aaelpptxx')], 2
+        )
+
+    def test_check_rebuilt_without_bloom_filter(self):
+        """
+        Test that a word added to a dictionary rebuilt without a Bloom
+        filter is not rejected by the filter of the dictionary it replaced.
+        """
+        with open(self.csv_path, 'w') as f:
+            f.write('Word,Count,Type,Definition\napple,5,noun,a fruit\n')
+        create_dict(
+            self.csv_path, self.dict_path, bloom_false_positive_rate=0.01
+        )
+        with open(bloom_path(self.dict_path), 'rb') as f:
+            stale = f.read()
+        with open(self.csv_path, 'a') as f:
+            f.write('plate,5,noun,a dish\n')
+        create_dict(self.csv_path, self.dict_path)
+
+        params = {'letters': 'plateaxxx', 'word': 'plate'}
+        for restore_stale in (False, True):
+            if restore_stale:
+                with open(bloom_path(self.dict_path), 'wb') as f:
+                    f.write(stale)
+            self.store.load(self.dict_path)
+            response = TestClient(main.app).get(
+                '/answers/check/', params=params
+            )
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(
+                response.json(), {'correct': True, 'definitions': ['a dish']}
+            )
+            self.assertIsNone(self.store.current.bloom_filter)
+
+    def test_batch_answers(self):
+        """
+        Test that racks which are anagrams of each other are solved once,
+        in one job, and answered under each rack as it was sent.
+        """
+        racks = ['appletaxx', 'XXATELPPA', 'teaxxxxxx']
+        with TestClient(main.app) as client:
+            with patch.object(
+                self.executor, 'solve', wraps=self.executor.solve
+            ) as solve:
+                response = client.post(
+                    '/answers/batch/', json={'racks': racks}
+                )
+            self.assertEqual(response.status_code, 200)
+            answers = response.json()
+            self.assertEqual(list(answers), racks)
+            self.assertEqual(answers['appletaxx'], answers['XXATELPPA'])
+            self.assertEqual(
+                [result['word'] for result in answers['appletaxx']],
+                ['apple', 'tea', 'at']
+            )
+            self.assertEqual(
+                [result['word'] for result in answers['teaxxxxxx']],
+                ['tea', 'at']
+            )
+            self.assertEqual(
+                response.headers['X-Dictionary-Version'],
+                dictionary_version(self.dict_path)
+            )
+            solve.assert_called_once()
+            self.assertEqual(
+                solve.call_args.args[1], ['aaelpptxx', 'aetxxxxxx']
+            )
+
+    def test_batch_answers_options(self):
+        """
+        Test that definitions, limit and min_length apply to each rack.
+        """
+        with TestClient(main.app) as client:
+            response = client.post('/answers/batch/', json={
+                'racks': ['appletaxx', 'teaxxxxxx'],
+                'definitions': False,
+                'limit': 1,
+            })
+            self.assertEqual(response.json(), {
+                'appletaxx': [{'word': 'apple', 'length': 5}],
+                'teaxxxxxx': [{'word': 'tea', 'length': 3}],
+            })
+
+            response = client.post('/answers/batch/', json={
+                'racks': ['appletaxx', 'atxxxxxxx'],
+                'min_length': 3,
+            })
+            self.assertEqual(response.json(), {
+                'appletaxx': [
+                    {'word': 'apple', 'definition': 'a fruit', 'length': 5},
+                    {'word': 'tea', 'definition': 'a drink', 'length': 3},
+                ],
+                'atxxxxxxx': [],
+            })
+
+    def test_batch_answers_invalid(self):
+        """
+        Test that a batch with a rack which is not all letters gets a 400,
+        and one with a rack of the wrong length, no racks or more than
+        MAX_BATCH_RACKS racks is rejected.
+        """
+        with TestClient(main.app) as client:
+            response = client.post(
+                '/answers/batch/', json={'racks': ['appletaxx', 'appl3taxx']}
+            )
+            self.assertEqual(response.status_code, 400)
+
+            for racks in (
+                ['appletax'],
+                [],
+                ['appletaxx'] * (main.MAX_BATCH_RACKS + 1),
+            ):
+                response = client.post(
+                    '/answers/batch/', json={'racks': racks}
+                )
+                self.assertEqual(response.status_code, 422)
+
+            response = client.post(
+                '/answers/batch/',
+                json={'racks': ['appletaxx'] * main.MAX_BATCH_RACKS}
+            )
+            self.assertEqual(response.status_code, 200)
+
+    def create_session(self, client, letters: str) -> str:
+        """
+        Creates a game session.
+
+        Args:
+            client (TestClient): The client of the server.
+            letters (str): The letters of the game.
+
+        Returns:
+            str: The id of the session.
+        """
+        response = client.post('/sessions/', json={'letters': letters})
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json()['letters'], letters.lower())
+        return response.json()['session_id']
+
+    def test_session_check(self):
+        """
+        Test that guesses against a session are checked against the
+        answers to its letters, as often as they are guessed.
+        """
+        with TestClient(main.app) as client:
+            session_id = self.create_session(client, 'APPLETAXX')
+            path = f'/sessions/{session_id}/check/'
+
+            for _ in range(2):
+                response = client.get(path, params={'word': 'apple'})
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(
+                    response.json(),
+                    {'correct': True, 'definitions': ['a fruit']}
+                )
+                self.assertEqual(
+                    response.headers['X-Dictionary-Version'],
+                    dictionary_version(self.dict_path)
+                )
+
+            for word in ('plate', 'teas', 'xxx'):
+                response = client.get(path, params={'word': word})
+                self.assertEqual(
+                    response.json(), {'correct': False, 'definitions': []}
+                )
+
+            response = client.get(
+                path, params={'word': 'TEA', 'definitions': 'false'}
+            )
+            self.assertEqual(response.json(), {'correct': True})
+            response = client.get(
+                path, params={'word': 'zzz', 'definitions': 'false'}
+            )
+            self.assertEqual(response.json(), {'correct': False})
+
+            response = client.get(path, params={'word': 'ap3'})
+            self.assertEqual(response.status_code, 400)
+
+    def test_session_not_found(self):
+        """
+        Test that an unknown or expired session gets a 404.
+        """
+        now = [0.0]
+        sessions = GameSessions(ttl=60, clock=lambda: now[0])
+        with patch.object(main, 'sessions', sessions):
+            with TestClient(main.app) as client:
+                response = client.get(
+                    '/sessions/unknown/check/', params={'word': 'tea'}
+                )
+                self.assertEqual(response.status_code, 404)
+
+                session_id = self.create_session(client, 'teaxxxxxx')
+                path = f'/sessions/{session_id}/check/'
+                now[0] = 59
+                self.assertEqual(
+                    client.get(path, params={'word': 'tea'}).status_code, 200
+                )
+                now[0] = 118
+                self.assertEqual(
+                    client.get(path, params={'word': 'tea'}).status_code, 200
+                )
+                now[0] = 179
+                self.assertEqual(
+                    client.get(path, params={'word': 'tea'}).status_code, 404
+                )
+
+    def test_session_keeps_dictionary(self):
+        """
+        Test that a session answers from the dictionary it was created
+        with after the dictionary is reloaded.
+        """
+        dictionary = load_dict(self.dict_path)
+        add_to_dict(dictionary, 'eat', 'to have food')
+        store_dict(dictionary, self.new_dict_path)
+
+        with patch.object(main, 'admin_token', 'secret'):
+            with TestClient(main.app) as client:
+                session_id = self.create_session(client, 'teaxxxxxx')
+                self.assertEqual(
+                    self.reload(client, self.new_dict_path).status_code, 202
+                )
+                self.store.wait()
+
+                response = client.get(
+                    f'/sessions/{session_id}/check/', params={'word': 'eat'}
+                )
+                self.assertEqual(response.json()['correct'], False)
+                self.assertEqual(
+                    response.headers['X-Dictionary-Version'],
+                    dictionary_version(self.dict_path)
+                )
+
+                response = client.get(
+                    '/answers/check/',
+                    params={'letters': 'teaxxxxxx', 'word': 'eat'}
+                )
+                self.assertEqual(response.json()['correct'], True)
+                self.assertEqual(
+                    response.headers['X-Dictionary-Version'],
+                    dictionary_version(self.new_dict_path)
+                )
+
+                new_session_id = self.create_session(client, 'teaxxxxxx')
+                response = client.get(
+                    f'/sessions/{new_session_id}/check/',
+                    params={'word': 'eat'}
+                )
+                self.assertEqual(response.json()['correct'], True)
+
+    def test_stream_answers(self):
+        """
+        Test that the answers are streamed as a line of JSON each,
+        longest first with the signature engine, ending with a newline.
+        """
+        store = DictionaryStore(
+            engine='signature', on_swap=main.dictionary_swapped
+        )
+        with patch.object(main, 'store', store):
+            with TestClient(main.app) as client:
+                response = client.get(
+                    '/answers/stream/', params={'letters': 'APPLETAXX'}
+                )
+                self.assertEqual(response.status_code, 200)
+                self.assertTrue(
+                    response.headers['content-type'].startswith(
+                        'application/x-ndjson'
+                    )
+                )
+                self.assertEqual(
+                    response.headers['X-Dictionary-Version'],
+                    dictionary_version(self.dict_path)
+                )
+                self.assertTrue(response.text.endswith('\n'))
+                lines = response.text.splitlines()
+                results = [json.loads(line) for line in lines]
+                self.assertEqual(results, [
+                    {'word': 'apple', 'definition': 'a fruit', 'length': 5},
+                    {'word': 'tea', 'definition': 'a drink', 'length': 3},
+                    {'word': 'at', 'definition': 'in, on, or near',
+                     'length': 2},
+                ])
+
+                response = client.get('/answers/stream/', params={
+                    'letters': 'appletaxx',
+                    'definitions': 'false',
+                    'min_length': 3,
+                })
+                self.assertEqual(
+                    response.text,
+                    '{"word": "apple", "length": 5}\n'
+                    '{"word": "tea", "length": 3}\n'
+                )
+
+                response = client.get(
+                    '/answers/stream/', params={'letters': 'zzzzzzzzz'}
+                )
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response.text, '')
+
+                stats = client.get('/executor/stats/').json()
+                self.assertEqual(stats['queue_depth'], 0)
+                self.assertEqual(stats['completed'], 3)
+
+    def test_stream_closed_early(self):
+        """
+        Test that a stream closed before its end, as when the client
+        disconnects, closes its job so it leaves the executor's queue.
+        """
+        executor = SolverExecutor(threads=1, max_queue=1)
+        stream = iter([{'word': 'apple'}, {'word': 'tea'}, {'word': 'at'}])
+
+        async def read_first_line() -> tuple:
+            results = executor.iterate(stream)
+            lines = main.ndjson_lines([await results.__anext__()], results)
+            line = await lines.__anext__()
+            await lines.aclose()
+            # read before the loop closes any generator left open
+            return line, executor.queue_depth
+
+        self.assertEqual(
+            asyncio.run(read_first_line()), ('{"word": "apple"}\n', 0)
+        )
+        self.assertEqual(executor.stats()['completed'], 0)
+        self.assertEqual(next(stream), {'word': 'tea'})
+        executor.shutdown()
+
+    def test_get_answers_without_definitions(self):
+        """
+        Test that definitions=false leaves the definitions out.
+        """
+        with TestClient(main.app) as client:
+            response = client.get(
+                '/answers/get/',
+                params={'letters': 'appletaxx', 'definitions': 'false'}
+            )
+            self.assertEqual(response.json(), [
+                {'word': 'apple', 'length': 5},
+                {'word': 'tea', 'length': 3},
+                {'word': 'at', 'length': 2},
+            ])
+
+            response = client.get(
+                '/answers/get/', params={'letters': 'appletaxx'}
+            )
+            self.assertEqual(
+                [result['definition'] for result in response.json()],
+                ['a fruit', 'a drink', 'in, on, or near']
+            )
+
+    def test_get_answers_limit_and_min_length(self):
+        """
+        Test that limit keeps the longest words and min_length the words
+        at least that long, and that values out of range are rejected.
+        """
+        def words(**params) -> list:
+            response = client.get(
+                '/answers/get/', params={'letters': 'appletaxx', **params}
+            )
+            self.assertEqual(response.status_code, 200)
+            return [result['word'] for result in response.json()]
+
+        with TestClient(main.app) as client:
+            self.assertEqual(words(limit=1), ['apple'])
+            self.assertEqual(words(limit=2), ['apple', 'tea'])
+            self.assertEqual(words(limit=10), ['apple', 'tea', 'at'])
+            self.assertEqual(words(min_length=3), ['apple', 'tea'])
+            self.assertEqual(words(min_length=5), ['apple'])
+            self.assertEqual(words(min_length=6), [])
+            self.assertEqual(words(limit=1, min_length=3), ['apple'])
+
+            for params in (
+                {'limit': 0},
+                {'min_length': 1},
+                {'min_length': 10},
+            ):
+                response = client.get(
+                    '/answers/get/', params={'letters': 'appletaxx', **params}
+                )
+                self.assertEqual(response.status_code, 422)
+
+    def test_get_answers_cached(self):
+        """
+        Test that an anagram of a rack answered before is served from
+        the cache without solving it again.
+        """
+        with TestClient(main.app) as client:
+            before = client.get('/cache/stats/').json()
+            first = self.get_words(client, 'appletaxx')
+            with patch.object(
+                self.executor, 'solve', wraps=self.executor.solve
+            ) as solve:
+                self.assertEqual(self.get_words(client, 'XXATELPPA'), first)
+                self.assertEqual(self.get_words(client, 'ptaxlpeax'), first)
+                solve.assert_not_called()
+
+                response = client.get(
+                    '/answers/get/',
+                    params={'letters': 'appletaxx', 'definitions': 'false'}
+                )
+                self.assertEqual(response.status_code, 200)
+                solve.assert_called_once()
+
+            after = client.get('/cache/stats/').json()
+            self.assertEqual(after['hits'] - before['hits'], 2)
+            self.assertEqual(after['misses'] - before['misses'], 2)
+            self.assertEqual(after['size'], 2)
+
+    def test_cache_invalidated_on_reload(self):
+        """
+        Test that the cache is emptied when a new dictionary is swapped
+        in, so racks are answered from the new dictionary.
+        """
+        dictionary = load_dict(self.dict_path)
+        add_to_dict(dictionary, 'eat', 'to have food')
+        store_dict(dictionary, self.new_dict_path)
+
+        with patch.object(main, 'admin_token', 'secret'):
+            with TestClient(main.app) as client:
+                self.assertEqual(
+                    self.get_words(client, 'teaxxxxxx'), ['tea', 'at']
+                )
+                self.assertEqual(client.get('/cache/stats/').json()['size'], 1)
+
+                self.reload(client, self.new_dict_path)
+                self.store.wait()
+                self.assertEqual(client.get('/cache/stats/').json()['size'], 0)
+
+                self.assertCountEqual(
+                    self.get_words(client, 'teaxxxxxx'), ['tea', 'eat', 'at']
+                )
+
+    def test_scan_metrics(self):
+        """
+        Test that the records scanned are only served for engines which
+        count them, and are counted for each rack solved.
+        """
+        visited = ('letters_solver_records_visited_total', frozenset())
+        matched = ('letters_solver_records_matched_total', frozenset())
+
+        with TestClient(main.app) as client:
+            self.get_words(client, 'appletaxx')
+            self.assertNotIn(visited[0], {
+                name for name, _ in self.read_metrics(client)
+            })
+
+            bucket_store = DictionaryStore(
+                engine='bucket', on_swap=main.dictionary_swapped
+            )
+            with patch.object(main, 'store', bucket_store):
+                bucket_store.load(self.dict_path)
+                before = self.read_metrics(client)
+                self.get_words(client, 'teaxxxxxx')
+                after = self.read_metrics(client)
+
+        self.assertGreater(after[visited], before[visited])
+        self.assertEqual(after[matched] - before[matched], 2)
+
+    def test_non_ascii_letters_rejected(self):
+        """
+        Test that letters outside a to z are refused with a 400 rather
+        than reaching the count vectors of a binary dictionary.
+        """
+        binary_path = 'test_api_dictionary.bin'
+        store_dict_binary(load_dict(self.dict_path), binary_path)
+        for path in (binary_path, definitions_path(binary_path)):
+            self.addCleanup(os.remove, path)
+
+        with patch.object(main, 'dict_path', binary_path):
+            with TestClient(main.app) as client:
+                self.assertEqual(
+                    self.get_words(client, 'appletaxx')[0], 'apple'
+                )
+                for path, params in (
+                    ('/answers/get/', {'letters': 'éppletaxx'}),
+                    ('/answers/stream/', {'letters': 'éppletaxx'}),
+                    ('/answers/check/', {'letters': 'appletaxx',
+                                         'word': 'éat'}),
+                ):
+                    with self.subTest(path=path):
+                        response = client.get(path, params=params)
+                        self.assertEqual(response.status_code, 400)
+                response = client.post(
+                    '/answers/batch/',
+                    json={'racks': ['appletaxx', 'ßeaxxxxxx']}
+                )
+                self.assertEqual(response.status_code, 400)
+
+
+if __name__ == '__main__':
+    unittest.main()
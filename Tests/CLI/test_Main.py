@@ -10,12 +10,20 @@ from CLI.Main import (
     command_play_game,
     play_game_letter_generation,
     manually_enter_letters,
-    draw_letters
+    draw_letters,
+    parse_args,
+    command_precompute_answers
 )
 from LettersGame.CountdownSolver import (
     check_answer,
     solve_countdown,
-    output_words
+    output_words,
+    rack_signatures
+)
+from LettersGame.CreateDict import (
+    add_to_dict,
+    create_signature_index,
+    initialise_dict
 )
 
 
@@ -40,7 +48,7 @@ class TestMain(unittest.TestCase):
             The output contains the prompt "What would you like to do?".
             The command_create_dict function is called once.
         """
-        mock_create_dict.return_value = {'test': 'dictionary'}
+        mock_create_dict.return_value = ({'test': 'dictionary'}, 'version')
         with patch('sys.stdout', new=StringIO()) as fake_out:
             main(["main.py"])
         self.assertIn("What would you like to do?", fake_out.getvalue())
@@ -65,7 +73,7 @@ class TestMain(unittest.TestCase):
             The output contains the prompt "What would you like to do?".
             The command_load_dict function is called once.
         """
-        mock_load_dict.return_value = {'test': 'dictionary'}
+        mock_load_dict.return_value = ({'test': 'dictionary'}, 'version')
         with patch('sys.stdout', new=StringIO()) as fake_out:
             main(["main.py"])
         self.assertIn("What would you like to do?", fake_out.getvalue())
@@ -99,12 +107,85 @@ class TestMain(unittest.TestCase):
             The command_solve_countdown function is called once.
         """
         mock_dict = {'test': 'dictionary'}
-        mock_command_load_dict.return_value = mock_dict
+        mock_command_load_dict.return_value = (mock_dict, 'version')
         mock_command_solve_countdown.return_value = None
         with patch('sys.stdout', new=StringIO()) as fake_out:
             main(["main.py"])
         self.assertIn("What would you like to do?", fake_out.getvalue())
-        mock_command_solve_countdown.assert_called_once_with(mock_dict)
+        mock_command_solve_countdown.assert_called_once_with(
+            mock_dict, limit=None, min_length=2, solver=None
+        )
+
+    @patch('builtins.input', side_effect=['2', '3', '3', '-1'])
+    @patch('CLI.Main.create_engine')
+    @patch('CLI.Main.command_solve_countdown')
+    @patch('CLI.Main.command_load_dict')
+    def test_main_solve_countdown_with_limit(
+        self,
+        mock_command_load_dict,
+        mock_command_solve_countdown,
+        mock_create_engine,
+        mock_input
+    ):
+        """
+        Test that the --limit and --min-length options are passed on
+        when solving the countdown problem, with the signature engine
+        built once for the dictionary.
+
+        Args:
+            mock_command_load_dict (MagicMock): Mocked load dict function.
+            mock_command_solve_countdown (MagicMock): Mocked
+                    command_solve_countdown function.
+            mock_create_engine (MagicMock): Mocked create_engine.
+            mock_input (MagicMock): Mocked input function.
+
+        Asserts:
+            The command_solve_countdown function is called with the options
+            and the same solver each time.
+        """
+        mock_dict = {'test': 'dictionary'}
+        mock_command_load_dict.return_value = (mock_dict, 'version')
+        with patch('sys.stdout', new=StringIO()):
+            main(["main.py", "--limit", "5", "--min-length", "6"])
+        mock_create_engine.assert_called_once_with(mock_dict, "signature")
+        self.assertEqual(mock_command_solve_countdown.call_args_list, [
+            call(
+                mock_dict,
+                limit=5,
+                min_length=6,
+                solver=mock_create_engine.return_value
+            )
+        ] * 2)
+
+    def test_main_invalid_args(self):
+        """
+        Test the main function with invalid command-line arguments.
+
+        Asserts:
+            The usage is printed and the menu is never shown.
+        """
+        for args in (
+            ["main.py", "extra"],
+            ["main.py", "--limit", "x"],
+            ["main.py", "--limit", "0"],
+            ["main.py", "--min-length", "1"],
+        ):
+            with patch('sys.stdout', new=StringIO()) as fake_out:
+                main(args)
+            self.assertIn("Usage:", fake_out.getvalue())
+            self.assertNotIn("What would you like to do?", fake_out.getvalue())
+
+    def test_parse_args(self):
+        """
+        Test the parse_args function defaults and options.
+        """
+        options = parse_args([])
+        self.assertIsNone(options.limit)
+        self.assertEqual(options.min_length, 2)
+
+        options = parse_args(["--limit", "3", "--min-length", "7"])
+        self.assertEqual(options.limit, 3)
+        self.assertEqual(options.min_length, 7)
 
     @patch('builtins.input', side_effect=['2', '4', '-1'])
     @patch('CLI.Main.command_play_game')
@@ -133,14 +214,44 @@ class TestMain(unittest.TestCase):
             The command_play_game function is called once.
         """
         mock_dict = {'test': 'dictionary'}
-        mock_command_load_dict.return_value = mock_dict
+        mock_command_load_dict.return_value = (mock_dict, 'version')
         mock_command_play_game.return_value = None
         with patch('sys.stdout', new=StringIO()) as fake_out:
             main(["main.py"])
         self.assertIn("What would you like to do?", fake_out.getvalue())
         mock_command_play_game.assert_called_once_with(mock_dict)
 
-    @patch('builtins.input', side_effect=['5', '-1'])
+    @patch('builtins.input', side_effect=['2', '5', '-1'])
+    @patch('CLI.Main.command_precompute_answers')
+    @patch('CLI.Main.command_load_dict')
+    def test_main_precompute_answers(
+        self,
+        mock_command_load_dict,
+        mock_command_precompute_answers,
+        mock_input
+    ):
+        """
+        Test the main function when the user chooses to precompute answers.
+
+        Args:
+            mock_command_load_dict (MagicMock): Mocked load dict function.
+            mock_command_precompute_answers (MagicMock): Mocked
+                    command_precompute_answers function.
+            mock_input (MagicMock): Mocked input function.
+
+        Asserts:
+            The command_precompute_answers function is called
+            with the loaded dictionary and the version of its file.
+        """
+        mock_dict = {'test': 'dictionary'}
+        mock_command_load_dict.return_value = (mock_dict, 'version')
+        with patch('sys.stdout', new=StringIO()):
+            main(["main.py"])
+        mock_command_precompute_answers.assert_called_once_with(
+            mock_dict, 'version'
+        )
+
+    @patch('builtins.input', side_effect=['9', '-1'])
     def test_main_invalid_choice(self, mock_input):
         """
         Test the main function when the user chooses an invalid option.
@@ -198,29 +309,38 @@ class TestMain(unittest.TestCase):
         self.assertIn("You must load a dictionary first", fake_out.getvalue())
 
     @patch('builtins.input', side_effect=['/path/to/csv', '/path/to/json'])
+    @patch('CLI.Main.dictionary_version', return_value='0123456789ab')
     @patch('CLI.Main.create_dict')
-    def test_command_create_dict_success(self, mock_create_dict, mock_input):
+    def test_command_create_dict_success(
+        self,
+        mock_create_dict,
+        mock_dictionary_version,
+        mock_input
+    ):
         """
         Test the command_create_dict function when the dictionary is created
         successfully.
 
         This test simulates user input for the CSV and JSON file paths and
         mocks the create_dict function to return a test dictionary.
-        It verifies that the function returns the expected dictionary and the
-        appropriate success message is displayed.
+        It verifies that the function returns the expected dictionary with
+        the version of its file and the appropriate success message is
+        displayed.
 
         Args:
             mock_create_dict (MagicMock): Mocked create_dict function.
+            mock_dictionary_version (MagicMock): Mocked dictionary_version.
             mock_input (MagicMock): Mocked input function.
 
         Asserts:
-            The result is the test dictionary.
+            The result is the test dictionary and the version of its file.
             The output contains the message "Dictionary created successfully".
         """
         mock_create_dict.return_value = {'test': 'dictionary'}
         with patch('sys.stdout', new=StringIO()) as fake_out:
             result = command_create_dict()
-        self.assertEqual(result, {'test': 'dictionary'})
+        mock_dictionary_version.assert_called_once_with('/path/to/json')
+        self.assertEqual(result, ({'test': 'dictionary'}, '0123456789ab'))
         self.assertIn("Dictionary created successfully", fake_out.getvalue())
 
     @patch('builtins.input', side_effect=['/path/to/csv', '/path/to/json'])
@@ -229,35 +349,44 @@ class TestMain(unittest.TestCase):
         mock_create_dict.return_value = None
         with patch('sys.stdout', new=StringIO()) as fake_out:
             result = command_create_dict()
-        self.assertIsNone(result)
+        self.assertEqual(result, (None, None))
         self.assertIn(
             "Error: Failed to create dictionary", fake_out.getvalue()
         )
 
     @patch('builtins.input', return_value='/path/to/json')
+    @patch('CLI.Main.dictionary_version', return_value='0123456789ab')
     @patch('CLI.Main.load_dict')
-    def test_command_load_dict_success(self, mock_load_dict, mock_input):
+    def test_command_load_dict_success(
+        self,
+        mock_load_dict,
+        mock_dictionary_version,
+        mock_input
+    ):
         """
         Test the command_load_dict function when the dictionary is loaded
         successfully.
 
         This test simulates user input for the JSON file path and mocks the
         load_dict function to return a test dictionary.
-        It verifies that the function returns the expected dictionary and the
-        appropriate success message is displayed.
+        It verifies that the function returns the expected dictionary with
+        the version of its file and the appropriate success message is
+        displayed.
 
         Args:
             mock_load_dict (MagicMock): Mocked load_dict function.
+            mock_dictionary_version (MagicMock): Mocked dictionary_version.
             mock_input (MagicMock): Mocked input function.
 
         Asserts:
-            The result is the test dictionary.
+            The result is the test dictionary and the version of its file.
             The output contains the message "Dictionary loaded successfully".
         """
         mock_load_dict.return_value = {'test': 'dictionary'}
         with patch('sys.stdout', new=StringIO()) as fake_out:
             result = command_load_dict()
-        self.assertEqual(result, {'test': 'dictionary'})
+        mock_dictionary_version.assert_called_once_with('/path/to/json')
+        self.assertEqual(result, ({'test': 'dictionary'}, '0123456789ab'))
         self.assertIn("Dictionary loaded successfully", fake_out.getvalue())
 
     @patch('builtins.input', return_value='/path/to/json')
@@ -276,45 +405,106 @@ class TestMain(unittest.TestCase):
             mock_input (MagicMock): Mocked input function.
 
         Asserts:
-            The result is None.
+            The result is None with no version.
             The output contains the message "Error: Failed to load dictionary".
         """
         mock_load_dict.return_value = None
         with patch('sys.stdout', new=StringIO()) as fake_out:
             result = command_load_dict()
-        self.assertIsNone(result)
+        self.assertEqual(result, (None, None))
         self.assertIn("Error: Failed to load dictionary", fake_out.getvalue())
 
+    @patch('builtins.input', side_effect=['racks.txt', 'answers.db'])
+    @patch('CLI.Main.read_racks', return_value=['abcdefghi'])
+    @patch('CLI.Main.create_engine')
+    @patch('CLI.Main.build_answer_table', return_value=1)
+    def test_command_precompute_answers(
+        self,
+        mock_build_answer_table,
+        mock_create_engine,
+        mock_read_racks,
+        mock_input
+    ):
+        """
+        Test the command_precompute_answers function when the racks are read.
+
+        Args:
+            mock_build_answer_table (MagicMock): Mocked build_answer_table.
+            mock_create_engine (MagicMock): Mocked create_engine.
+            mock_read_racks (MagicMock): Mocked read_racks.
+            mock_input (MagicMock): Mocked input function.
+
+        Asserts:
+            The table is built from the racks with the dictionary's solver
+            and records the version of the dictionary file.
+        """
+        mock_dict = {'test': 'dictionary'}
+        with patch('sys.stdout', new=StringIO()) as fake_out:
+            command_precompute_answers(mock_dict, '0123456789ab')
+
+        mock_read_racks.assert_called_once_with('racks.txt')
+        mock_create_engine.assert_called_once_with(mock_dict)
+        mock_build_answer_table.assert_called_once_with(
+            ['abcdefghi'],
+            mock_create_engine.return_value,
+            'answers.db',
+            version='0123456789ab'
+        )
+        self.assertIn("Answers to 1 racks stored", fake_out.getvalue())
+
+    @patch('builtins.input', side_effect=['racks.txt', 'answers.db'])
+    @patch('CLI.Main.read_racks', return_value=None)
+    @patch('CLI.Main.build_answer_table')
+    def test_command_precompute_answers_failure(
+        self,
+        mock_build_answer_table,
+        mock_read_racks,
+        mock_input
+    ):
+        """
+        Test the command_precompute_answers function when the racks
+        cannot be read.
+
+        Asserts:
+            No table is built and an error is printed.
+        """
+        with patch('sys.stdout', new=StringIO()) as fake_out:
+            command_precompute_answers({'test': 'dictionary'}, 'version')
+
+        mock_build_answer_table.assert_not_called()
+        self.assertIn("Error: Failed to read racks", fake_out.getvalue())
+
     @patch('builtins.input', return_value='ABCDEFGHI')
-    @patch('CLI.Main.solve_countdown')
+    @patch('CLI.Main.create_engine')
     @patch('CLI.Main.output_words')
     def test_command_solve_countdown_success(
         self,
         mock_output_words,
-        mock_solve_countdown,
+        mock_create_engine,
         mock_input
     ):
         """
         Test the command_solve_countdown function when the countdown is solved
-        successfully.
+        successfully with a limit.
 
         This test simulates user input for the letters and mocks the
-        solve_countdown and output_words functions. It verifies that the
+        signature engine and output_words functions. It verifies that the
         appropriate functions are called and the expected output is produced.
 
         Args:
             mock_output_words (MagicMock): Mocked output_words function.
-            mock_solve_countdown (MagicMock): Mocked solve_countdown function.
+            mock_create_engine (MagicMock): Mocked create_engine function.
             mock_input (MagicMock): Mocked input function.
 
         Asserts:
-            The solve_countdown function is called with the correct arguments.
+            The signature engine is called with the correct arguments.
             The output_words function is called with the correct arguments.
             The output contains the message:
                 "Countdown problem solved successfully".
         """
         mock_dict = {'test': 'dictionary'}
-        mock_solve_countdown.return_value = [
+        mock_solver = mock_create_engine.return_value
+        mock_solver.return_value = [
             {
                 'word': 'abc',
                 'definition': 'test'
@@ -322,9 +512,12 @@ class TestMain(unittest.TestCase):
         ]
 
         with patch('sys.stdout', new=StringIO()) as fake_out:
-            command_solve_countdown(mock_dict)
+            command_solve_countdown(mock_dict, limit=3)
 
-        mock_solve_countdown.assert_called_once_with('abcdefghi', mock_dict)
+        mock_create_engine.assert_called_once_with(mock_dict, "signature")
+        mock_solver.assert_called_once_with(
+            'abcdefghi', limit=3, min_length=2
+        )
 
         mock_output_words.assert_called_once_with([
             {
@@ -337,6 +530,88 @@ class TestMain(unittest.TestCase):
             "Countdown problem solved successfully", fake_out.getvalue()
         )
 
+    @patch('builtins.input', return_value='ABCDEFGHI')
+    @patch('CLI.Main.iter_countdown')
+    @patch('CLI.Main.output_words_stream', return_value=1)
+    def test_command_solve_countdown_stream(
+        self,
+        mock_output_words_stream,
+        mock_iter_countdown,
+        mock_input
+    ):
+        """
+        Test the command_solve_countdown function without a limit,
+        where the words are output as they are found.
+
+        Args:
+            mock_output_words_stream (MagicMock): Mocked output_words_stream.
+            mock_iter_countdown (MagicMock): Mocked iter_countdown function.
+            mock_input (MagicMock): Mocked input function.
+
+        Asserts:
+            The stream of words is output.
+            The output contains the message:
+                "Countdown problem solved successfully".
+        """
+        mock_dict = {'test': 'dictionary'}
+
+        with patch('sys.stdout', new=StringIO()) as fake_out:
+            command_solve_countdown(mock_dict, min_length=4)
+
+        mock_iter_countdown.assert_called_once_with(
+            'abcdefghi', mock_dict, min_length=4
+        )
+        mock_output_words_stream.assert_called_once_with(
+            mock_iter_countdown.return_value
+        )
+        self.assertIn(
+            "Countdown problem solved successfully", fake_out.getvalue()
+        )
+
+    @patch('builtins.input', return_value='APPLETAXX')
+    def test_command_solve_countdown_limit_stops_early(self, mock_input):
+        """
+        Test that with a limit the words are found longest first and the
+        search stops once the limit is reached, rather than every
+        sub-multiset of the letters being looked up.
+
+        Args:
+            mock_input (MagicMock): Mocked input function.
+
+        Asserts:
+            The longest word is shown and fewer signatures are looked up
+            than the letters have.
+        """
+        class CountingIndex(dict):
+            lookups = 0
+
+            def get(self, key, default=None):
+                self.lookups += 1
+                return super().get(key, default)
+
+        class IndexedDict(dict):
+            pass
+
+        dictionary = initialise_dict()
+        add_to_dict(dictionary, 'apple', 'a fruit')
+        add_to_dict(dictionary, 'tea', 'a drink')
+        add_to_dict(dictionary, 'at', 'in, on, or near')
+        indexed = IndexedDict(dictionary)
+        indexed.signature_index = CountingIndex(
+            create_signature_index(dictionary)
+        )
+
+        with patch('sys.stdout', new=StringIO()) as fake_out:
+            command_solve_countdown(indexed, limit=1)
+
+        self.assertIn('apple', fake_out.getvalue())
+        self.assertNotIn('tea', fake_out.getvalue())
+        self.assertGreater(indexed.signature_index.lookups, 0)
+        self.assertLess(
+            indexed.signature_index.lookups,
+            len(list(rack_signatures('appletaxx')))
+        )
+
     @patch('builtins.input', side_effect=['INVALID', "-1"])
     def test_command_solve_countdown_invalid_input(self, mock_input):
         """
@@ -814,8 +1089,8 @@ class TestMain(unittest.TestCase):
 
         mock_play_game_letter_generation.assert_called_once()
         mock_check_answer.assert_has_calls([
-            call('aaaa', 'aaaaaaaaa', {}),
-            call('bbbb', 'aaaaaaaaa', {})
+            call('aaaa', 'aaaaaaaaa', {}, word_index={}),
+            call('bbbb', 'aaaaaaaaa', {}, word_index={})
         ])
         self.assertNotIn("Invalid Guess", fake_out.getvalue())
         self.assertNotIn("incorrect", fake_out.getvalue())
@@ -2,6 +2,23 @@ import unittest
 from .test_CreateDict import TestCreateDict
 from .test_CountdownSolver import TestCountdownSolver
 from .CLI.test_Main import TestMain
+from .test_BinaryDict import TestBinaryDict
+from .test_MappedDict import TestMappedDict
+from .test_TrieSolver import TestTrieSolver
+from .test_Engines import TestEngines
+from .test_ResultCache import TestResultCache
+from .test_AnswerTable import TestAnswerTable
+from .test_BatchSolver import TestBatchSolver
+from .test_MatrixSolver import TestMatrixSolver
+from .test_IncrementalDict import TestIncrementalDict
+from .test_StreamDict import TestStreamDict
+from .test_DictionaryStore import TestDictionaryStore
+from .test_SolverExecutor import TestSolverExecutor
+from .test_GameSessions import TestGameSessions
+from .test_BloomFilter import TestBloomFilter
+from .test_Metrics import TestMetrics
+from .API.test_main import TestAPI
+from .benchmarks.test_Measure import TestMeasure
 
 
 def suite():
@@ -10,6 +27,23 @@ def suite():
     suite.addTest(loader.loadTestsFromTestCase(TestCreateDict))
     suite.addTest(loader.loadTestsFromTestCase(TestMain))
     suite.addTest(loader.loadTestsFromTestCase(TestCountdownSolver))
+    suite.addTest(loader.loadTestsFromTestCase(TestBinaryDict))
+    suite.addTest(loader.loadTestsFromTestCase(TestMappedDict))
+    suite.addTest(loader.loadTestsFromTestCase(TestTrieSolver))
+    suite.addTest(loader.loadTestsFromTestCase(TestEngines))
+    suite.addTest(loader.loadTestsFromTestCase(TestResultCache))
+    suite.addTest(loader.loadTestsFromTestCase(TestAnswerTable))
+    suite.addTest(loader.loadTestsFromTestCase(TestBatchSolver))
+    suite.addTest(loader.loadTestsFromTestCase(TestMatrixSolver))
+    suite.addTest(loader.loadTestsFromTestCase(TestIncrementalDict))
+    suite.addTest(loader.loadTestsFromTestCase(TestStreamDict))
+    suite.addTest(loader.loadTestsFromTestCase(TestDictionaryStore))
+    suite.addTest(loader.loadTestsFromTestCase(TestSolverExecutor))
+    suite.addTest(loader.loadTestsFromTestCase(TestGameSessions))
+    suite.addTest(loader.loadTestsFromTestCase(TestBloomFilter))
+    suite.addTest(loader.loadTestsFromTestCase(TestMetrics))
+    suite.addTest(loader.loadTestsFromTestCase(TestAPI))
+    suite.addTest(loader.loadTestsFromTestCase(TestMeasure))
     return suite
 
 
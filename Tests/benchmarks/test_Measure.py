@@ -0,0 +1,68 @@
+import unittest
+from benchmarks.Corpus import draw_non_words, draw_racks
+from benchmarks.Measure import compare, percentile, summarise, time_calls
+from CLI.Main import CONSONANTS, VOWLS
+
+
+class TestMeasure(unittest.TestCase):
+    """
+    Test suite for the benchmark inputs and measurements.
+    """
+
+    def test_draw_racks(self):
+        """
+        Test that racks are 9 letters drawn from the CLI's pools
+        and the same seed draws the same racks.
+        """
+        racks = draw_racks(20, seed=1)
+        self.assertEqual(racks, draw_racks(20, seed=1))
+        self.assertNotEqual(racks, draw_racks(20, seed=2))
+        for rack in racks:
+            self.assertEqual(len(rack), 9)
+            self.assertTrue(all(c in VOWLS + CONSONANTS for c in rack))
+
+        for word in draw_non_words(20, seed=1):
+            self.assertTrue(3 <= len(word) <= 9)
+
+    def test_percentile(self):
+        """
+        Test percentiles by the nearest rank method.
+        """
+        values = list(range(100, 0, -1))
+        self.assertEqual(percentile(values, 0.50), 50)
+        self.assertEqual(percentile(values, 0.95), 95)
+        self.assertEqual(percentile(values, 0.99), 99)
+        self.assertEqual(percentile([7], 0.99), 7)
+        with self.assertRaises(ValueError):
+            percentile([], 0.5)
+
+    def test_summarise(self):
+        """
+        Test that samples are summarised in milliseconds
+        with their throughput.
+        """
+        latencies, elapsed = time_calls(lambda value: value * 2, range(10))
+        self.assertEqual(len(latencies), 10)
+        self.assertGreaterEqual(elapsed, sum(latencies))
+
+        summary = summarise([1000000] * 4, 2000000000, peak_rss=1024)
+        self.assertEqual(summary['samples'], 4)
+        self.assertEqual(summary['p50_ms'], 1.0)
+        self.assertEqual(summary['p99_ms'], 1.0)
+        self.assertEqual(summary['throughput_per_s'], 2.0)
+        self.assertEqual(summary['peak_rss_kb'], 1024)
+
+    def test_compare(self):
+        """
+        Test that only p95 growth past the threshold is a regression.
+        """
+        baseline = {'results': {
+            'a': {'p95_ms': 1.0}, 'b': {'p95_ms': 1.0}, 'c': {'skipped': ''}
+        }}
+        current = {'results': {
+            'a': {'p95_ms': 1.05}, 'b': {'p95_ms': 1.2},
+            'c': {'p95_ms': 9.0}, 'd': {'p95_ms': 9.0}
+        }}
+        self.assertEqual(
+            compare(baseline, current, 0.1), ['b: p95 1.0ms -> 1.2ms']
+        )
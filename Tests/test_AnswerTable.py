@@ -0,0 +1,144 @@
+import unittest
+import os
+import sqlite3
+from LettersGame.AnswerTable import (
+    AnswerTable,
+    build_answer_table,
+    read_racks
+)
+from LettersGame.CreateDict import initialise_dict, add_to_dict
+from LettersGame.Engines import create_engine
+
+
+class TestAnswerTable(unittest.TestCase):
+    """
+    Test suite for the table of precomputed answers.
+    """
+
+    def setUp(self):
+        """
+        Set up a sample dictionary, its solver and the paths used.
+        """
+        self.racks_path = 'test_racks.txt'
+        self.table_path = 'test_answers.db'
+        self.dictionary = initialise_dict()
+        add_to_dict(self.dictionary, 'apple', 'a fruit')
+        add_to_dict(self.dictionary, 'at', 'in, on, or near')
+        add_to_dict(self.dictionary, 'tea', 'a drink')
+        self.solver = create_engine(self.dictionary)
+
+    def tearDown(self):
+        """
+        Removes the files created by the tests.
+        """
+        for path in (self.racks_path, self.table_path):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def test_read_racks(self):
+        """
+        Test that racks are read in canonical form without repeats.
+        """
+        with open(self.racks_path, 'w') as file:
+            file.write('APPLETAXX\n\nxxatelppa\nteaxxxxxx\n')
+
+        self.assertEqual(
+            read_racks(self.racks_path), ['aaelpptxx', 'aetxxxxxx']
+        )
+
+    def test_read_racks_invalid(self):
+        """
+        Test that a missing file or a rack which is not all letters
+        returns None.
+        """
+        self.assertIsNone(read_racks(self.racks_path))
+
+        with open(self.racks_path, 'w') as file:
+            file.write('appletaxx\napple-axx\n')
+        self.assertIsNone(read_racks(self.racks_path))
+
+    def test_build_and_get(self):
+        """
+        Test that stored answers match the solver, longest first,
+        for any order and case of the rack.
+        """
+        count = build_answer_table(
+            ['appletaxx', 'XXATELPPA', 'teaxxxxxx'],
+            self.solver,
+            self.table_path
+        )
+        self.assertEqual(count, 2)
+
+        table = AnswerTable(self.table_path)
+        self.assertEqual(len(table), 2)
+        self.assertIn('ELPPAXXTA', table)
+        self.assertNotIn('zzzzzzzzz', table)
+        self.assertIsNone(table.get('zzzzzzzzz'))
+
+        result = table.get('ELPPAXXTA')
+        self.assertEqual(
+            [record['word'] for record in result], ['apple', 'tea', 'at']
+        )
+        self.assertCountEqual(result, self.solver('appletaxx'))
+        table.close()
+
+    def test_get_options(self):
+        """
+        Test that the definitions, limit and min_length options
+        are applied to the stored answers.
+        """
+        build_answer_table(['appletaxx'], self.solver, self.table_path)
+        table = AnswerTable(self.table_path)
+
+        self.assertEqual(
+            table.get('appletaxx', include_definitions=False, limit=2),
+            [{'word': 'apple', 'length': 5}, {'word': 'tea', 'length': 3}]
+        )
+        self.assertEqual(
+            [r['word'] for r in table.get('appletaxx', min_length=3)],
+            ['apple', 'tea']
+        )
+        table.close()
+
+    def test_rebuild_replaces_table(self):
+        """
+        Test that building over an existing table replaces it.
+        """
+        build_answer_table(['appletaxx'], self.solver, self.table_path)
+        build_answer_table(['teaxxxxxx'], self.solver, self.table_path)
+
+        table = AnswerTable(self.table_path)
+        self.assertNotIn('appletaxx', table)
+        self.assertIn('teaxxxxxx', table)
+        table.close()
+        self.assertFalse(os.path.exists(self.table_path + '.tmp'))
+
+    def test_dictionary_version(self):
+        """
+        Test that the version of the dictionary is stored with the answers,
+        and is None when it was not given or the table has no meta table.
+        """
+        build_answer_table(
+            ['appletaxx'], self.solver, self.table_path, version='0123abcd'
+        )
+        table = AnswerTable(self.table_path)
+        self.assertEqual(table.version, '0123abcd')
+        table.close()
+
+        build_answer_table(['appletaxx'], self.solver, self.table_path)
+        table = AnswerTable(self.table_path)
+        self.assertIsNone(table.version)
+        table.close()
+
+        connection = sqlite3.connect(self.table_path)
+        connection.execute('DROP TABLE meta')
+        connection.commit()
+        connection.close()
+        table = AnswerTable(self.table_path)
+        self.assertIsNone(table.version)
+        self.assertIn('appletaxx', table)
+        table.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+import unittest
+import os
+from LettersGame.BatchSolver import solve_racks
+from LettersGame.BinaryDict import store_dict_binary, definitions_path
+from LettersGame.CreateDict import initialise_dict, add_to_dict
+from LettersGame.Engines import create_engine
+
+
+class TestBatchSolver(unittest.TestCase):
+    """
+    Test suite for the process pool batch solver.
+    """
+
+    def setUp(self):
+        """
+        Store a sample dictionary for the workers to load.
+        """
+        self.binary_path = 'test_batch_dictionary.bin'
+        self.dictionary = initialise_dict()
+        add_to_dict(self.dictionary, 'apple', 'a fruit')
+        add_to_dict(self.dictionary, 'at', 'in, on, or near')
+        add_to_dict(self.dictionary, 'tea', 'a drink')
+        store_dict_binary(self.dictionary, self.binary_path)
+        self.racks = [
+            'appletaxx', 'teaxxxxxx', 'zzzzzzzzz', 'atxxxxxxx', 'xxatelppa'
+        ]
+
+    def tearDown(self):
+        """
+        Removes the dictionary files.
+        """
+        for path in (self.binary_path, definitions_path(self.binary_path)):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def test_results_in_order(self):
+        """
+        Test that every rack is solved as by the engine and the results
+        come back in the order of the racks, across several chunks.
+        """
+        solver = create_engine(self.dictionary)
+        result = list(solve_racks(
+            iter(self.racks), self.binary_path, workers=2, chunk_size=2
+        ))
+
+        self.assertEqual([rack for rack, _ in result], self.racks)
+        for rack, answers in result:
+            self.assertEqual(answers, solver(rack))
+
+    def test_options(self):
+        """
+        Test that the query options are passed to the workers.
+        """
+        result = list(solve_racks(
+            ['appletaxx'],
+            self.binary_path,
+            engine='trie',
+            workers=1,
+            include_definitions=False,
+            limit=1,
+            min_length=3
+        ))
+        self.assertEqual(
+            result, [('appletaxx', [{'word': 'apple', 'length': 5}])]
+        )
+
+    def test_no_racks(self):
+        """
+        Test that an empty stream of racks gives no results.
+        """
+        self.assertEqual(
+            list(solve_racks([], self.binary_path, workers=1)), []
+        )
+
+    def test_invalid_chunk_size(self):
+        """
+        Test that a chunk size below 1 raises a ValueError.
+        """
+        with self.assertRaises(ValueError):
+            list(solve_racks(self.racks, self.binary_path, chunk_size=0))
+
+
+if __name__ == '__main__':
+    unittest.main()
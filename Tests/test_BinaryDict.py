@@ -0,0 +1,173 @@
+import unittest
+import os
+import struct
+from LettersGame.BinaryDict import (
+    BINARY_VERSION,
+    HEADER,
+    definitions_path,
+    is_binary_dict,
+    store_dict_binary,
+    load_dict_binary,
+    word_count_vector,
+    pack_count_vector
+)
+from LettersGame.CreateDict import (
+    initialise_dict,
+    add_to_dict,
+    load_dict,
+    store_dict,
+    pack_letter_counts
+)
+from LettersGame.CountdownSolver import solve_countdown
+from collections import Counter
+
+
+class TestBinaryDict(unittest.TestCase):
+    """
+    Test suite for the BinaryDict module functions.
+    """
+
+    def setUp(self):
+        """
+        Set up a sample dictionary and the paths used by the tests.
+        """
+        self.binary_path = 'test_dictionary.bin'
+        self.json_path = 'test_dictionary.json'
+        self.dictionary = initialise_dict()
+        add_to_dict(self.dictionary, 'apple', 'a fruit')
+        add_to_dict(self.dictionary, 'apple', 'a tree')
+        add_to_dict(self.dictionary, 'at', 'in, on, or near')
+        add_to_dict(self.dictionary, 'zebra', 'a striped animal – café')
+
+    def tearDown(self):
+        """
+        Removes the files created by the tests.
+        """
+        for path in (
+            self.binary_path,
+            definitions_path(self.binary_path),
+            self.json_path
+        ):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def test_round_trip(self):
+        """
+        Test that a stored dictionary loads with the same words,
+        definitions, masks and packed counts in the same buckets and order.
+        """
+        store_dict_binary(self.dictionary, self.binary_path)
+        result = load_dict_binary(self.binary_path)
+
+        self.assertEqual(len(result), 26)
+        for first_letter in self.dictionary:
+            for second_letter in self.dictionary[first_letter]:
+                expected = self.dictionary[first_letter][second_letter]
+                loaded = result[first_letter][second_letter]
+                self.assertEqual(len(loaded), len(expected))
+                for loaded_record, record in zip(loaded, expected):
+                    for key in (
+                        'word',
+                        'definitions',
+                        'count',
+                        'letter_mask',
+                        'packed_counts'
+                    ):
+                        self.assertEqual(loaded_record[key], record[key])
+
+    def test_definitions_side_file(self):
+        """
+        Test that the definitions are stored apart from the word index
+        and can be left out when loading.
+        """
+        store_dict_binary(self.dictionary, self.binary_path)
+
+        self.assertTrue(os.path.exists(definitions_path(self.binary_path)))
+        with open(self.binary_path, 'rb') as file:
+            self.assertNotIn(b'a fruit', file.read())
+
+        result = load_dict_binary(
+            self.binary_path, include_definitions=False
+        )
+        self.assertEqual(result['a']['p'][0]['word'], 'apple')
+        self.assertNotIn('definitions', result['a']['p'][0])
+
+    def test_solve_with_loaded_dict(self):
+        """
+        Test that the solver gives the same answers from a loaded
+        binary dictionary as from the dictionary it was built from.
+        """
+        store_dict_binary(self.dictionary, self.binary_path)
+        result = load_dict_binary(self.binary_path)
+
+        self.assertEqual(
+            solve_countdown('applezebt', result),
+            solve_countdown('applezebt', self.dictionary)
+        )
+
+    def test_is_binary_dict(self):
+        """
+        Test that binary dictionaries are detected and JSON ones are not.
+        """
+        store_dict_binary(self.dictionary, self.binary_path)
+        store_dict(self.dictionary, self.json_path)
+
+        self.assertTrue(is_binary_dict(self.binary_path))
+        self.assertFalse(is_binary_dict(self.json_path))
+
+    def test_store_and_load_dict_detect_format(self):
+        """
+        Test that store_dict writes the binary format for ".bin" paths
+        and load_dict detects it.
+        """
+        store_dict(self.dictionary, self.binary_path)
+
+        self.assertTrue(is_binary_dict(self.binary_path))
+        result = load_dict(self.binary_path)
+        self.assertEqual(
+            result['a']['p'][0]['definitions'], ['a fruit', 'a tree']
+        )
+
+    def test_unsupported_version(self):
+        """
+        Test that a file with a different version is rejected
+        and load_dict returns None for it.
+        """
+        store_dict_binary(self.dictionary, self.binary_path)
+        with open(self.binary_path, 'r+b') as file:
+            file.seek(8)
+            file.write(struct.pack('<H', BINARY_VERSION + 1))
+
+        with self.assertRaises(ValueError):
+            load_dict_binary(self.binary_path)
+        self.assertIsNone(load_dict(self.binary_path))
+
+    def test_truncated_file(self):
+        """
+        Test that a file shorter than the header is rejected.
+        """
+        with open(self.binary_path, 'wb') as file:
+            file.write(b'CDLGDICT')
+
+        self.assertLess(8, HEADER.size)
+        with self.assertRaises(ValueError):
+            load_dict_binary(self.binary_path)
+
+    def test_count_vectors(self):
+        """
+        Test that a word's count vector converts to the same
+        packed counts as CreateDict.pack_letter_counts.
+        """
+        vector = word_count_vector('banana')
+        self.assertEqual(len(vector), 26)
+        self.assertEqual(vector[0], 3)
+        self.assertEqual(vector[1], 1)
+        self.assertEqual(vector[13], 2)
+        self.assertEqual(
+            pack_count_vector(vector),
+            pack_letter_counts(Counter('banana'))
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
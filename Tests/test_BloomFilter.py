@@ -0,0 +1,238 @@
+import unittest
+import os
+import random
+import shutil
+import string
+from LettersGame.BloomFilter import (
+    BLOOM_HEADER,
+    BLOOM_MAGIC,
+    BloomFilter,
+    bloom_path
+)
+from LettersGame.CreateDict import (
+    initialise_dict,
+    add_to_dict,
+    create_dict,
+    create_bloom_filter,
+    load_dict,
+    store_dict
+)
+from LettersGame.DictionaryStore import DictionaryStore, dictionary_version
+from LettersGame.IncrementalDict import update_dict
+from LettersGame.StreamDict import compile_dict
+
+
+class TestBloomFilter(unittest.TestCase):
+    """
+    Test suite for the Bloom filter of the words of a dictionary.
+    """
+
+    def setUp(self):
+        """
+        Set up random words and the paths used.
+        """
+        generator = random.Random(0)
+        self.words = {
+            "".join(generator.choices(string.ascii_lowercase, k=7))
+            for _ in range(2000)
+        }
+        self.others = {
+            "".join(generator.choices(string.ascii_lowercase, k=8))
+            for _ in range(2000)
+        }
+        self.csv_path = 'test_bloom_words.csv'
+        self.dict_path = 'test_bloom_dictionary.json'
+        self.directory = 'test_bloom_shards'
+
+    def tearDown(self):
+        """
+        Removes the files created by the tests.
+        """
+        paths = (
+            self.csv_path,
+            self.dict_path,
+            bloom_path(self.dict_path),
+            bloom_path(self.directory)
+        )
+        for path in paths:
+            if os.path.exists(path):
+                os.remove(path)
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def write_csv(self, *words: str) -> None:
+        """
+        Write a dataset CSV of words.
+        """
+        with open(self.csv_path, 'w') as f:
+            f.write('Word,Count,Type,Definition\n')
+            for word in words:
+                f.write(f'{word},{len(word)},noun,a {word}\n')
+
+    def test_false_positive_rate(self):
+        """
+        Test that every word added is present and the words not added
+        are reported present at about the false positive rate.
+        """
+        bloom_filter = BloomFilter.for_capacity(len(self.words), 0.01)
+        bloom_filter.update(self.words)
+
+        self.assertTrue(all(word in bloom_filter for word in self.words))
+        false_positives = sum(word in bloom_filter for word in self.others)
+        self.assertLess(false_positives / len(self.others), 0.03)
+        # about 1.2 bytes a word at 1%
+        self.assertLess(len(bloom_filter.bits), 1.3 * len(self.words))
+
+    def test_store_and_load(self):
+        """
+        Test that a stored filter loads with the same bits.
+        """
+        bloom_filter = BloomFilter.for_capacity(len(self.words), 0.05)
+        bloom_filter.update(self.words)
+        bloom_filter.store(bloom_path(self.dict_path))
+
+        loaded = BloomFilter.load(bloom_path(self.dict_path))
+        self.assertEqual(loaded.bit_count, bloom_filter.bit_count)
+        self.assertEqual(loaded.hash_count, bloom_filter.hash_count)
+        self.assertEqual(loaded.bits, bloom_filter.bits)
+        self.assertIsNone(loaded.dictionary_version)
+
+        bloom_filter.dictionary_version = '0123456789ab'
+        bloom_filter.store(bloom_path(self.dict_path))
+        loaded = BloomFilter.load(bloom_path(self.dict_path))
+        self.assertEqual(loaded.dictionary_version, '0123456789ab')
+        self.assertEqual(loaded.bits, bloom_filter.bits)
+
+        bloom_filter.dictionary_version = 'a' * 17
+        with self.assertRaises(ValueError):
+            bloom_filter.store(bloom_path(self.dict_path))
+
+        with open(self.dict_path, 'wb') as f:
+            f.write(b'not a filter')
+        with self.assertRaises(ValueError):
+            BloomFilter.load(self.dict_path)
+
+    def test_invalid_false_positive_rate(self):
+        """
+        Test that a false positive rate outside (0, 1) raises ValueError.
+        """
+        for rate in (0, 1, 1.5):
+            with self.assertRaises(ValueError):
+                BloomFilter.for_capacity(10, rate)
+
+    def test_create_bloom_filter(self):
+        """
+        Test that the filter of a dictionary holds its words.
+        """
+        dictionary = initialise_dict()
+        add_to_dict(dictionary, 'apple', 'a fruit')
+        add_to_dict(dictionary, 'tea', 'a drink')
+
+        bloom_filter = create_bloom_filter(dictionary)
+        self.assertIn('apple', bloom_filter)
+        self.assertIn('tea', bloom_filter)
+
+    def test_stored_with_dictionary(self):
+        """
+        Test that create_dict stores the filter next to the dictionary
+        and it is loaded with it.
+        """
+        with open(self.csv_path, 'w') as f:
+            f.write('Word,Count,Type,Definition\n')
+            f.write('apple,5,noun,a fruit\n')
+
+        create_dict(
+            self.csv_path, self.dict_path, bloom_false_positive_rate=0.01
+        )
+        store = DictionaryStore()
+        loaded = store.load(self.dict_path)
+        self.assertIn('apple', loaded.bloom_filter)
+        self.assertEqual(
+            store.status()['bloom_filter_bytes'], len(loaded.bloom_filter.bits)
+        )
+
+    def test_load_version_1(self):
+        """
+        Test that a filter stored before the dictionary version was
+        recorded loads without one.
+        """
+        bloom_filter = BloomFilter.for_capacity(len(self.words), 0.05)
+        bloom_filter.update(self.words)
+        with open(bloom_path(self.dict_path), 'wb') as f:
+            f.write(BLOOM_HEADER.pack(
+                BLOOM_MAGIC, 1, bloom_filter.hash_count, bloom_filter.bit_count
+            ))
+            f.write(bloom_filter.bits)
+
+        loaded = BloomFilter.load(bloom_path(self.dict_path))
+        self.assertIsNone(loaded.dictionary_version)
+        self.assertEqual(loaded.bits, bloom_filter.bits)
+
+        with open(bloom_path(self.dict_path), 'wb') as f:
+            f.write(BLOOM_HEADER.pack(BLOOM_MAGIC, 3, 1, 8) + b'\0')
+        with self.assertRaises(ValueError):
+            BloomFilter.load(bloom_path(self.dict_path))
+
+    def test_stale_filter_not_loaded(self):
+        """
+        Test that a filter of an older version of the dictionary,
+        or one without a version, is not loaded with it.
+        """
+        self.write_csv('apple')
+        create_dict(
+            self.csv_path, self.dict_path, bloom_false_positive_rate=0.01
+        )
+        self.assertEqual(
+            BloomFilter.load(bloom_path(self.dict_path)).dictionary_version,
+            dictionary_version(self.dict_path)
+        )
+        with open(bloom_path(self.dict_path), 'rb') as f:
+            stale = f.read()
+
+        self.write_csv('apple', 'plate')
+        create_dict(self.csv_path, self.dict_path)
+        with open(bloom_path(self.dict_path), 'wb') as f:
+            f.write(stale)
+        self.assertIsNone(DictionaryStore().load(self.dict_path).bloom_filter)
+
+        create_bloom_filter(load_dict(self.dict_path)).store(
+            bloom_path(self.dict_path)
+        )
+        self.assertIsNone(DictionaryStore().load(self.dict_path).bloom_filter)
+
+    def test_builders_remove_filter(self):
+        """
+        Test that every way of building a dictionary over one with a filter
+        rebuilds the filter or removes it.
+        """
+        self.write_csv('apple')
+        create_dict(
+            self.csv_path, self.dict_path, bloom_false_positive_rate=0.01
+        )
+
+        self.write_csv('apple', 'plate')
+        create_dict(
+            self.csv_path, self.dict_path, bloom_false_positive_rate=0.01
+        )
+        loaded = DictionaryStore().load(self.dict_path)
+        self.assertIn('plate', loaded.bloom_filter)
+
+        create_dict(self.csv_path, self.dict_path)
+        self.assertFalse(os.path.exists(bloom_path(self.dict_path)))
+
+        for build in (
+            lambda: store_dict(initialise_dict(), self.dict_path),
+            lambda: compile_dict(self.csv_path, self.dict_path),
+        ):
+            create_bloom_filter(initialise_dict()).store(
+                bloom_path(self.dict_path)
+            )
+            build()
+            self.assertFalse(os.path.exists(bloom_path(self.dict_path)))
+
+        update_dict(self.directory, self.csv_path)
+        create_bloom_filter(initialise_dict()).store(
+            bloom_path(self.directory)
+        )
+        self.write_csv('apple', 'plate', 'tea')
+        update_dict(self.directory, self.csv_path)
+        self.assertFalse(os.path.exists(bloom_path(self.directory)))
@@ -3,10 +3,29 @@ from unittest.mock import patch
 from io import StringIO
 from LettersGame.CountdownSolver import (
     solve_countdown,
+    solve_countdown_by_signature,
+    iter_countdown,
+    iter_countdown_by_signature,
+    group_by_length,
+    output_words_stream,
+    rack_signatures,
+    check_packed_counts,
+    record_fits,
+    fitting_records,
+    word_result,
     output_words,
     check_answer,
 )
-from LettersGame.CreateDict import initialise_dict
+from LettersGame.CreateDict import (
+    initialise_dict,
+    create_signature_index,
+    create_word_index,
+    add_to_dict,
+    create_record,
+    letter_mask,
+    pack_letter_counts
+)
+from collections import Counter
 
 
 class TestCountdownSolver(unittest.TestCase):
@@ -139,6 +158,342 @@ class TestCountdownSolver(unittest.TestCase):
         ]
         self.assertEqual(result, expected)
 
+    def test_solve_countdown_prefiltered_records(self):
+        """
+        Test the solve_countdown function with records that carry
+        a letter mask and packed counts, as created by add_to_dict.
+
+        Asserts:
+            The prefilter gives the same words as the counter check,
+            rejecting "apple" when there is only one 'p'.
+        """
+        dictionary = initialise_dict()
+        add_to_dict(dictionary, "apple", "A fruit")
+        add_to_dict(dictionary, "at", "In, on, or near")
+        add_to_dict(dictionary, "test", "An examination")
+
+        self.assertEqual(
+            solve_countdown("appletst", dictionary),
+            solve_countdown("appletst", self.sample_dict)
+        )
+        result = solve_countdown("apletst", dictionary)
+        self.assertEqual(
+            [record["word"] for record in result], ["at", "test"]
+        )
+
+    def test_solve_countdown_scan_counts(self):
+        """
+        Test that solve_countdown counts the records it scans
+        and those that can be made from the letters.
+
+        Asserts:
+            "visited" counts every record of the "ap" and "pa" buckets
+            scanned, and "matched" counts "apple" and "pa" but not "apply",
+            "pa" being counted before the min_length filter.
+        """
+        dictionary = initialise_dict()
+        add_to_dict(dictionary, "apple", "A fruit")
+        add_to_dict(dictionary, "apply", "To use")
+        add_to_dict(dictionary, "pa", "A father")
+
+        scan_counts = {}
+        result = solve_countdown(
+            "applex", dictionary, min_length=3, scan_counts=scan_counts
+        )
+        self.assertEqual([record["word"] for record in result], ["apple"])
+        self.assertEqual(scan_counts, {"visited": 3, "matched": 2})
+
+    def test_check_packed_counts(self):
+        """
+        Test the check_packed_counts function.
+
+        Asserts:
+            True when every letter count of the word fits in the rack,
+            False when any one letter is short, even if others have spare.
+        """
+        rack = pack_letter_counts(Counter("appletst"))
+        self.assertTrue(check_packed_counts(rack, pack_letter_counts(
+            Counter("apple")
+        )))
+        self.assertTrue(check_packed_counts(rack, pack_letter_counts(
+            Counter("test")
+        )))
+        self.assertFalse(check_packed_counts(rack, pack_letter_counts(
+            Counter("tests")
+        )))
+        self.assertFalse(check_packed_counts(rack, pack_letter_counts(
+            Counter("zap")
+        )))
+
+    def test_record_fits(self):
+        """
+        Test the record_fits function.
+
+        Asserts:
+            Records with a letter mask and packed counts and records
+            with only a letter counter are checked the same way.
+        """
+        letter_counts = Counter("appletst")
+        rack_mask = letter_mask(letter_counts)
+        rack_packed = pack_letter_counts(letter_counts)
+        for word, expected in (("apple", True), ("tests", False)):
+            record = create_record(word, [])
+            counter_record = {
+                "word": word, "letter_counter": record["letter_counter"]
+            }
+            for fitted in (record, counter_record):
+                self.assertEqual(
+                    record_fits(
+                        fitted, rack_mask, rack_packed, letter_counts
+                    ),
+                    expected
+                )
+
+    def test_fitting_records(self):
+        """
+        Test the fitting_records function.
+
+        Asserts:
+            The records kept are those record_fits accepts, in bucket order,
+            with or without a letter mask and packed counts.
+        """
+        letter_counts = Counter("appletst")
+        rack_mask = letter_mask(letter_counts)
+        rack_packed = pack_letter_counts(letter_counts)
+        bucket = [
+            create_record(word, [])
+            for word in ("apple", "tests", "pat", "zap", "settle", "step")
+        ]
+        bucket.append({
+            "word": "pets", "letter_counter": Counter("pets")
+        })
+        bucket.append({
+            "word": "pests", "letter_counter": Counter("pests")
+        })
+
+        self.assertEqual(
+            [
+                record["word"] for record in fitting_records(
+                    bucket, rack_mask, rack_packed, letter_counts
+                )
+            ],
+            ["apple", "pat", "step", "pets"]
+        )
+        self.assertEqual(
+            fitting_records(bucket, rack_mask, rack_packed, letter_counts),
+            [
+                record for record in bucket
+                if record_fits(record, rack_mask, rack_packed, letter_counts)
+            ]
+        )
+
+    def test_solve_countdown_by_signature(self):
+        """
+        Test the solve_countdown_by_signature function.
+
+        Uses the same letters as test_solve_countdown_valid_words
+        and checks that the signature index finds the same words.
+
+        Asserts:
+            The result contains the same records as the bucket scan.
+        """
+        letters = "appletst"
+        signature_index = create_signature_index(self.sample_dict)
+        result = solve_countdown_by_signature(letters, signature_index)
+        expected = solve_countdown(letters, self.sample_dict)
+        self.assertCountEqual(result, expected)
+
+    def test_solve_countdown_by_signature_partial_match(self):
+        """
+        Test the solve_countdown_by_signature function with
+        letters that only form some of the words.
+
+        Asserts:
+            Only "at" is found, as "apple" requires an 'e'.
+        """
+        signature_index = create_signature_index(self.sample_dict)
+        result = solve_countdown_by_signature("applt", signature_index)
+        expected = [
+            {"word": "at", "definition": "In, on, or near", "length": 2}
+        ]
+        self.assertEqual(result, expected)
+
+    def test_solve_countdown_limit(self):
+        """
+        Test that a limit keeps only the longest words, longest first,
+        for both the bucket scan and the signature index.
+
+        Asserts:
+            "apple" then "test" are returned and "at" is dropped.
+        """
+        letters = "appletst"
+        signature_index = create_signature_index(self.sample_dict)
+        for result in (
+            solve_countdown(letters, self.sample_dict, limit=2),
+            solve_countdown_by_signature(letters, signature_index, limit=2)
+        ):
+            self.assertEqual(
+                [record["word"] for record in result], ["apple", "test"]
+            )
+
+    def test_solve_countdown_min_length(self):
+        """
+        Test that words shorter than min_length are not returned.
+
+        Asserts:
+            Only "apple" is at least 5 letters long.
+        """
+        letters = "appletst"
+        signature_index = create_signature_index(self.sample_dict)
+        for result in (
+            solve_countdown(letters, self.sample_dict, min_length=5),
+            solve_countdown_by_signature(
+                letters, signature_index, min_length=5
+            )
+        ):
+            self.assertEqual([record["word"] for record in result], ["apple"])
+
+    def test_solve_countdown_without_definitions(self):
+        """
+        Test that both solvers leave the definitions out when asked to.
+
+        Asserts:
+            Each result only has the word and its length.
+        """
+        signature_index = create_signature_index(self.sample_dict)
+        expected = [{"word": "at", "length": 2}]
+
+        self.assertEqual(
+            solve_countdown("applt", self.sample_dict, False), expected
+        )
+        self.assertEqual(
+            solve_countdown_by_signature("applt", signature_index, False),
+            expected
+        )
+
+    def test_word_result(self):
+        """
+        Test the word_result function.
+
+        Asserts:
+            The definition is included unless include_definitions is False.
+        """
+        self.assertEqual(
+            word_result("at", ["In", "on"]),
+            {"word": "at", "definition": "In; on", "length": 2}
+        )
+        self.assertEqual(
+            word_result("at", ["In"], include_definitions=False),
+            {"word": "at", "length": 2}
+        )
+
+    def test_solve_countdown_merges_duplicate_words(self):
+        """
+        Test that both solvers return one result per word when the
+        dictionary has several records of it, as older dictionaries do.
+
+        Asserts:
+            "apple" is returned once with both of its definitions.
+        """
+        self.sample_dict['a']['p'].append({
+            "word": "apple",
+            "definition": "A tree",
+            "count": 5,
+            "letter_counter": {'a': 1, 'p': 2, 'l': 1, 'e': 1}
+        })
+        signature_index = create_signature_index(self.sample_dict)
+        expected = {
+            "word": "apple", "definition": "A fruit; A tree", "length": 5
+        }
+
+        result = solve_countdown("apple", self.sample_dict)
+        self.assertEqual(result, [expected])
+        result = solve_countdown_by_signature("apple", signature_index)
+        self.assertEqual(result, [expected])
+
+    def test_iter_countdown(self):
+        """
+        Test that the generators yield the same words as the solvers,
+        the signature index longest first.
+
+        Asserts:
+            The streams hold the results of the solvers.
+        """
+        letters = "appletst"
+        signature_index = create_signature_index(self.sample_dict)
+
+        self.assertEqual(
+            list(iter_countdown(letters, self.sample_dict)),
+            solve_countdown(letters, self.sample_dict)
+        )
+        result = list(iter_countdown_by_signature(letters, signature_index))
+        self.assertCountEqual(
+            result, solve_countdown(letters, self.sample_dict)
+        )
+        self.assertEqual(
+            [record["length"] for record in result], [5, 4, 2]
+        )
+
+    def test_iter_countdown_is_lazy(self):
+        """
+        Test that the first result is yielded before the scan finishes.
+
+        Asserts:
+            Taking the first result does not read the later buckets.
+        """
+        self.sample_dict['t']['e'] = None
+        results = iter_countdown("atexxxxxx", self.sample_dict)
+        self.assertEqual(next(results)["word"], "at")
+        with self.assertRaises(TypeError):
+            next(results)
+
+    def test_group_by_length(self):
+        """
+        Test the group_by_length function.
+
+        Asserts:
+            Consecutive results of the same length are grouped.
+        """
+        results = [
+            {"word": "apple", "length": 5},
+            {"word": "leapt", "length": 5},
+            {"word": "at", "length": 2},
+        ]
+        self.assertEqual(
+            list(group_by_length(iter(results))),
+            [(5, results[:2]), (2, results[2:])]
+        )
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_output_words_stream(self, mock_stdout):
+        """
+        Test the output_words_stream function.
+
+        Asserts:
+            The words are printed in the order of the stream
+            and counted.
+        """
+        words = iter([
+            {"word": "at", "definition": "In, on, or near", "length": 2},
+            {"word": "apple", "definition": "A fruit", "length": 5},
+        ])
+        self.assertEqual(output_words_stream(words), 2)
+        self.assertEqual(
+            mock_stdout.getvalue(),
+            "2 - at - In, on, or near\n5 - apple - A fruit\n"
+        )
+
+    def test_rack_signatures(self):
+        """
+        Test the rack_signatures function.
+
+        Asserts:
+            Every distinct sub-multiset of at least 2 letters
+            is yielded exactly once, with repeated letters deduplicated.
+        """
+        result = list(rack_signatures("aab"))
+        self.assertCountEqual(result, ["ab", "aa", "aab"])
+
     @patch('sys.stdout', new_callable=StringIO)
     def test_output_words(self, mock_stdout):
         """
@@ -251,6 +606,17 @@ class TestCheckAnswer(unittest.TestCase):
         self.assertIn("A red fruit", results_dict["definitions"])
         self.assertIn("A green fruit", results_dict["definitions"])
 
+    def test_check_without_definitions(self):
+        """
+        checks that the definitions key is left out when
+        include_definitions is False
+        """
+        results_dict = check_answer(
+            "apple", "apples", self.sample_dict, include_definitions=False
+        )
+
+        self.assertEqual(results_dict, {"correct": True})
+
     def test_not_from_letters(self):
         """
         Checks that a response of "incorrect" is returned when
@@ -281,6 +647,56 @@ class TestCheckAnswer(unittest.TestCase):
         self.assertFalse(return_dict["correct"])
         self.assertEqual(len(return_dict["definitions"]), 0)
 
+    def test_check_with_word_index(self):
+        """
+        Checks that looking words up in the word index gives the same
+        results as scanning their bucket, with every record of a word
+        """
+        word_index = create_word_index(self.sample_dict)
+        for word, letters in (
+            ("apple", "apples"),
+            ("apply", "apples"),
+            ("appling", "appling"),
+            ("at", "tab")
+        ):
+            self.assertEqual(
+                check_answer(
+                    word, letters, self.sample_dict, word_index=word_index
+                ),
+                check_answer(word, letters, self.sample_dict)
+            )
+
+        results_dict = check_answer(
+            "apple", "apples", initialise_dict(), word_index=word_index
+        )
+        self.assertEqual(len(results_dict["definitions"]), 2)
+
+    def test_check_with_word_index_packed_records(self):
+        """
+        Checks that the records found in the word index are checked against
+        the rack by their letter masks and packed counts, and that a word
+        not in the index is rejected without counting its letters
+        """
+        dictionary = initialise_dict()
+        add_to_dict(dictionary, "apple", "A fruit")
+        word_index = create_word_index(dictionary)
+
+        self.assertTrue(check_answer(
+            "apple", "appleszzz", dictionary, word_index=word_index
+        )["correct"])
+        self.assertFalse(check_answer(
+            "apple", "aplestzzz", dictionary, word_index=word_index
+        )["correct"])
+
+        with patch("LettersGame.CountdownSolver.Counter") as counter:
+            self.assertEqual(
+                check_answer(
+                    "zzz", "appleszzz", dictionary, word_index=word_index
+                ),
+                {"correct": False, "definitions": []}
+            )
+        counter.assert_not_called()
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -3,9 +3,17 @@ import os
 import json
 from LettersGame.CreateDict import (
     create_dict,
+    create_dict_from_sources,
     initialise_dict,
     add_to_dict,
-    store_dict
+    store_dict,
+    word_signature,
+    create_signature_index,
+    create_word_index,
+    letter_mask,
+    pack_letter_counts,
+    get_definitions,
+    COUNT_FIELD_BITS
 )
 from collections import Counter
 
@@ -40,8 +48,11 @@ class TestCreateDict(unittest.TestCase):
         """
         # Remove the temporary CSV file
         os.remove(self.test_csv_path)
-        if os.path.exists('test_dictionary.txt'):
-            os.remove('test_dictionary.txt')
+        for path in (
+            'test_dictionary.txt', 'test_regional.csv', 'test_blocklist.txt'
+        ):
+            if os.path.exists(path):
+                os.remove(path)
 
     def test_create_dict(self):
         """
@@ -56,11 +67,47 @@ class TestCreateDict(unittest.TestCase):
         self.assertIn('a', result)
         self.assertIn('b', result)
         self.assertIn('c', result)
-        self.assertEqual(len(result['a']['p']), 2)
+        self.assertEqual(len(result['a']['p']), 1)
+        self.assertEqual(result['a']['p'][0]['definitions'], ['a fruit'])
         self.assertEqual(len(result['b']['a']), 1)
         self.assertEqual(len(result['c']['a']), 1)
         self.assertEqual(len(result['d']['o']), 0)
 
+    def test_create_dict_from_sources(self):
+        """
+        Test the create_dict_from_sources function.
+
+        Verifies that, read in worker processes or not:
+        1. Words found in several sources have one record
+           with the definitions of each source, in order.
+        2. Words in a blocklist are left out.
+        """
+        with open('test_regional.csv', 'w') as f:
+            f.write('Word,Count,Type,Definition\n')
+            f.write('apple,5,noun,a tree\n')
+            f.write('colour,6,noun,a hue\n')
+        with open('test_blocklist.txt', 'w') as f:
+            f.write('Banana\n\n')
+
+        for workers in (1, 3):
+            result = create_dict_from_sources(
+                [self.test_csv_path, 'test_regional.csv'],
+                'test_dictionary.txt',
+                blocklist_paths=['test_blocklist.txt'],
+                workers=workers
+            )
+            self.assertEqual(len(result['a']['p']), 1)
+            self.assertEqual(
+                result['a']['p'][0]['definitions'], ['a fruit', 'a tree']
+            )
+            self.assertEqual(result['c']['o'][0]['word'], 'colour')
+            self.assertEqual(result['b']['a'], [])
+            self.assertEqual(len(result['c']['a']), 1)
+
+        self.assertIsNone(create_dict_from_sources(
+            [self.test_csv_path, 'missing.csv'], 'test_dictionary.txt'
+        ))
+
     def test_initialise_dict(self):
         """
         Test the initialise_dict function.
@@ -91,9 +138,123 @@ class TestCreateDict(unittest.TestCase):
         self.assertEqual(len(dictionary['t']['e']), 1)
         entry = dictionary['t']['e'][0]
         self.assertEqual(entry['word'], 'test')
-        self.assertEqual(entry['definition'], 'a trial')
+        self.assertEqual(entry['definitions'], ['a trial'])
         self.assertEqual(entry['count'], 4)
         self.assertEqual(entry['letter_counter'], Counter('test'))
+        self.assertEqual(entry['letter_mask'], letter_mask(Counter('test')))
+        self.assertEqual(
+            entry['packed_counts'], pack_letter_counts(Counter('test'))
+        )
+
+    def test_add_to_dict_existing_word(self):
+        """
+        Test the add_to_dict function with a word already in the dictionary.
+
+        Verifies that:
+        1. The definition is added to the existing record.
+        2. A definition the record already has is not repeated.
+        3. The word index is used and kept up to date.
+        """
+        dictionary = initialise_dict()
+        word_index = {}
+        add_to_dict(dictionary, 'test', 'a trial', word_index)
+        add_to_dict(dictionary, 'test', 'to try', word_index)
+        add_to_dict(dictionary, 'test', 'a trial', word_index)
+        add_to_dict(dictionary, 'test', 'a shell')
+
+        self.assertEqual(len(dictionary['t']['e']), 1)
+        self.assertIs(word_index['test'], dictionary['t']['e'][0])
+        self.assertEqual(
+            dictionary['t']['e'][0]['definitions'],
+            ['a trial', 'to try', 'a shell']
+        )
+
+    def test_get_definitions(self):
+        """
+        Test the get_definitions function with both kinds of record.
+        """
+        self.assertEqual(
+            get_definitions({'word': 'ab', 'definitions': ['x', 'y']}),
+            ['x', 'y']
+        )
+        self.assertEqual(
+            get_definitions({'word': 'ab', 'definition': 'x'}), ['x']
+        )
+
+    def test_letter_mask(self):
+        """
+        Test the letter_mask function.
+
+        Verifies that one bit is set per distinct letter,
+        regardless of how many times it appears.
+        """
+        self.assertEqual(letter_mask(Counter('abba')), 0b11)
+        self.assertEqual(letter_mask(Counter('z')), 1 << 25)
+        self.assertEqual(letter_mask(Counter()), 0)
+
+    def test_pack_letter_counts(self):
+        """
+        Test the pack_letter_counts function.
+
+        Verifies that:
+        1. Each letter's count is stored in its own field.
+        2. Counts above 127 are capped.
+        """
+        packed = pack_letter_counts(Counter('abbc'))
+        self.assertEqual(
+            packed,
+            1 | (2 << COUNT_FIELD_BITS) | (1 << 2 * COUNT_FIELD_BITS)
+        )
+        self.assertEqual(pack_letter_counts(Counter('a' * 200)), 127)
+
+    def test_word_signature(self):
+        """
+        Test the word_signature function.
+
+        Verifies that anagrams share a signature made of
+        the word's letters in alphabetical order.
+        """
+        self.assertEqual(word_signature('listen'), 'eilnst')
+        self.assertEqual(word_signature('silent'), word_signature('listen'))
+
+    def test_create_signature_index(self):
+        """
+        Test the create_signature_index function.
+
+        Verifies that:
+        1. Every record is indexed under its sorted-letter signature.
+        2. Anagrams in different buckets share an entry.
+        3. The records are the same objects as in the dictionary.
+        """
+        dictionary = initialise_dict()
+        add_to_dict(dictionary, 'listen', 'to hear')
+        add_to_dict(dictionary, 'silent', 'without sound')
+        add_to_dict(dictionary, 'cat', 'a feline animal')
+
+        result = create_signature_index(dictionary)
+
+        self.assertEqual(len(result), 2)
+        self.assertEqual(
+            [record['word'] for record in result['eilnst']],
+            ['listen', 'silent']
+        )
+        self.assertIs(result['act'][0], dictionary['c']['a'][0])
+
+    def test_create_word_index(self):
+        """
+        Test the create_word_index function.
+
+        Verifies that every record is indexed under its word
+        and the records are the same objects as in the dictionary.
+        """
+        dictionary = initialise_dict()
+        add_to_dict(dictionary, 'listen', 'to hear')
+        add_to_dict(dictionary, 'cat', 'a feline animal')
+
+        result = create_word_index(dictionary)
+
+        self.assertEqual(sorted(result), ['cat', 'listen'])
+        self.assertIs(result['cat'][0], dictionary['c']['a'][0])
 
     def test_store_dict(self):
         """
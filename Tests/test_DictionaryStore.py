@@ -0,0 +1,91 @@
+import unittest
+import os
+from LettersGame.CreateDict import initialise_dict, add_to_dict, store_dict
+from LettersGame.DictionaryStore import (
+    DictionaryStore,
+    dictionary_version,
+    VERSION_LENGTH
+)
+
+
+class TestDictionaryStore(unittest.TestCase):
+    """
+    Test suite for the reloadable dictionary store.
+    """
+
+    def setUp(self):
+        """
+        Store two versions of a sample dictionary.
+        """
+        self.old_path = 'test_store_old.json'
+        self.new_path = 'test_store_new.json'
+        dictionary = initialise_dict()
+        add_to_dict(dictionary, 'tea', 'a drink')
+        store_dict(dictionary, self.old_path)
+        add_to_dict(dictionary, 'apple', 'a fruit')
+        store_dict(dictionary, self.new_path)
+        self.swapped = []
+        self.store = DictionaryStore(on_swap=self.swapped.append)
+
+    def tearDown(self):
+        """
+        Removes the dictionary files.
+        """
+        for path in (self.old_path, self.new_path):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def test_load(self):
+        """
+        Test that a loaded dictionary is current, with its solver
+        and version, and on_swap is called with it.
+        """
+        loaded = self.store.load(self.old_path)
+        self.assertIs(self.store.current, loaded)
+        self.assertEqual(self.swapped, [loaded])
+        self.assertEqual(len(loaded.version), VERSION_LENGTH)
+        self.assertEqual(loaded.version, dictionary_version(self.old_path))
+        self.assertEqual(
+            [result['word'] for result in loaded.solver('teaxxxxxx')],
+            ['tea']
+        )
+
+    def test_load_missing(self):
+        """
+        Test that a dictionary which could not be loaded raises RuntimeError.
+        """
+        with self.assertRaises(RuntimeError):
+            self.store.load('missing.json')
+        self.assertIsNone(self.store.current)
+
+    def test_reload(self):
+        """
+        Test that a reload swaps the new dictionary in, and a request
+        holding the old one keeps answering from it.
+        """
+        old = self.store.load(self.old_path)
+        self.assertTrue(self.store.reload(self.new_path))
+        self.store.wait()
+
+        new = self.store.current
+        self.assertIsNot(new, old)
+        self.assertNotEqual(new.version, old.version)
+        self.assertEqual(len(old.solver('appletaxx')), 1)
+        self.assertEqual(len(new.solver('appletaxx')), 2)
+
+        status = self.store.status()
+        self.assertEqual(status['version'], new.version)
+        self.assertFalse(status['reloading'])
+        self.assertIsNone(status['last_error'])
+
+    def test_reload_failure(self):
+        """
+        Test that a failed reload keeps the current dictionary
+        and reports why.
+        """
+        old = self.store.load(self.old_path)
+        self.store.reload('missing.json')
+        self.store.wait()
+
+        self.assertIs(self.store.current, old)
+        self.assertIsNotNone(self.store.status()['last_error'])
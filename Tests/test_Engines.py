@@ -0,0 +1,89 @@
+import unittest
+from LettersGame.Engines import ENGINES, create_engine
+from LettersGame.CreateDict import initialise_dict, add_to_dict
+
+
+class TestEngines(unittest.TestCase):
+    """
+    Test suite for the solver engines.
+    """
+
+    def setUp(self):
+        """
+        Set up a sample dictionary.
+        """
+        self.dictionary = initialise_dict()
+        add_to_dict(self.dictionary, 'apple', 'a fruit')
+        add_to_dict(self.dictionary, 'apple', 'a tree')
+        add_to_dict(self.dictionary, 'at', 'in, on, or near')
+        add_to_dict(self.dictionary, 'tea', 'a drink')
+
+    def test_engines_agree(self):
+        """
+        Test that every engine gives the same answers.
+        """
+        expected = None
+        for engine in ENGINES:
+            solver = create_engine(self.dictionary, engine)
+            result = sorted(
+                solver('appletaxx'), key=lambda record: record['word']
+            )
+            if expected is None:
+                expected = result
+            self.assertEqual(result, expected, engine)
+
+        self.assertEqual(
+            [record['word'] for record in expected], ['apple', 'at', 'tea']
+        )
+        self.assertEqual(expected[0]['definition'], 'a fruit; a tree')
+
+    def test_engine_without_definitions(self):
+        """
+        Test that the engine solver passes include_definitions on.
+        """
+        solver = create_engine(self.dictionary, 'trie')
+        self.assertEqual(
+            solver('atxxxxxxx', include_definitions=False),
+            [{'word': 'at', 'length': 2}]
+        )
+
+    def test_engine_stream(self):
+        """
+        Test that every engine streams the same words as it returns.
+        """
+        for engine in ENGINES:
+            solver = create_engine(self.dictionary, engine)
+            self.assertCountEqual(
+                list(solver.stream('appletaxx', min_length=3)),
+                solver('appletaxx', min_length=3),
+                engine
+            )
+
+    def test_engine_scan_counts(self):
+        """
+        Test that the bucket engine counts the records it scans
+        and the other engines leave the counts alone.
+        """
+        for engine in ENGINES:
+            scan_counts = {}
+            create_engine(self.dictionary, engine)(
+                'appletaxx', scan_counts=scan_counts
+            )
+            if engine == 'bucket':
+                self.assertGreater(scan_counts['visited'], 0)
+                self.assertLessEqual(
+                    scan_counts['matched'], scan_counts['visited']
+                )
+            else:
+                self.assertEqual(scan_counts, {}, engine)
+
+    def test_unknown_engine(self):
+        """
+        Test that an unknown engine name raises a ValueError.
+        """
+        with self.assertRaises(ValueError):
+            create_engine(self.dictionary, 'quantum')
+
+
+if __name__ == '__main__':
+    unittest.main()
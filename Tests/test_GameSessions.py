@@ -0,0 +1,101 @@
+import unittest
+from LettersGame.CountdownSolver import check_answer
+from LettersGame.CreateDict import (
+    initialise_dict,
+    add_to_dict,
+    create_word_index
+)
+from LettersGame.Engines import create_engine
+from LettersGame.GameSessions import GameSessions
+
+
+class TestGameSessions(unittest.TestCase):
+    """
+    Test suite for the game sessions.
+    """
+
+    def setUp(self):
+        """
+        Set up a sample dictionary and sessions with a clock
+        the tests can move forward.
+        """
+        self.dictionary = initialise_dict()
+        add_to_dict(self.dictionary, 'apple', 'a fruit')
+        add_to_dict(self.dictionary, 'apple', 'a tree')
+        add_to_dict(self.dictionary, 'tea', 'a drink')
+        add_to_dict(self.dictionary, 'zebra', 'an animal')
+        self.word_index = create_word_index(self.dictionary)
+        self.solver = create_engine(self.dictionary)
+        self.now = 0.0
+        self.sessions = GameSessions(
+            max_sessions=2, ttl=10, clock=lambda: self.now
+        )
+
+    def create(self, letters: str) -> str:
+        """
+        Create a session for a rack, solved by the sample solver.
+        """
+        words = [
+            result['word']
+            for result in self.solver(
+                letters.lower(), include_definitions=False
+            )
+        ]
+        return self.sessions.create(
+            letters, words, self.word_index, version='v1'
+        )
+
+    def test_check(self):
+        """
+        Test that guesses are checked as by check_answer.
+        """
+        session = self.sessions.get(self.create('APPLETAXX'))
+        self.assertEqual(session.letters, 'aaelpptxx')
+        self.assertEqual(session.version, 'v1')
+
+        for word in ('apple', 'tea', 'zebra', 'pat'):
+            self.assertEqual(
+                session.check(word),
+                check_answer(word, 'appletaxx', self.dictionary)
+            )
+        self.assertEqual(
+            session.check('apple'),
+            {'correct': True, 'definitions': ['a fruit', 'a tree']}
+        )
+        self.assertEqual(
+            session.check('tea', include_definitions=False),
+            {'correct': True}
+        )
+
+    def test_ttl(self):
+        """
+        Test that a session expires once unused for the time to live.
+        """
+        session_id = self.create('appletaxx')
+        self.now = 8
+        self.assertIsNotNone(self.sessions.get(session_id))
+        self.now = 16
+        self.assertIsNotNone(self.sessions.get(session_id))
+        self.now = 26
+        self.assertIsNone(self.sessions.get(session_id))
+
+    def test_max_sessions(self):
+        """
+        Test that the least recently used session is dropped to make room.
+        """
+        first = self.create('appletaxx')
+        second = self.create('teaxxxxxx')
+        self.sessions.get(first)
+        third = self.create('zebraxxxx')
+
+        self.assertIsNotNone(self.sessions.get(first))
+        self.assertIsNone(self.sessions.get(second))
+        self.assertIsNotNone(self.sessions.get(third))
+        self.assertEqual(len(self.sessions), 2)
+
+    def test_invalid_max_sessions(self):
+        """
+        Test that a non positive max_sessions raises ValueError.
+        """
+        with self.assertRaises(ValueError):
+            GameSessions(max_sessions=0)
@@ -0,0 +1,133 @@
+import unittest
+import os
+import shutil
+from LettersGame.CreateDict import initialise_dict, add_to_dict, load_dict
+from LettersGame.IncrementalDict import (
+    update_dict,
+    remove_from_dict,
+    load_dict_shards,
+    is_dict_shards,
+    MANIFEST_NAME
+)
+
+
+class TestIncrementalDict(unittest.TestCase):
+    """
+    Test suite for the incrementally updated dictionary.
+    """
+
+    def setUp(self):
+        """
+        Set up a sample dataset, a delta and the directory used.
+        """
+        self.csv_path = 'test_incremental_words.csv'
+        self.delta_path = 'test_incremental_delta.csv'
+        self.directory = 'test_incremental_dictionary'
+        with open(self.csv_path, 'w') as f:
+            f.write('Word,Count,Type,Definition\n')
+            f.write('Apple,5,noun,a fruit\n')
+            f.write('apple,5,noun,a tree\n')
+            f.write('cat,3,noun,a feline animal\n')
+        with open(self.delta_path, 'w') as f:
+            f.write('add,Banana,6,noun,a yellow fruit\n')
+            f.write('remove,cat\n')
+            f.write('remove,apple,,,a tree\n')
+
+    def tearDown(self):
+        """
+        Removes the files created by the tests.
+        """
+        for path in (self.csv_path, self.delta_path):
+            if os.path.exists(path):
+                os.remove(path)
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def test_build(self):
+        """
+        Test that the first update compiles every first letter
+        and the result loads through load_dict.
+        """
+        changed = update_dict(self.directory, self.csv_path)
+        self.assertEqual(len(changed), 26)
+        self.assertTrue(is_dict_shards(self.directory))
+
+        dictionary = load_dict(self.directory)
+        self.assertEqual(
+            dictionary['a']['p'][0]['definitions'], ['a fruit', 'a tree']
+        )
+        self.assertEqual(dictionary['c']['a'][0]['word'], 'cat')
+
+    def test_unchanged_sources_is_noop(self):
+        """
+        Test that updating again with the same sources writes nothing.
+        """
+        update_dict(self.directory, self.csv_path, [self.delta_path])
+        manifest_path = os.path.join(self.directory, MANIFEST_NAME)
+        modified = os.path.getmtime(manifest_path)
+
+        self.assertEqual(
+            update_dict(self.directory, self.csv_path, [self.delta_path]),
+            []
+        )
+        self.assertEqual(os.path.getmtime(manifest_path), modified)
+
+    def test_apply_delta(self):
+        """
+        Test that only the first letters a delta changes are rewritten.
+        """
+        update_dict(self.directory, self.csv_path)
+        changed = update_dict(
+            self.directory, self.csv_path, [self.delta_path]
+        )
+        self.assertEqual(changed, ['a', 'b', 'c'])
+
+        dictionary = load_dict_shards(self.directory)
+        self.assertEqual(
+            dictionary['a']['p'][0]['definitions'], ['a fruit']
+        )
+        self.assertEqual(dictionary['b']['a'][0]['word'], 'banana')
+        self.assertEqual(dictionary['c']['a'], [])
+
+    def test_changed_source_rebuilds(self):
+        """
+        Test that a changed dataset is re-read and the deltas reapplied.
+        """
+        update_dict(self.directory, self.csv_path, [self.delta_path])
+        with open(self.csv_path, 'a') as f:
+            f.write('dog,3,noun,a canine animal\n')
+
+        changed = update_dict(
+            self.directory, self.csv_path, [self.delta_path]
+        )
+        self.assertEqual(len(changed), 26)
+
+        dictionary = load_dict_shards(self.directory)
+        self.assertEqual(dictionary['d']['o'][0]['word'], 'dog')
+        self.assertEqual(dictionary['c']['a'], [])
+
+    def test_unknown_action(self):
+        """
+        Test that a delta with an unknown action returns None.
+        """
+        with open(self.delta_path, 'w') as f:
+            f.write('rename,cat,dog\n')
+        self.assertIsNone(
+            update_dict(self.directory, self.csv_path, [self.delta_path])
+        )
+
+    def test_remove_from_dict(self):
+        """
+        Test removing a definition, a whole word and a missing word.
+        """
+        dictionary = initialise_dict()
+        add_to_dict(dictionary, 'test', 'a trial')
+        add_to_dict(dictionary, 'test', 'an exam')
+
+        self.assertTrue(remove_from_dict(dictionary, 'test', 'a trial'))
+        self.assertEqual(
+            dictionary['t']['e'][0]['definitions'], ['an exam']
+        )
+        self.assertFalse(remove_from_dict(dictionary, 'test', 'a trial'))
+        self.assertTrue(remove_from_dict(dictionary, 'test'))
+        self.assertEqual(dictionary['t']['e'], [])
+        self.assertFalse(remove_from_dict(dictionary, 'test'))
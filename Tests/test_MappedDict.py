@@ -0,0 +1,161 @@
+import unittest
+import os
+from LettersGame.MappedDict import MappedDict
+from LettersGame.BinaryDict import store_dict_binary, definitions_path
+from LettersGame.CreateDict import (
+    initialise_dict,
+    add_to_dict,
+    load_dict,
+    create_signature_index,
+    create_word_index
+)
+from LettersGame.CountdownSolver import (
+    solve_countdown,
+    solve_countdown_by_signature,
+    check_answer
+)
+
+
+class TestMappedDict(unittest.TestCase):
+    """
+    Test suite for the memory mapped dictionary.
+    """
+
+    def setUp(self):
+        """
+        Store a sample dictionary in the binary format and map it.
+        """
+        self.binary_path = 'test_mapped_dictionary.bin'
+        self.dictionary = initialise_dict()
+        add_to_dict(self.dictionary, 'apple', 'a fruit')
+        add_to_dict(self.dictionary, 'at', 'in, on, or near')
+        add_to_dict(self.dictionary, 'listen', 'to hear')
+        add_to_dict(self.dictionary, 'silent', 'without sound')
+        add_to_dict(self.dictionary, 'tinsel', 'a decoration')
+        store_dict_binary(self.dictionary, self.binary_path)
+        self.mapped = MappedDict(self.binary_path)
+
+    def tearDown(self):
+        """
+        Unmap and remove the binary dictionary.
+        """
+        self.mapped.close()
+        for path in (self.binary_path, definitions_path(self.binary_path)):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def test_nested_access(self):
+        """
+        Test that buckets are reached through the same nested keys
+        as the dictionary and hold the same records.
+        """
+        self.assertEqual(len(self.mapped), 26)
+        self.assertEqual(self.mapped.word_count, 5)
+        self.assertEqual(len(self.mapped['a']['p']), 1)
+        self.assertEqual(len(self.mapped['z']['z']), 0)
+
+        record = self.mapped['a']['p'][0]
+        expected = self.dictionary['a']['p'][0]
+        for key in ('word', 'definitions', 'count', 'letter_mask',
+                    'packed_counts'):
+            self.assertEqual(record[key], expected[key])
+
+    def test_missing_keys(self):
+        """
+        Test that keys which are not single lowercase letters raise KeyError.
+        """
+        with self.assertRaises(KeyError):
+            self.mapped['A']
+        with self.assertRaises(KeyError):
+            self.mapped['a']['ab']
+        with self.assertRaises(KeyError):
+            self.mapped['a']['p'][0]['letter_counter']
+
+    def test_solve_countdown(self):
+        """
+        Test that the bucket scan gives the same answers
+        from the mapped dictionary as from the original.
+        """
+        self.assertEqual(
+            solve_countdown('appletsin', self.mapped),
+            solve_countdown('appletsin', self.dictionary)
+        )
+
+    def test_signature_index(self):
+        """
+        Test that the signature index in the file finds every anagram
+        and that create_signature_index returns it for mapped dictionaries.
+        """
+        signature_index = create_signature_index(self.mapped)
+
+        self.assertIs(signature_index, self.mapped.signature_index)
+        self.assertEqual(
+            [record['word'] for record in signature_index['eilnst']],
+            ['listen', 'silent', 'tinsel']
+        )
+        self.assertIsNone(signature_index.get('zz'))
+        self.assertNotIn('zz', signature_index)
+        self.assertIsNone(signature_index.get('eilnsté'))
+        self.assertIsNone(signature_index.get('EILNST'))
+        self.assertCountEqual(
+            solve_countdown_by_signature('silentapa', signature_index),
+            solve_countdown('silentapa', self.dictionary)
+        )
+
+    def test_definitions_read_lazily(self):
+        """
+        Test that the definitions side file is not needed to solve
+        without definitions and is only opened when one is read.
+        """
+        os.remove(definitions_path(self.binary_path))
+
+        result = solve_countdown_by_signature(
+            'silentapa',
+            self.mapped.signature_index,
+            include_definitions=False
+        )
+        self.assertIn({'word': 'silent', 'length': 6}, result)
+
+        with self.assertRaises(FileNotFoundError):
+            self.mapped['s']['i'][0]['definitions']
+
+    def test_check_answer(self):
+        """
+        Test that answers are checked against the mapped dictionary.
+        """
+        result = check_answer('silent', 'tinselaaa', self.mapped)
+        self.assertTrue(result['correct'])
+        self.assertEqual(result['definitions'], ['without sound'])
+
+    def test_word_index(self):
+        """
+        Test that words are looked up in the word_hashes table of the file
+        and answers checked with it.
+        """
+        word_index = create_word_index(self.mapped)
+        self.assertIs(word_index, self.mapped.word_index)
+        self.assertEqual(
+            [record['word'] for record in word_index['silent']], ['silent']
+        )
+        self.assertNotIn('silence', word_index)
+        self.assertNotIn('café', word_index)
+
+        result = check_answer(
+            'silent', 'tinselaaa', self.mapped, word_index=word_index
+        )
+        self.assertTrue(result['correct'])
+        self.assertEqual(result['definitions'], ['without sound'])
+
+    def test_load_dict_mapped(self):
+        """
+        Test that load_dict maps binary dictionaries when asked to.
+        """
+        result = load_dict(self.binary_path, mapped=True)
+        self.assertIsInstance(result, MappedDict)
+        result.close()
+
+        self.assertIsInstance(load_dict(self.binary_path), dict)
+
+
+if __name__ == '__main__':
+    unittest.main()
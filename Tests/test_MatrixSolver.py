@@ -0,0 +1,141 @@
+import unittest
+import os
+from LettersGame.BinaryDict import store_dict_binary, definitions_path
+from LettersGame.CreateDict import (
+    initialise_dict,
+    add_to_dict,
+    load_dict,
+    create_count_matrix
+)
+from LettersGame.CountdownSolver import solve_countdown
+from LettersGame.MatrixSolver import (
+    NUMPY_AVAILABLE,
+    solve_countdown_matrix,
+    iter_countdown_matrix,
+    solve_racks_matrix
+)
+
+
+@unittest.skipIf(not NUMPY_AVAILABLE, "numpy is not installed")
+class TestMatrixSolver(unittest.TestCase):
+    """
+    Test suite for the numpy count matrix solver.
+    """
+
+    def setUp(self):
+        """
+        Set up a sample dictionary and its count matrix.
+        """
+        self.binary_path = 'test_matrix_dictionary.bin'
+        self.dictionary = initialise_dict()
+        add_to_dict(self.dictionary, 'apple', 'a fruit')
+        add_to_dict(self.dictionary, 'at', 'in, on, or near')
+        add_to_dict(self.dictionary, 'tea', 'a drink')
+        add_to_dict(self.dictionary, 'eat', 'to have food')
+        add_to_dict(self.dictionary, 'beat', 'to hit')
+        self.matrix = create_count_matrix(self.dictionary)
+        self.racks = ['appletaxx', 'seatbpple', 'zzzzzzzzz', 'atxxxxxxx']
+
+    def tearDown(self):
+        """
+        Removes the binary dictionary files.
+        """
+        for path in (self.binary_path, definitions_path(self.binary_path)):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def test_create_count_matrix(self):
+        """
+        Test that each row of the matrix holds the letter counts of a word.
+        """
+        self.assertEqual(self.matrix['counts'].shape, (5, 26))
+        self.assertEqual(self.matrix['letter_counts'].shape, (26, 5))
+        row = [
+            record['word'] for record in self.matrix['records']
+        ].index('apple')
+        self.assertEqual(self.matrix['counts'][row][15], 2)
+        self.assertEqual(self.matrix['lengths'][row], 5)
+
+    def test_solve_countdown_matrix(self):
+        """
+        Test that the matrix solver finds the same words as the bucket
+        scan, longest first.
+        """
+        for letters in self.racks:
+            result = solve_countdown_matrix(letters, self.matrix)
+            self.assertCountEqual(
+                result, solve_countdown(letters, self.dictionary)
+            )
+            lengths = [record['length'] for record in result]
+            self.assertEqual(lengths, sorted(lengths, reverse=True))
+
+    def test_options(self):
+        """
+        Test the include_definitions, limit and min_length options.
+        """
+        self.assertEqual(
+            solve_countdown_matrix(
+                'seatbpple', self.matrix, False, limit=2, min_length=4
+            ),
+            [{'word': 'apple', 'length': 5}, {'word': 'beat', 'length': 4}]
+        )
+
+    def test_merges_duplicate_words(self):
+        """
+        Test that records of the same word are merged into one result.
+        """
+        self.dictionary['a']['t'].append(
+            {'word': 'at', 'definition': 'by', 'count': 2}
+        )
+        matrix = create_count_matrix(self.dictionary)
+        self.assertEqual(
+            solve_countdown_matrix('atxxxxxxx', matrix),
+            [{'word': 'at', 'definition': 'in, on, or near; by', 'length': 2}]
+        )
+
+    def test_iter_countdown_matrix(self):
+        """
+        Test that the generator yields the results of the solver.
+        """
+        self.assertEqual(
+            list(iter_countdown_matrix('seatbpple', self.matrix)),
+            solve_countdown_matrix('seatbpple', self.matrix)
+        )
+
+    def test_solve_racks_matrix(self):
+        """
+        Test that racks solved in chunks give the answers
+        of each rack solved alone, in order.
+        """
+        result = list(solve_racks_matrix(
+            iter(self.racks), self.matrix, min_length=3, chunk_size=3
+        ))
+        self.assertEqual(result, [
+            solve_countdown_matrix(letters, self.matrix, min_length=3)
+            for letters in self.racks
+        ])
+
+        with self.assertRaises(ValueError):
+            list(solve_racks_matrix(self.racks, self.matrix, chunk_size=0))
+
+    def test_mapped_count_matrix(self):
+        """
+        Test that a mapped dictionary's count matrix views its file
+        and gives the same answers.
+        """
+        store_dict_binary(self.dictionary, self.binary_path)
+        mapped = load_dict(self.binary_path, mapped=True)
+        matrix = create_count_matrix(mapped)
+
+        self.assertFalse(matrix['counts'].flags.owndata)
+        self.assertEqual(
+            solve_countdown_matrix('seatbpple', matrix),
+            solve_countdown_matrix('seatbpple', self.matrix)
+        )
+
+        del matrix
+        mapped.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,194 @@
+import unittest
+from LettersGame.Metrics import (
+    Counter,
+    Gauge,
+    HotKeys,
+    MetricsRegistry,
+    format_value,
+    stats_metrics
+)
+
+
+class TestMetrics(unittest.TestCase):
+    """
+    Test suite for the in process metrics and their text format.
+    """
+
+    def setUp(self):
+        """
+        Set up an empty registry.
+        """
+        self.registry = MetricsRegistry()
+
+    def test_counter(self):
+        """
+        Test that a counter totals each series and renders its labels.
+        """
+        requests = self.registry.counter(
+            'requests_total', 'Requests served', ('endpoint',)
+        )
+        requests.inc(endpoint='/answers/get/')
+        requests.inc(2, endpoint='/answers/get/')
+        requests.inc(endpoint='/health/live/')
+
+        self.assertEqual(requests.value(endpoint='/answers/get/'), 3)
+        self.assertEqual(self.registry.render(), (
+            '# HELP requests_total Requests served\n'
+            '# TYPE requests_total counter\n'
+            'requests_total{endpoint="/answers/get/"} 3\n'
+            'requests_total{endpoint="/health/live/"} 1\n'
+        ))
+
+    def test_counter_rejects_decrease(self):
+        """
+        Test that a counter cannot be decreased.
+        """
+        with self.assertRaises(ValueError):
+            Counter('requests_total', 'Requests').inc(-1)
+
+    def test_wrong_labels(self):
+        """
+        Test that a series must be given exactly the metric's labels.
+        """
+        requests = Counter('requests_total', 'Requests', ('endpoint',))
+        with self.assertRaises(ValueError):
+            requests.inc()
+        with self.assertRaises(ValueError):
+            requests.inc(endpoint='/', status='200')
+
+    def test_gauge(self):
+        """
+        Test that a gauge can be set, moved both ways and cleared.
+        """
+        gauge = Gauge('queue_depth', 'Jobs queued')
+        gauge.set(5)
+        gauge.inc(-2)
+        self.assertEqual(gauge.value(), 3)
+        gauge.clear()
+        self.assertEqual(gauge.render(), [
+            '# HELP queue_depth Jobs queued',
+            '# TYPE queue_depth gauge',
+        ])
+
+    def test_histogram(self):
+        """
+        Test that a histogram renders cumulative buckets, a sum and a count,
+        a value on a bound counting in that bound's bucket.
+        """
+        latency = self.registry.histogram(
+            'latency_seconds', 'Latency', ('stage',), buckets=(0.1, 1)
+        )
+        for value in (0.05, 0.1, 5):
+            latency.observe(value, stage='solve')
+
+        self.assertEqual(latency.count(stage='solve'), 3)
+        self.assertEqual(latency.render()[2:], [
+            'latency_seconds_bucket{stage="solve",le="0.1"} 2',
+            'latency_seconds_bucket{stage="solve",le="1.0"} 2',
+            'latency_seconds_bucket{stage="solve",le="+Inf"} 3',
+            'latency_seconds_sum{stage="solve"} 5.15',
+            'latency_seconds_count{stage="solve"} 3',
+        ])
+
+    def test_histogram_time(self):
+        """
+        Test that the body of a with statement is observed once.
+        """
+        latency = self.registry.histogram('latency_seconds', 'Latency')
+        with latency.time():
+            pass
+        self.assertEqual(latency.count(), 1)
+
+    def test_register_returns_existing(self):
+        """
+        Test that a name is registered once, and only as one type.
+        """
+        requests = self.registry.counter('requests_total', 'Requests')
+        self.assertIs(
+            self.registry.counter('requests_total', 'Requests'), requests
+        )
+        with self.assertRaises(ValueError):
+            self.registry.gauge('requests_total', 'Requests')
+
+    def test_label_escaping(self):
+        """
+        Test that quotes, backslashes and newlines in labels are escaped.
+        """
+        requests = Counter('requests_total', 'Requests', ('rack',))
+        requests.inc(rack='a"b\\c\nd')
+        self.assertEqual(
+            requests.render()[2], 'requests_total{rack="a\\"b\\\\c\\nd"} 1'
+        )
+
+    def test_collector(self):
+        """
+        Test that collectors are called on every render,
+        and stats are rendered as gauges and counters.
+        """
+        stats = {'size': 1, 'hits': 2, 'reloading': True, 'path': None}
+        self.registry.add_collector(lambda: stats_metrics(
+            'cache', 'Answers cache', stats, counters=('hits',)
+        ))
+
+        rendered = self.registry.render()
+        self.assertIn('# TYPE cache_size gauge\ncache_size 1\n', rendered)
+        self.assertIn(
+            '# TYPE cache_hits_total counter\ncache_hits_total 2\n', rendered
+        )
+        self.assertIn('cache_reloading 1\n', rendered)
+        self.assertNotIn('cache_path', rendered)
+
+        stats['hits'] = 5
+        self.assertIn('cache_hits_total 5\n', self.registry.render())
+
+    def test_format_value(self):
+        """
+        Test the text format of integers, floats and infinities.
+        """
+        self.assertEqual(format_value(3), '3')
+        self.assertEqual(format_value(0.25), '0.25')
+        self.assertEqual(format_value(float('inf')), '+Inf')
+
+    def test_hot_keys(self):
+        """
+        Test that the most frequent keys are kept in bounded memory,
+        a new key taking the place and count of the least counted.
+        """
+        hot_keys = HotKeys(max_keys=2)
+        for key in 'aabac':
+            hot_keys.add(key)
+
+        self.assertEqual(len(hot_keys), 2)
+        self.assertEqual(hot_keys.top(2), [('a', 3), ('c', 2)])
+        self.assertEqual(hot_keys.top(1), [('a', 3)])
+
+    def test_hot_keys_heavy_hitters(self):
+        """
+        Test that over a long stream of keys the frequent keys are held,
+        no count is below the key's true count, and the heap of counts
+        holds one entry per key.
+        """
+        hot_keys = HotKeys(max_keys=10)
+        stream = [
+            f'rare{i}' if i % 3 else f'hot{i % 2}' for i in range(3000)
+        ]
+        for key in stream:
+            hot_keys.add(key)
+
+        top = dict(hot_keys.top(2))
+        self.assertEqual(set(top), {'hot0', 'hot1'})
+        for key, count in top.items():
+            self.assertGreaterEqual(count, stream.count(key))
+        self.assertEqual(len(hot_keys), 10)
+        self.assertEqual(len(hot_keys._heap), 10)
+
+    def test_hot_keys_invalid_size(self):
+        """
+        Test that HotKeys must hold at least one key.
+        """
+        with self.assertRaises(ValueError):
+            HotKeys(max_keys=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
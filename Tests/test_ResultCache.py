@@ -0,0 +1,111 @@
+import unittest
+from LettersGame.ResultCache import ResultCache, canonical_rack
+
+
+class TestResultCache(unittest.TestCase):
+    """
+    Test suite for the solver result cache.
+    """
+
+    def setUp(self):
+        """
+        Set up a small cache with a clock the tests can move forward.
+        """
+        self.now = 0.0
+        self.cache = ResultCache(
+            max_size=2, ttl=10, clock=lambda: self.now
+        )
+
+    def test_canonical_rack(self):
+        """
+        Test that anagrams of a rack, in any case, share a canonical form.
+        """
+        self.assertEqual(canonical_rack('STARELINE'), 'aeeilnrst')
+        self.assertEqual(
+            canonical_rack('STARELINE'), canonical_rack('elinestar')
+        )
+
+    def test_hit_and_miss(self):
+        """
+        Test that cached values are returned and the lookups counted.
+        """
+        self.assertIsNone(self.cache.get('aeeilnrst'))
+        self.cache.put('aeeilnrst', ['stare'])
+        self.assertEqual(self.cache.get('aeeilnrst'), ['stare'])
+
+        stats = self.cache.stats()
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['misses'], 1)
+        self.assertEqual(stats['size'], 1)
+
+    def test_least_recently_used_evicted(self):
+        """
+        Test that the least recently used entry is evicted when full.
+        """
+        self.cache.put('a', 1)
+        self.cache.put('b', 2)
+        self.cache.get('a')
+        self.cache.put('c', 3)
+
+        self.assertEqual(len(self.cache), 2)
+        self.assertIsNone(self.cache.get('b'))
+        self.assertEqual(self.cache.get('a'), 1)
+        self.assertEqual(self.cache.get('c'), 3)
+        self.assertEqual(self.cache.stats()['evictions'], 1)
+
+    def test_ttl(self):
+        """
+        Test that entries are not served once their time to live is over.
+        """
+        self.cache.put('a', 1)
+        self.now = 9.5
+        self.assertEqual(self.cache.get('a'), 1)
+        self.now = 10
+        self.assertIsNone(self.cache.get('a'))
+        self.assertEqual(len(self.cache), 0)
+
+    def test_get_or_compute(self):
+        """
+        Test that a value is only computed on a miss.
+        """
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return ['at']
+
+        self.assertEqual(self.cache.get_or_compute('at', compute), ['at'])
+        self.assertEqual(self.cache.get_or_compute('at', compute), ['at'])
+        self.assertEqual(len(calls), 1)
+
+    def test_invalidate(self):
+        """
+        Test that invalidating empties the cache but keeps the counters.
+        """
+        self.cache.put('a', 1)
+        self.cache.get('a')
+        self.cache.invalidate()
+
+        self.assertIsNone(self.cache.get('a'))
+        self.assertEqual(self.cache.stats()['hits'], 1)
+
+    def test_disabled(self):
+        """
+        Test that a cache of size 0 never holds anything.
+        """
+        cache = ResultCache(max_size=0)
+        cache.put('a', 1)
+        self.assertIsNone(cache.get('a'))
+
+    def test_invalid_arguments(self):
+        """
+        Test that a negative size or a non positive ttl raise ValueError.
+        """
+        with self.assertRaises(ValueError):
+            ResultCache(max_size=-1)
+        with self.assertRaises(ValueError):
+            ResultCache(ttl=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,202 @@
+import unittest
+import asyncio
+import os
+import threading
+from LettersGame.BinaryDict import store_dict_binary, definitions_path
+from LettersGame.CreateDict import initialise_dict, add_to_dict
+from LettersGame.DictionaryStore import DictionaryStore
+from LettersGame.SolverExecutor import ExecutorBusy, SolverExecutor
+
+
+class TestSolverExecutor(unittest.TestCase):
+    """
+    Test suite for the executor running solver work off the event loop.
+    """
+
+    def setUp(self):
+        """
+        Store and load a sample dictionary.
+        """
+        self.binary_path = 'test_executor_dictionary.bin'
+        dictionary = initialise_dict()
+        add_to_dict(dictionary, 'apple', 'a fruit')
+        add_to_dict(dictionary, 'tea', 'a drink')
+        store_dict_binary(dictionary, self.binary_path)
+        self.loaded = DictionaryStore().load(self.binary_path)
+
+    def tearDown(self):
+        """
+        Removes the dictionary files.
+        """
+        for path in (self.binary_path, definitions_path(self.binary_path)):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def solve(self, executor: SolverExecutor) -> list:
+        """
+        Solve two racks on the executor.
+        """
+        return asyncio.run(executor.solve(
+            self.loaded, ['appletaxx', 'teaxxxxxx']
+        ))
+
+    def test_solve_on_threads(self):
+        """
+        Test that racks are solved as by the solver without processes.
+        """
+        executor = SolverExecutor(threads=2)
+        try:
+            self.assertEqual(self.solve(executor), [
+                self.loaded.solver('appletaxx'),
+                self.loaded.solver('teaxxxxxx')
+            ])
+            self.assertEqual(executor.stats()['completed'], 1)
+            self.assertEqual(executor.stats()['queue_depth'], 0)
+        finally:
+            executor.shutdown()
+
+    def test_solve_on_processes(self):
+        """
+        Test that racks are solved by the worker processes
+        as by the solver.
+        """
+        executor = SolverExecutor(threads=1, processes=1)
+        executor.use_dictionary(self.loaded)
+        try:
+            results = self.solve(executor)
+            self.assertEqual(
+                [[r['word'] for r in rack] for rack in results],
+                [
+                    [r['word'] for r in self.loaded.solver('appletaxx')],
+                    [r['word'] for r in self.loaded.solver('teaxxxxxx')]
+                ]
+            )
+        finally:
+            executor.shutdown()
+
+    def test_scan_counts_on_processes(self):
+        """
+        Test that the records scanned by the worker processes are counted.
+        """
+        executor = SolverExecutor(threads=1, processes=1, engine='bucket')
+        executor.use_dictionary(self.loaded)
+        scan_counts = {}
+        try:
+            asyncio.run(executor.solve(
+                self.loaded, ['appletaxx', 'teaxxxxxx'],
+                scan_counts=scan_counts
+            ))
+        finally:
+            executor.shutdown()
+        self.assertGreater(scan_counts['visited'], 0)
+        self.assertEqual(scan_counts['matched'], 3)
+
+    def test_use_dictionary_from_another_thread(self):
+        """
+        Test that swapping the worker processes on another thread,
+        as the reload thread does, while racks are being solved
+        never sends a solve to a pool which has been shut down.
+        """
+        executor = SolverExecutor(threads=1, processes=1)
+        executor.use_dictionary(self.loaded)
+        expected = [r['word'] for r in self.loaded.solver('appletaxx')]
+
+        def swap() -> None:
+            for _ in range(5):
+                executor.use_dictionary(self.loaded)
+
+        async def run() -> list:
+            swapping = threading.Thread(target=swap)
+            swapping.start()
+            results = []
+            while swapping.is_alive() or not results:
+                results.extend(await executor.solve(
+                    self.loaded, ['appletaxx']
+                ))
+            swapping.join()
+            return results
+
+        try:
+            results = asyncio.run(run())
+        finally:
+            executor.shutdown()
+        for result in results:
+            self.assertEqual([r['word'] for r in result], expected)
+        self.assertEqual(executor.stats()['failed'], 0)
+
+    def test_backpressure(self):
+        """
+        Test that jobs past max_queue are refused with the queue depth.
+        """
+        executor = SolverExecutor(threads=1, max_queue=1)
+        release = threading.Event()
+
+        async def run() -> None:
+            blocked = asyncio.ensure_future(executor.run(release.wait))
+            await asyncio.sleep(0)
+            with self.assertRaises(ExecutorBusy) as context:
+                await executor.run(len, 'abc')
+            self.assertEqual(context.exception.queue_depth, 1)
+            release.set()
+            await blocked
+            self.assertEqual(await executor.run(len, 'abc'), 3)
+
+        try:
+            asyncio.run(run())
+            self.assertEqual(executor.stats()['rejected'], 1)
+        finally:
+            executor.shutdown()
+
+    def test_iterate(self):
+        """
+        Test that an iterator is run on the threads as one job,
+        holding its place in the queue until it is exhausted.
+        """
+        executor = SolverExecutor(threads=1, max_queue=1)
+
+        async def run() -> list:
+            items = []
+            async for item in executor.iterate(iter('abc')):
+                items.append(item)
+                self.assertEqual(executor.queue_depth, 1)
+                with self.assertRaises(ExecutorBusy):
+                    await executor.run(len, 'abc')
+            return items
+
+        try:
+            self.assertEqual(asyncio.run(run()), ['a', 'b', 'c'])
+            stats = executor.stats()
+            self.assertEqual(stats['queue_depth'], 0)
+            self.assertEqual(stats['completed'], 1)
+            self.assertEqual(stats['rejected'], 3)
+        finally:
+            executor.shutdown()
+
+    def test_failed_jobs(self):
+        """
+        Test that jobs which raise are counted as failed, not completed,
+        and free their place in the queue.
+        """
+        executor = SolverExecutor(threads=1, max_queue=1)
+        try:
+            with self.assertRaises(ZeroDivisionError):
+                asyncio.run(executor.run(divmod, 1, 0))
+            self.assertEqual(asyncio.run(executor.run(len, 'abc')), 3)
+
+            stats = executor.stats()
+            self.assertEqual(stats['failed'], 1)
+            self.assertEqual(stats['completed'], 1)
+            self.assertEqual(stats['queue_depth'], 0)
+        finally:
+            executor.shutdown()
+
+    def test_invalid_sizes(self):
+        """
+        Test that invalid pool sizes raise ValueError.
+        """
+        with self.assertRaises(ValueError):
+            SolverExecutor(threads=0)
+        with self.assertRaises(ValueError):
+            SolverExecutor(max_queue=0)
+        with self.assertRaises(ValueError):
+            SolverExecutor(processes=-1)
@@ -0,0 +1,84 @@
+import unittest
+import os
+import json
+from unittest.mock import patch
+from LettersGame.CreateDict import create_dict, load_dict
+from LettersGame.StreamDict import compile_dict
+
+
+class TestStreamDict(unittest.TestCase):
+    """
+    Test suite for the streaming dictionary compiler.
+    """
+
+    def setUp(self):
+        """
+        Set up a sample dataset and the paths used.
+        """
+        self.csv_path = 'test_stream_words.csv'
+        self.dict_path = 'test_stream_dictionary.json'
+        self.expected_path = 'test_stream_expected.json'
+        with open(self.csv_path, 'w') as f:
+            f.write('Word,Count,Type,Definition\n')
+            f.write('cat,3,noun,a feline animal\n')
+            f.write('Apple,5,noun,a fruit\n')
+            f.write('banana,6,noun,a yellow fruit\n')
+            f.write("don't,5,verb,contraction of do not\n")
+            f.write('a,1,noun,a letter\n')
+            f.write('apple,5,noun,a tree\n')
+            f.write('apple,5,noun,a fruit\n')
+            f.write('ant,3,noun,an insect\n')
+
+    def tearDown(self):
+        """
+        Removes the files created by the tests.
+        """
+        for path in (self.csv_path, self.dict_path, self.expected_path):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def assert_matches_create_dict(self):
+        """
+        Assert the compiled dictionary holds the records create_dict makes,
+        in alphabetical order within each bucket.
+        """
+        expected = create_dict(self.csv_path, self.expected_path)
+        expected = json.loads(json.dumps(expected))
+        for first_letter in expected:
+            for bucket in expected[first_letter].values():
+                bucket.sort(key=lambda record: record['word'])
+
+        self.assertEqual(load_dict(self.dict_path), expected)
+
+    def test_compile_dict(self):
+        """
+        Test that the compiled dictionary matches create_dict,
+        with the definitions of a word merged in the order of the dataset.
+        """
+        self.assertEqual(compile_dict(self.csv_path, self.dict_path), 4)
+        self.assert_matches_create_dict()
+
+        dictionary = load_dict(self.dict_path)
+        self.assertEqual(
+            dictionary['a']['p'][0]['definitions'], ['a fruit', 'a tree']
+        )
+
+    def test_compile_dict_many_runs(self):
+        """
+        Test that runs are merged in several passes when there are
+        more than MERGE_FAN_IN of them.
+        """
+        with patch('LettersGame.StreamDict.MERGE_FAN_IN', 2):
+            self.assertEqual(
+                compile_dict(self.csv_path, self.dict_path, run_size=1), 4
+            )
+        self.assert_matches_create_dict()
+
+    def test_compile_dict_invalid(self):
+        """
+        Test that a missing dataset or a binary path returns None
+        and leaves no file behind.
+        """
+        self.assertIsNone(compile_dict('missing.csv', self.dict_path))
+        self.assertFalse(os.path.exists(self.dict_path))
+        self.assertIsNone(compile_dict(self.csv_path, 'dictionary.bin'))
@@ -0,0 +1,112 @@
+import unittest
+from LettersGame.TrieSolver import (
+    WORD_KEY,
+    create_trie,
+    solve_countdown_trie,
+    iter_countdown_trie,
+    count_nodes
+)
+from LettersGame.CreateDict import initialise_dict, add_to_dict
+from LettersGame.CountdownSolver import solve_countdown
+
+
+class TestTrieSolver(unittest.TestCase):
+    """
+    Test suite for the TrieSolver module functions.
+    """
+
+    def setUp(self):
+        """
+        Set up a sample dictionary of words sharing prefixes and suffixes.
+        """
+        self.dictionary = initialise_dict()
+        for word, definition in (
+            ('at', 'in, on, or near'),
+            ('ate', 'did eat'),
+            ('tea', 'a drink'),
+            ('eat', 'to consume'),
+            ('seat', 'a chair'),
+            ('beat', 'to strike'),
+            ('apple', 'a fruit'),
+        ):
+            add_to_dict(self.dictionary, word, definition)
+
+    def test_create_trie(self):
+        """
+        Test that every word can be followed from the root
+        and ends on a node marked as a word.
+        """
+        trie = create_trie(self.dictionary, minimise=False)
+
+        node = trie['root']
+        for letter in 'seat':
+            node = node[letter]
+        self.assertTrue(node[WORD_KEY])
+        self.assertNotIn(WORD_KEY, trie['root']['s']['e'])
+        self.assertEqual(
+            trie['records']['seat'][0]['definitions'], ['a chair']
+        )
+
+    def test_minimise_trie(self):
+        """
+        Test that minimising shares common suffixes, giving fewer nodes
+        and the same answers.
+        """
+        trie = create_trie(self.dictionary, minimise=False)
+        dawg = create_trie(self.dictionary)
+
+        self.assertLess(count_nodes(dawg), count_nodes(trie))
+        self.assertIs(dawg['root']['s']['e'], dawg['root']['b']['e'])
+        self.assertEqual(
+            solve_countdown_trie('seatbpple', dawg),
+            solve_countdown_trie('seatbpple', trie)
+        )
+
+    def test_solve_countdown_trie(self):
+        """
+        Test that the trie finds the same words as the bucket scan.
+        """
+        trie = create_trie(self.dictionary)
+        for letters in ('seatbpple', 'teaxxxxxx', 'zzzzzzzzz', 'applet'):
+            self.assertCountEqual(
+                solve_countdown_trie(letters, trie),
+                solve_countdown(letters, self.dictionary)
+            )
+
+    def test_solve_countdown_trie_uses_up_letters(self):
+        """
+        Test that a letter is not used more times than it is in the rack.
+        """
+        trie = create_trie(self.dictionary)
+        results = solve_countdown_trie('aplexxxxx', trie)
+        words = [result['word'] for result in results]
+        self.assertNotIn('apple', words)
+
+    def test_iter_countdown_trie(self):
+        """
+        Test that the walk yields the words in alphabetical order.
+        """
+        trie = create_trie(self.dictionary)
+        words = [
+            result['word']
+            for result in iter_countdown_trie('seatbpple', trie)
+        ]
+        self.assertEqual(words, sorted(words))
+        self.assertCountEqual(
+            words,
+            [r['word'] for r in solve_countdown_trie('seatbpple', trie)]
+        )
+
+    def test_solve_countdown_trie_without_definitions(self):
+        """
+        Test that the definitions are left out when asked to.
+        """
+        trie = create_trie(self.dictionary)
+        self.assertEqual(
+            solve_countdown_trie('atxxxxxxx', trie, False),
+            [{'word': 'at', 'length': 2}]
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
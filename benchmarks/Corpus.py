@@ -0,0 +1,87 @@
+import csv
+import random
+import string
+from typing import List
+
+from CLI.Main import CONSONANTS, VOWLS
+
+"""
+The seeded inputs of the benchmarks, the same seed giving the same inputs
+on every machine, so runs can be compared.
+"""
+
+RACK_LENGTH = 9
+
+
+def draw_racks(count: int, seed: int) -> List[str]:
+    """
+    Draw racks as CLI.Main.draw_letters does, each letter a vowel or
+    a consonant, chosen at random here rather than by the player, then
+    drawn at random from that pool.
+
+    Args:
+        count (int): The number of racks to draw.
+        seed (int): The seed of the draw.
+
+    Returns:
+        List[str]: The lowercase racks.
+    """
+    generator = random.Random(seed)
+    return [
+        "".join(
+            generator.choice(generator.choice((VOWLS, CONSONANTS)))
+            for _ in range(RACK_LENGTH)
+        )
+        for _ in range(count)
+    ]
+
+
+def draw_non_words(count: int, seed: int) -> List[str]:
+    """
+    Draw random strings of 3 to 9 letters, nearly all of which
+    are not words, for checking misses.
+
+    Args:
+        count (int): The number of strings to draw.
+        seed (int): The seed of the draw.
+
+    Returns:
+        List[str]: The lowercase strings.
+    """
+    generator = random.Random(seed)
+    return [
+        "".join(
+            generator.choices(
+                string.ascii_lowercase, k=generator.randint(3, RACK_LENGTH)
+            )
+        )
+        for _ in range(count)
+    ]
+
+
+def write_word_list(file_path: str, word_count: int, seed: int) -> None:
+    """
+    Write a synthetic dataset CSV in the columns of OPTED, for when
+    OPTED-Dictionary.csv is not at hand. The words are pronounceable
+    strings of alternating consonants and vowels, so racks drawn as
+    draw_racks does have answers.
+
+    Args:
+        file_path (str): The path to write the CSV to.
+        word_count (int): The number of rows.
+        seed (int): The seed of the words.
+    """
+    generator = random.Random(seed)
+    with open(file_path, 'w', newline='') as file:
+        writer = csv.writer(file)
+        writer.writerow(["Word", "Count", "POS", "Definition"])
+        for i in range(word_count):
+            length = generator.randint(2, RACK_LENGTH)
+            start = generator.randint(0, 1)
+            word = "".join(
+                generator.choice(
+                    CONSONANTS if (start + j) % 2 == 0 else VOWLS
+                )
+                for j in range(length)
+            )
+            writer.writerow([word, len(word), "n.", f"definition {i}"])
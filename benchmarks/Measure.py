@@ -0,0 +1,144 @@
+import math
+import sys
+import time
+from typing import Callable, Iterable, List, Tuple, Union
+
+try:
+    import resource
+except ImportError:
+    # not available on Windows, peak RSS is then left out
+    resource = None
+
+"""
+Timing and summarising of benchmark samples.
+
+A scenario returns the latency of each sample in nanoseconds and the
+wall time of the whole scenario, summarised as:
+
+{
+    "samples": the number of samples,
+    "p50_ms", "p95_ms", "p99_ms": the latency percentiles,
+    "mean_ms": the mean latency,
+    "throughput_per_s": samples per second of wall time,
+    "peak_rss_kb": the peak resident set size of the process
+                   that ran the scenario, None if unknown
+}
+"""
+
+NANOSECONDS_PER_MILLISECOND = 1e6
+NANOSECONDS_PER_SECOND = 1e9
+
+
+def time_calls(
+    function: Callable,
+    inputs: Iterable
+) -> Tuple[List[int], int]:
+    """
+    Time a call of function on each input.
+
+    Args:
+        function (Callable): Called with each input.
+        inputs (Iterable): The inputs.
+
+    Returns:
+        Tuple[List[int], int]: The latency of each call and the wall time
+                               of all of them, in nanoseconds.
+    """
+    latencies = []
+    started = time.perf_counter_ns()
+    for value in inputs:
+        call_started = time.perf_counter_ns()
+        function(value)
+        latencies.append(time.perf_counter_ns() - call_started)
+    return latencies, time.perf_counter_ns() - started
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """
+    Get a percentile by the nearest rank method.
+
+    Args:
+        values (List[float]): The values, in any order.
+        fraction (float): The percentile as a fraction, 0.95 for p95.
+
+    Raises:
+        ValueError: If there are no values.
+
+    Returns:
+        float: The smallest value at least fraction of the values are at.
+    """
+    if not values:
+        raise ValueError("no values")
+    ordered = sorted(values)
+    rank = max(1, math.ceil(fraction * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarise(
+    latencies: List[int],
+    elapsed: int,
+    peak_rss: Union[int, None] = None
+) -> dict:
+    """
+    Summarise the samples of a scenario.
+
+    Args:
+        latencies (List[int]): The latency of each sample, in nanoseconds.
+        elapsed (int): The wall time of the scenario, in nanoseconds.
+        peak_rss (int | None): The peak resident set size, in KB.
+
+    Returns:
+        dict: The summary, see the module docstring.
+    """
+    def milliseconds(value: float) -> float:
+        return round(value / NANOSECONDS_PER_MILLISECOND, 4)
+
+    return {
+        "samples": len(latencies),
+        "p50_ms": milliseconds(percentile(latencies, 0.50)),
+        "p95_ms": milliseconds(percentile(latencies, 0.95)),
+        "p99_ms": milliseconds(percentile(latencies, 0.99)),
+        "mean_ms": milliseconds(sum(latencies) / len(latencies)),
+        "throughput_per_s": round(
+            len(latencies) * NANOSECONDS_PER_SECOND / max(elapsed, 1), 2
+        ),
+        "peak_rss_kb": peak_rss,
+    }
+
+
+def peak_rss_kb() -> Union[int, None]:
+    """
+    Returns:
+        int | None: The peak resident set size of this process in KB,
+                    None where it cannot be read.
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # bytes on macOS, KB elsewhere
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> List[str]:
+    """
+    Find the scenarios whose p95 latency grew by more than threshold
+    from a baseline run.
+
+    Args:
+        baseline (dict): The report of the baseline run.
+        current (dict): The report of the run to check.
+        threshold (float): The growth allowed, 0.1 for 10%.
+
+    Returns:
+        List[str]: A description of each regression.
+    """
+    regressions = []
+    for name, result in current["results"].items():
+        before = baseline["results"].get(name)
+        if not before or "p95_ms" not in before or "p95_ms" not in result:
+            continue
+        if result["p95_ms"] > before["p95_ms"] * (1 + threshold):
+            regressions.append(
+                f"{name}: p95 {before['p95_ms']}ms -> {result['p95_ms']}ms"
+            )
+    return regressions
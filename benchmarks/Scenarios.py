@@ -0,0 +1,233 @@
+import os
+import random
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from typing import List, Tuple
+
+from LettersGame.CountdownSolver import check_answer
+from LettersGame.CreateDict import create_dict, create_word_index, load_dict
+from LettersGame.Engines import ENGINES, create_engine
+
+from benchmarks.Corpus import draw_non_words, draw_racks
+from benchmarks.Measure import peak_rss_kb, summarise, time_calls
+
+"""
+The benchmark scenarios, each a function of the run's config returning
+the latency of each sample and the wall time of the scenario in nanoseconds.
+
+The config is a dict:
+
+{
+    "csv_path": the dataset CSV,
+    "dict_path": the JSON dictionary made from it,
+    "binary_path": the binary dictionary made from it,
+    "seed": the seed of the racks and guesses,
+    "racks": the number of racks solved,
+    "checks": the number of guesses checked,
+    "hit_rate": the fraction of guesses which are answers,
+    "repeats": the number of times the dictionary is built or loaded
+}
+
+Each scenario runs in a fresh process, so it starts from the same state
+and the peak RSS reported is its own.
+"""
+
+
+def create_dict_scenario(config: dict) -> Tuple[List[int], int]:
+    """
+    Build the JSON dictionary from the dataset CSV.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        output_path = os.path.join(directory, "dict.json")
+        return time_calls(
+            lambda _: create_dict(config["csv_path"], output_path),
+            range(config["repeats"])
+        )
+
+
+def load_dict_cold_scenario(config: dict) -> Tuple[List[int], int]:
+    """
+    The first load of the JSON dictionary in a process,
+    one sample per process, see run_scenario.
+    """
+    return time_calls(lambda _: load_dict(config["dict_path"]), range(1))
+
+
+def load_dict_warm_scenario(config: dict) -> Tuple[List[int], int]:
+    """
+    Loads of the JSON dictionary after a first load in the same process.
+    """
+    load_dict(config["dict_path"])
+    return time_calls(
+        lambda _: load_dict(config["dict_path"]), range(config["repeats"])
+    )
+
+
+def solve_scenario(engine: str):
+    """
+    Solve the rack corpus with an engine over the JSON dictionary,
+    the bucket engine being solve_countdown.
+    """
+    def scenario(config: dict) -> Tuple[List[int], int]:
+        solver = create_engine(load_dict(config["dict_path"]), engine)
+        return time_calls(
+            solver, draw_racks(config["racks"], config["seed"])
+        )
+
+    return scenario
+
+
+def solve_counters_scenario(config: dict) -> Tuple[List[int], int]:
+    """
+    Solve the rack corpus with the bucket engine over records without
+    their letter masks and packed counts, as stored before them, so every
+    record is checked by its letter counter, against solve_bucket.
+    """
+    dictionary = load_dict(config["dict_path"])
+    for first_letter in dictionary:
+        for second_letter in dictionary[first_letter]:
+            for record in dictionary[first_letter][second_letter]:
+                del record["letter_mask"], record["packed_counts"]
+    solver = create_engine(dictionary, "bucket")
+    return time_calls(solver, draw_racks(config["racks"], config["seed"]))
+
+
+def check_guesses(config: dict, dictionary: dict) -> List[Tuple[str, str]]:
+    """
+    Draw the (word, rack) guesses checked, hit_rate of them
+    answers to their rack and the rest random strings.
+    """
+    solver = create_engine(dictionary)
+    generator = random.Random(config["seed"])
+    racks = draw_racks(config["checks"], config["seed"])
+    non_words = draw_non_words(config["checks"], config["seed"])
+
+    guesses = []
+    for rack, non_word in zip(racks, non_words):
+        answers = [
+            result["word"]
+            for result in solver(rack, include_definitions=False)
+            if result["length"] >= 3
+        ]
+        if answers and generator.random() < config["hit_rate"]:
+            guesses.append((generator.choice(answers), rack))
+        else:
+            guesses.append((non_word, rack))
+    return guesses
+
+
+def check_answer_scenario(use_word_index: bool):
+    """
+    Check the guesses against the JSON dictionary,
+    scanning buckets or looking words up in the word index.
+    """
+    def scenario(config: dict) -> Tuple[List[int], int]:
+        dictionary = load_dict(config["dict_path"])
+        word_index = create_word_index(dictionary) if use_word_index else None
+        return time_calls(
+            lambda guess: check_answer(
+                guess[0], guess[1], dictionary, word_index=word_index
+            ),
+            check_guesses(config, dictionary)
+        )
+
+    return scenario
+
+
+def api_scenario(endpoint: str):
+    """
+    Requests to the API through FastAPI's TestClient, the server
+    answering from the memory mapped binary dictionary.
+
+    Raises:
+        ImportError: If fastapi or httpx are not installed.
+    """
+    def scenario(config: dict) -> Tuple[List[int], int]:
+        os.environ["LETTERS_DICT_PATH"] = config["binary_path"]
+        from fastapi.testclient import TestClient
+
+        from API.main import app
+
+        with TestClient(app) as client:
+            if endpoint == "/answers/check/":
+                requests = [
+                    {"letters": rack, "word": word}
+                    for word, rack in check_guesses(
+                        config, load_dict(config["dict_path"])
+                    )
+                ]
+            else:
+                requests = [
+                    {"letters": rack}
+                    for rack in draw_racks(config["racks"], config["seed"])
+                ]
+            return time_calls(
+                lambda params: client.get(
+                    endpoint, params=params
+                ).raise_for_status(),
+                requests
+            )
+
+    return scenario
+
+
+SCENARIOS = {
+    "create_dict": create_dict_scenario,
+    "load_dict_cold": load_dict_cold_scenario,
+    "load_dict_warm": load_dict_warm_scenario,
+    **{f"solve_{engine}": solve_scenario(engine) for engine in ENGINES},
+    "solve_bucket_counters": solve_counters_scenario,
+    "check_answer_scan": check_answer_scenario(False),
+    "check_answer_index": check_answer_scenario(True),
+    "api_get_answers": api_scenario("/answers/get/"),
+    "api_check_answer": api_scenario("/answers/check/"),
+}
+
+# scenarios measuring the first call in a process,
+# run in a fresh process for each sample
+FRESH_PROCESS_SCENARIOS = ("load_dict_cold",)
+
+
+def run_scenario(name: str, config: dict) -> dict:
+    """
+    Run a scenario in fresh processes and summarise it.
+
+    Args:
+        name (str): The name of the scenario, one of SCENARIOS.
+        config (dict): The config of the run.
+
+    Returns:
+        dict: The summary, see benchmarks.Measure, or
+              {"skipped": the reason} if a dependency is not installed.
+    """
+    runs = config["repeats"] if name in FRESH_PROCESS_SCENARIOS else 1
+    latencies, elapsed, peak_rss = [], 0, None
+    for _ in range(runs):
+        with ProcessPoolExecutor(
+            max_workers=1, mp_context=get_context("spawn")
+        ) as executor:
+            try:
+                run_latencies, run_elapsed, run_peak_rss = executor.submit(
+                    _run_in_process, name, config
+                ).result()
+            except ImportError as e:
+                return {"skipped": str(e)}
+        latencies += run_latencies
+        elapsed += run_elapsed
+        if run_peak_rss is not None:
+            peak_rss = max(peak_rss or 0, run_peak_rss)
+
+    return summarise(latencies, elapsed, peak_rss)
+
+
+def _run_in_process(name: str, config: dict) -> Tuple[List[int], int, int]:
+    """
+    Run a scenario in a worker process.
+
+    Returns:
+        Tuple[List[int], int, int]: The latencies and wall time of the
+                                    scenario and the peak RSS of the process.
+    """
+    latencies, elapsed = SCENARIOS[name](config)
+    return latencies, elapsed, peak_rss_kb()
@@ -0,0 +1,5 @@
+__all__ = [
+    "Corpus",
+    "Measure",
+    "Scenarios"
+]
@@ -0,0 +1,140 @@
+import argparse
+import fnmatch
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from typing import List
+
+from LettersGame.BinaryDict import store_dict_binary
+from LettersGame.CreateDict import create_dict
+
+from benchmarks.Corpus import write_word_list
+from benchmarks.Measure import compare
+from benchmarks.Scenarios import SCENARIOS, run_scenario
+
+"""
+Runs the benchmark scenarios and writes their results as JSON:
+
+    python -m benchmarks [--csv OPTED-Dictionary.csv] [--output run.json]
+                         [--compare baseline.json] [--scenarios 'solve_*']
+
+Without --csv a synthetic word list is generated from the seed. With
+--compare the exit status is 1 if any scenario's p95 latency grew by more
+than --threshold from the baseline.
+"""
+
+
+def parse_args(args: List[str]) -> argparse.Namespace:
+    """
+    Parse the command-line options.
+
+    Args:
+        args (List[str]): The command-line arguments after the program name.
+
+    Returns:
+        argparse.Namespace: The options.
+    """
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument(
+        "--csv", help="the dataset CSV, a synthetic one if left out"
+    )
+    parser.add_argument(
+        "--words", type=int, default=50000,
+        help="the number of words of the synthetic dataset"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--racks", type=int, default=500)
+    parser.add_argument("--checks", type=int, default=5000)
+    parser.add_argument("--hit-rate", type=float, default=0.2)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument(
+        "--scenarios", default="*",
+        help="a glob of the scenarios to run, comma separated"
+    )
+    parser.add_argument("--output", help="the file to write the results to")
+    parser.add_argument("--compare", help="a baseline results file")
+    parser.add_argument("--threshold", type=float, default=0.1)
+    return parser.parse_args(args)
+
+
+def main(args: List[str]) -> int:
+    """
+    Run the benchmarks.
+
+    Args:
+        args (List[str]): The command-line arguments after the program name.
+
+    Returns:
+        int: The exit status, 1 if a regression was found.
+    """
+    options = parse_args(args)
+    patterns = options.scenarios.split(",")
+    names = [
+        name for name in SCENARIOS
+        if any(fnmatch.fnmatch(name, pattern) for pattern in patterns)
+    ]
+
+    with tempfile.TemporaryDirectory() as directory:
+        csv_path = options.csv
+        if csv_path is None:
+            csv_path = os.path.join(directory, "words.csv")
+            write_word_list(csv_path, options.words, options.seed)
+        dict_path = os.path.join(directory, "dict.json")
+        binary_path = os.path.join(directory, "dict.bin")
+        dictionary = create_dict(csv_path, dict_path)
+        if dictionary is None:
+            return 1
+        store_dict_binary(dictionary, binary_path)
+        del dictionary
+
+        config = {
+            "csv_path": csv_path,
+            "dict_path": dict_path,
+            "binary_path": binary_path,
+            "seed": options.seed,
+            "racks": options.racks,
+            "checks": options.checks,
+            "hit_rate": options.hit_rate,
+            "repeats": options.repeats,
+        }
+        results = {}
+        for name in names:
+            print(f"running {name}", file=sys.stderr)
+            results[name] = run_scenario(name, config)
+
+    report = {
+        "meta": {
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "csv": options.csv or f"synthetic, {options.words} words",
+            "seed": options.seed,
+            "racks": options.racks,
+            "checks": options.checks,
+            "hit_rate": options.hit_rate,
+            "repeats": options.repeats,
+        },
+        "results": results,
+    }
+    output = json.dumps(report, indent=2)
+    if options.output:
+        with open(options.output, 'w') as file:
+            file.write(output + "\n")
+    print(output)
+
+    if options.compare:
+        with open(options.compare, 'r') as file:
+            regressions = compare(json.load(file), report, options.threshold)
+        for regression in regressions:
+            print(f"regression: {regression}", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -2,6 +2,23 @@ import unittest
 from Tests.test_CreateDict import TestCreateDict
 from Tests.test_CountdownSolver import TestCountdownSolver
 from Tests.CLI.test_Main import TestMain
+from Tests.test_BinaryDict import TestBinaryDict
+from Tests.test_MappedDict import TestMappedDict
+from Tests.test_TrieSolver import TestTrieSolver
+from Tests.test_Engines import TestEngines
+from Tests.test_ResultCache import TestResultCache
+from Tests.test_AnswerTable import TestAnswerTable
+from Tests.test_BatchSolver import TestBatchSolver
+from Tests.test_MatrixSolver import TestMatrixSolver
+from Tests.test_IncrementalDict import TestIncrementalDict
+from Tests.test_StreamDict import TestStreamDict
+from Tests.test_DictionaryStore import TestDictionaryStore
+from Tests.test_SolverExecutor import TestSolverExecutor
+from Tests.test_GameSessions import TestGameSessions
+from Tests.test_BloomFilter import TestBloomFilter
+from Tests.test_Metrics import TestMetrics
+from Tests.API.test_main import TestAPI
+from Tests.benchmarks.test_Measure import TestMeasure
 
 
 def suite():
@@ -10,6 +27,23 @@ def suite():
     suite.addTest(loader.loadTestsFromTestCase(TestCreateDict))
     suite.addTest(loader.loadTestsFromTestCase(TestMain))
     suite.addTest(loader.loadTestsFromTestCase(TestCountdownSolver))
+    suite.addTest(loader.loadTestsFromTestCase(TestBinaryDict))
+    suite.addTest(loader.loadTestsFromTestCase(TestMappedDict))
+    suite.addTest(loader.loadTestsFromTestCase(TestTrieSolver))
+    suite.addTest(loader.loadTestsFromTestCase(TestEngines))
+    suite.addTest(loader.loadTestsFromTestCase(TestResultCache))
+    suite.addTest(loader.loadTestsFromTestCase(TestAnswerTable))
+    suite.addTest(loader.loadTestsFromTestCase(TestBatchSolver))
+    suite.addTest(loader.loadTestsFromTestCase(TestMatrixSolver))
+    suite.addTest(loader.loadTestsFromTestCase(TestIncrementalDict))
+    suite.addTest(loader.loadTestsFromTestCase(TestStreamDict))
+    suite.addTest(loader.loadTestsFromTestCase(TestDictionaryStore))
+    suite.addTest(loader.loadTestsFromTestCase(TestSolverExecutor))
+    suite.addTest(loader.loadTestsFromTestCase(TestGameSessions))
+    suite.addTest(loader.loadTestsFromTestCase(TestBloomFilter))
+    suite.addTest(loader.loadTestsFromTestCase(TestMetrics))
+    suite.addTest(loader.loadTestsFromTestCase(TestAPI))
+    suite.addTest(loader.loadTestsFromTestCase(TestMeasure))
     return suite
 
 